@@ -1,29 +1,53 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-from app.core.database import get_db
+from app.core.cache import analytics_cache
+from app.core.database import get_async_db
 from app.services.transaction_service import TransactionService
 
 router = APIRouter()
 transaction_service = TransactionService()
 
+def _not_modified(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    return bool(if_none_match) and (if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")])
+
+async def _cached(request: Request, response: Response, key, compute):
+    """Serve `key` from the analytics cache, answering 304 while the client's ETag is current"""
+    etag = analytics_cache.etag(key)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    result, etag = await analytics_cache.get_async(key, compute)
+    response.headers["ETag"] = etag
+    # Let browsers keep the response but revalidate it on every poll
+    response.headers["Cache-Control"] = "no-cache"
+    return result
+
 @router.get("/")
 async def get_analytics(
+    request: Request,
+    response: Response,
     statement_id: Optional[int] = Query(None, description="Filter by statement ID"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get transaction analytics"""
-    analytics = transaction_service.get_analytics(db, statement_id)
-    return analytics
+    return await _cached(
+        request, response, ("analytics", statement_id, None, None),
+        lambda: transaction_service.get_analytics_async(db, statement_id)
+    )
 
 @router.get("/monthly/{year}/{month}")
 async def get_monthly_summary(
+    request: Request,
+    response: Response,
     year: int,
     month: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get monthly transaction summary"""
     if month < 1 or month > 12:
         return {"error": "Month must be between 1 and 12"}
-    summary = transaction_service.get_monthly_summary(db, year, month)
-    return summary
+    return await _cached(
+        request, response, ("monthly", None, year, month),
+        lambda: transaction_service.get_monthly_summary_async(db, year, month)
+    )
@@ -1,16 +1,26 @@
 import os
-import shutil
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
+import zipfile
+from contextlib import ExitStack
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
-from app.core.database import get_db
+from typing import BinaryIO, Callable, Iterator, List, Optional, Tuple
+from app.core.database import get_async_db, get_db
 from app.core.config import settings
+from app.core.pagination import InvalidCursor
 from app.services.statement_service import StatementService
+from app.services.job_service import JobQueue
+from app.services.upload_store import (
+    NotAPDF, UploadTooLarge, content_path, read_upload, read_upload_async, save_upload, save_upload_async
+)
+from app.parsers.extraction_cache import extraction_cache
 from pydantic import BaseModel
 from datetime import datetime
 
 router = APIRouter()
 statement_service = StatementService()
+job_queue = JobQueue(statement_service)
 
 # Pydantic models for responses
 class StatementResponse(BaseModel):
@@ -29,72 +39,239 @@ class StatementResponse(BaseModel):
 class UploadResponse(BaseModel):
     success: bool
     message: str
+    job_id: int | None = None
+    job_status: str | None = None
+    duplicate: bool = False
     statement_id: int | None = None
     bank_name: str | None = None
     transaction_count: int | None = None
 
-@router.post("/upload", response_model=UploadResponse)
+class JobResponse(BaseModel):
+    id: int
+    filename: str
+    status: str
+    attempts: int
+    error: str | None
+    statement_id: int | None
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+    queued_seconds: float | None = None
+    processing_seconds: float | None = None
+
+    class Config:
+        from_attributes = True
+
+class BatchUploadItem(UploadResponse):
+    filename: str
+
+class BatchUploadResponse(BaseModel):
+    queued: int
+    duplicates: int
+    failed: int
+    files: List[BatchUploadItem]
+
+def _queue_upload(
+    db: Session, file_hash: str, file_path: str, filename: str, data: Optional[bytes] = None
+) -> UploadResponse:
+    """Return the statement for an already processed file, or queue a job for it (from memory if `data` is given)"""
+    # An identical statement was already processed: return it without parsing
+    existing = statement_service.get_processed_statement(db, file_hash)
+    if existing:
+        result = statement_service.statement_result(db, existing)
+        return UploadResponse(
+            success=True,
+            message="Statement already processed",
+            duplicate=True,
+            statement_id=result["statement_id"],
+            bank_name=result["bank_name"],
+            transaction_count=result["transaction_count"]
+        )
+
+    # Queue the statement; parsing happens on the ingestion workers.
+    # The same file uploaded while still in flight shares the existing job.
+    job = job_queue.get_active_job(db, file_hash)
+    if not job:
+        job = job_queue.enqueue(db, file_path, filename, file_hash, data=data)
+
+    return UploadResponse(
+        success=True,
+        message="Statement queued for processing",
+        job_id=job.id,
+        job_status=job.status
+    )
+
+# The file is streamed to disk with aiofiles on the event loop; the sync Session
+# work runs on the threadpool
+@router.post("/upload", response_model=UploadResponse, status_code=status.HTTP_202_ACCEPTED)
 async def upload_statement(
+    response: Response,
     file: UploadFile = File(...),
     db: Session = Depends(get_db)
 ):
-    """Upload and process a bank statement PDF"""
+    """Upload a bank statement PDF and queue it for processing"""
 
     # Validate file type
     if not file.filename.endswith(('.pdf', '.PDF')):
         raise HTTPException(status_code=400, detail="Only PDF files are allowed")
 
-    # Create uploads directory if it doesn't exist
-    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-
-    # Save uploaded file
-    file_path = os.path.join(settings.UPLOAD_DIR, file.filename)
+    # Keep small uploads in memory for parsing; save larger ones under their content hash
+    data = None
     try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        if file.size is not None and file.size <= settings.UPLOAD_IN_MEMORY_MAX_SIZE:
+            file_hash, data = await read_upload_async(file)
+            file_path = content_path(file_hash)
+        else:
+            file_hash, file_path = await save_upload_async(file)
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except NotAPDF as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
 
-    # Process the statement
-    result = statement_service.process_statement(db, file_path, file.filename)
+    result = await run_in_threadpool(_queue_upload, db, file_hash, file_path, file.filename, data)
+    if result.duplicate:
+        response.status_code = status.HTTP_200_OK
+    return result
 
-    if "error" in result:
-        # Clean up file if processing failed
-        if os.path.exists(file_path):
-            os.remove(file_path)
-        raise HTTPException(status_code=400, detail=result["error"])
+def _batch_files(
+    files: List[UploadFile], archives: ExitStack
+) -> Iterator[Tuple[str, Optional[int], Callable[[], BinaryIO]]]:
+    """(name, size, opener) for every uploaded PDF and every PDF inside an uploaded ZIP.
 
-    return UploadResponse(
-        success=True,
-        message="Statement processed successfully",
-        statement_id=result["statement_id"],
-        bank_name=result["bank_name"],
-        transaction_count=result["transaction_count"]
+    Names of archive members are prefixed with the archive name. An entry that
+    cannot be used has an opener that raises ValueError, so it fails on its own.
+    Archives are registered on `archives` and stay open until it closes.
+    """
+    def reject(message: str):
+        def opener():
+            raise ValueError(message)
+        return opener
+
+    for upload in files:
+        if not upload.filename.lower().endswith(".zip"):
+            if upload.filename.endswith(('.pdf', '.PDF')):
+                yield upload.filename, upload.size, lambda upload=upload: upload.file
+            else:
+                yield upload.filename, None, reject("Only PDF or ZIP files are allowed")
+            continue
+
+        try:
+            archive = archives.enter_context(zipfile.ZipFile(upload.file))
+        except zipfile.BadZipFile:
+            yield upload.filename, None, reject("Not a valid ZIP archive")
+            continue
+        for member in archive.infolist():
+            basename = os.path.basename(member.filename)
+            # Folders and the resource forks macOS adds to archives
+            if member.is_dir() or member.filename.startswith("__MACOSX/") or basename.startswith("."):
+                continue
+            name = f"{upload.filename}/{member.filename}"
+            if not basename.endswith(('.pdf', '.PDF')):
+                yield name, None, reject("Only PDF files are allowed")
+            elif member.file_size > settings.MAX_UPLOAD_SIZE:
+                yield name, None, reject(f"File exceeds the {settings.MAX_UPLOAD_SIZE // (1024 * 1024)}MB upload limit")
+            else:
+                yield name, member.file_size, lambda member=member, archive=archive: archive.open(member)
+
+@router.post("/upload/batch", response_model=BatchUploadResponse, status_code=status.HTTP_202_ACCEPTED)
+def upload_batch(
+    files: List[UploadFile] = File(...),
+    db: Session = Depends(get_db)
+):
+    """Upload several statement PDFs, or ZIP archives of them, and queue each for processing.
+
+    Every file gets its own job, so they are parsed in parallel on the ingestion
+    process pool. The manifest has one entry per file; a file that cannot be
+    read or saved is reported there and does not affect the others.
+    """
+    with ExitStack() as archives:
+        entries = list(_batch_files(files, archives))
+        if len(entries) > settings.BATCH_UPLOAD_MAX_FILES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"A batch can contain at most {settings.BATCH_UPLOAD_MAX_FILES} files"
+            )
+
+        manifest = []
+        for name, size, opener in entries:
+            data = None
+            try:
+                with opener() as fileobj:
+                    if size is not None and size <= settings.UPLOAD_IN_MEMORY_MAX_SIZE:
+                        file_hash, data = read_upload(fileobj)
+                        file_path = content_path(file_hash)
+                    else:
+                        file_hash, file_path = save_upload(fileobj)
+                result = _queue_upload(db, file_hash, file_path, os.path.basename(name), data)
+            except ValueError as e:
+                result = UploadResponse(success=False, message=str(e))
+            except Exception as e:
+                db.rollback()
+                result = UploadResponse(success=False, message=f"Failed to save file: {str(e)}")
+            manifest.append(BatchUploadItem(filename=name, **result.model_dump()))
+
+    return BatchUploadResponse(
+        queued=sum(1 for item in manifest if item.job_id is not None),
+        duplicates=sum(1 for item in manifest if item.duplicate),
+        failed=sum(1 for item in manifest if not item.success),
+        files=manifest
     )
 
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get the state of an ingestion job"""
+    job = await job_queue.get_job_async(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    response = JobResponse.model_validate(job)
+    if job.started_at:
+        response.queued_seconds = (job.started_at - job.created_at).total_seconds()
+        if job.finished_at:
+            response.processing_seconds = (job.finished_at - job.started_at).total_seconds()
+    return response
+
 @router.get("/", response_model=List[StatementResponse])
 async def get_statements(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    response: Response,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
+    skip: int = Query(0, ge=0, deprecated=True, description="Offset paging; use cursor instead"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all uploaded statements"""
-    statements = statement_service.get_all_statements(db, skip, limit)
+    """Get uploaded statements in id order, a page at a time.
+
+    The response stays a plain list; the cursor of the next page, if any, is in
+    the X-Next-Cursor header.
+    """
+    if skip and not cursor:
+        return await statement_service.get_all_statements_async(db, skip, limit)
+    try:
+        statements, next_cursor = await statement_service.list_statements_async(db, limit, cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return statements
 
 @router.get("/{statement_id}", response_model=StatementResponse)
 async def get_statement(
     statement_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific statement"""
-    statement = statement_service.get_statement(db, statement_id)
+    statement = await statement_service.get_statement_async(db, statement_id)
     if not statement:
         raise HTTPException(status_code=404, detail="Statement not found")
     return statement
 
 @router.delete("/{statement_id}")
-async def delete_statement(
+def delete_statement(
     statement_id: int,
     db: Session = Depends(get_db)
 ):
@@ -104,6 +281,16 @@ async def delete_statement(
         raise HTTPException(status_code=404, detail="Statement not found")
     return {"message": "Statement deleted successfully"}
 
+@router.get("/extraction-cache/stats")
+async def get_extraction_cache_stats():
+    """Get hit/miss/eviction counters and size of the raw extraction cache"""
+    return extraction_cache.stats()
+
+@router.get("/categorizer-cache/stats")
+async def get_categorizer_cache_stats():
+    """Get hit/miss/eviction counters of the categorizer's merchant-key cache"""
+    return statement_service.categorizer.cache_stats()
+
 @router.get("/banks/supported")
 async def get_supported_banks():
     """Get list of supported banks"""
@@ -1,13 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from pydantic import BaseModel
-from datetime import datetime
-from app.core.database import get_db
-from app.services.transaction_service import TransactionService
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field, model_validator
+from datetime import date, datetime
+from app.core.database import get_async_db, get_db
+from app.core.pagination import InvalidCursor
+from app.models.transaction import TransactionCategory, TransactionStatus
+from app.services.transaction_service import TransactionService, TransactionFilters
+from app.services.export_service import ExportService, EXPORT_FORMATS
 
 router = APIRouter()
 transaction_service = TransactionService()
+export_service = ExportService()
 
 # Pydantic models
 class TransactionResponse(BaseModel):
@@ -29,6 +35,22 @@ class TransactionResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class TransactionListItem(BaseModel):
+    id: int
+    statement_id: int
+    transaction_date: datetime
+    description: str
+    amount: float
+    category: str
+    confidence_score: float
+    status: str
+    auto_categorized: bool
+    original_description: str | None
+
+class TransactionPage(BaseModel):
+    items: List[TransactionListItem]
+    next_cursor: str | None
+
 class TransactionUpdate(BaseModel):
     description: Optional[str] = None
     amount: Optional[float] = None
@@ -37,28 +59,127 @@ class TransactionUpdate(BaseModel):
 class BulkApproveRequest(BaseModel):
     transaction_ids: List[int]
 
+class BulkOperation(BaseModel):
+    id: int
+    action: Literal["update", "categorize", "approve", "reject"]
+    description: Optional[str] = None
+    amount: Optional[float] = None
+    category: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_fields(self):
+        if self.action == "categorize" and self.category is None:
+            raise ValueError("categorize needs a category")
+        if self.action == "update" and self.description is None and self.amount is None and self.category is None:
+            raise ValueError("update needs at least one of description, amount or category")
+        return self
+
+class BulkRequest(BaseModel):
+    operations: List[BulkOperation] = Field(..., min_length=1, max_length=5000)
+
+class BulkResult(BaseModel):
+    id: int
+    success: bool
+    error: str | None
+    transaction: TransactionListItem | None
+
+class BulkResponse(BaseModel):
+    applied: int
+    results: List[BulkResult]
+
+def transaction_filters(
+    statement_id: Optional[int] = Query(None, description="Filter by statement ID"),
+    start_date: Optional[date] = Query(None, description="First transaction date, inclusive"),
+    end_date: Optional[date] = Query(None, description="Last transaction date, inclusive"),
+    category: Optional[TransactionCategory] = None,
+    status: Optional[TransactionStatus] = None,
+    min_amount: Optional[float] = Query(None, description="Signed; expenses are negative"),
+    max_amount: Optional[float] = Query(None, description="Signed; expenses are negative"),
+    bank: Optional[str] = Query(None, description="Bank name of the statement"),
+    search: Optional[str] = Query(None, description="Case-insensitive text in the description")
+) -> TransactionFilters:
+    """Listing filters taken from the query string"""
+    return TransactionFilters(
+        statement_id=statement_id,
+        start_date=start_date,
+        end_date=end_date,
+        category=category.value if category else None,
+        status=status.value if status else None,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        bank=bank,
+        search=search
+    )
+
+@router.get("/", response_model=TransactionPage)
+async def list_transactions(
+    filters: TransactionFilters = Depends(transaction_filters),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
+    order: str = Query("desc", pattern="^(asc|desc)$", description="Order by transaction date"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """List transactions across statements, filtered on the server, a page at a time"""
+    try:
+        items, next_cursor = await transaction_service.list_transactions_async(
+            db, filters, limit, cursor, descending=order == "desc"
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": items, "next_cursor": next_cursor}
+
+@router.get("/export")
+async def export_transactions(
+    filters: TransactionFilters = Depends(transaction_filters),
+    format: str = Query("csv", pattern="^(csv|ndjson|xlsx)$", description="csv, ndjson or xlsx")
+):
+    """Export every matching transaction, streamed as it is read from the database"""
+    media_type, extension = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        export_service.stream(filters, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="transactions.{extension}"'}
+    )
+
 @router.get("/statement/{statement_id}", response_model=List[TransactionResponse])
 async def get_transactions_by_statement(
     statement_id: int,
-    db: Session = Depends(get_db)
+    response: Response,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all transactions for a specific statement"""
-    transactions = transaction_service.get_transactions_by_statement(db, statement_id)
+    """Get a statement's transactions in date order, a page at a time.
+
+    The response stays a plain list; the cursor of the next page, if any, is in
+    the X-Next-Cursor header.
+    """
+    try:
+        transactions, next_cursor = await transaction_service.get_transactions_by_statement_async(
+            db, statement_id, limit, cursor
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return transactions
 
 @router.get("/{transaction_id}", response_model=TransactionResponse)
 async def get_transaction(
     transaction_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific transaction"""
-    transaction = transaction_service.get_transaction(db, transaction_id)
+    transaction = await transaction_service.get_transaction_async(db, transaction_id)
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
     return transaction
 
+# Writes go through the sync Session (rollups, learning), so these routes are
+# plain functions that FastAPI runs in its threadpool, off the event loop
+
 @router.patch("/{transaction_id}", response_model=TransactionResponse)
-async def update_transaction(
+def update_transaction(
     transaction_id: int,
     updates: TransactionUpdate,
     db: Session = Depends(get_db)
@@ -71,7 +192,7 @@ async def update_transaction(
     return transaction
 
 @router.post("/{transaction_id}/approve", response_model=TransactionResponse)
-async def approve_transaction(
+def approve_transaction(
     transaction_id: int,
     db: Session = Depends(get_db)
 ):
@@ -82,7 +203,7 @@ async def approve_transaction(
     return transaction
 
 @router.post("/{transaction_id}/reject", response_model=TransactionResponse)
-async def reject_transaction(
+def reject_transaction(
     transaction_id: int,
     db: Session = Depends(get_db)
 ):
@@ -92,8 +213,17 @@ async def reject_transaction(
         raise HTTPException(status_code=404, detail="Transaction not found")
     return transaction
 
+@router.post("/bulk", response_model=BulkResponse)
+def bulk_update_transactions(
+    request: BulkRequest,
+    db: Session = Depends(get_db)
+):
+    """Apply edits, recategorizations, approvals and rejections in one round trip and one DB transaction"""
+    results = transaction_service.bulk_update(db, [operation.model_dump() for operation in request.operations])
+    return {"applied": sum(result["success"] for result in results), "results": results}
+
 @router.post("/bulk-approve")
-async def bulk_approve_transactions(
+def bulk_approve_transactions(
     request: BulkApproveRequest,
     db: Session = Depends(get_db)
 ):
@@ -0,0 +1,165 @@
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Tuple
+from app.core.config import settings
+
+class MemoryVersion:
+    """Data version held in this process; only this process's writes invalidate it"""
+
+    def __init__(self):
+        # Start from the clock so versions from an earlier run never repeat
+        self._version = time.time_ns()
+        self._lock = threading.Lock()
+
+    def get(self) -> str:
+        return str(self._version)
+
+    def bump(self):
+        with self._lock:
+            self._version += 1
+
+class SQLiteVersion:
+    """Data version in a small SQLite file, shared by every worker on the host"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS data_version (id INTEGER PRIMARY KEY, version INTEGER NOT NULL)")
+            connection.execute("INSERT OR IGNORE INTO data_version (id, version) VALUES (1, ?)", (time.time_ns(),))
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=5)
+            self._local.connection = connection
+        return connection
+
+    def get(self) -> str:
+        return str(self._connect().execute("SELECT version FROM data_version WHERE id = 1").fetchone()[0])
+
+    def bump(self):
+        with self._connect() as connection:
+            connection.execute("UPDATE data_version SET version = version + 1 WHERE id = 1")
+
+class FileVersion:
+    """Data version in a plain file, shared by every worker on the host.
+
+    Each bump writes a fresh random token, so concurrent bumps can never leave
+    the file at a value a reader has already cached against.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if not os.path.exists(path):
+            self.bump()
+
+    def get(self) -> str:
+        try:
+            with open(self.path, encoding="ascii") as f:
+                return f.read().strip()
+        except OSError:
+            self.bump()
+            return self.get()
+
+    def bump(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+        with os.fdopen(fd, "w", encoding="ascii") as f:
+            f.write(uuid.uuid4().hex)
+        os.replace(tmp_path, self.path)
+
+class AnalyticsCache:
+    """In-process cache of analytics results, invalidated by a shared data version.
+
+    Write paths call `invalidate()` after they commit, which bumps the version.
+    Entries cached under an older version are recomputed on next access. The
+    version also forms the ETag, so a client whose ETag is current can be sent
+    a 304 without querying the database.
+    """
+
+    def __init__(self, version, max_entries: int = 256):
+        self.version = version
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _etag(version: str, key: Hashable) -> str:
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:12]
+        return f'"{version}-{digest}"'
+
+    def etag(self, key: Hashable) -> str:
+        """ETag a response for `key` would carry at the current data version"""
+        return self._etag(self.version.get(), key)
+
+    def _lookup(self, key: Hashable, version: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            return None
+
+    def _store(self, key: Hashable, version: str, value: Any):
+        # Cached under the version read before computing, so a concurrent write
+        # makes this entry stale instead of hiding behind it
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Tuple[Any, str]:
+        """(result, etag) for `key`, computing and caching the result if it is stale"""
+        version = self.version.get()
+        entry = self._lookup(key, version)
+        if entry is None:
+            entry = (version, compute())
+            self._store(key, *entry)
+        return entry[1], self._etag(version, key)
+
+    async def get_async(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Tuple[Any, str]:
+        """`get` for a coroutine function `compute`"""
+        version = self.version.get()
+        entry = self._lookup(key, version)
+        if entry is None:
+            entry = (version, await compute())
+            self._store(key, *entry)
+        return entry[1], self._etag(version, key)
+
+    def invalidate(self):
+        """Mark every cached result stale; call after committing a data change"""
+        self.version.bump()
+
+def create_version(backend: str, path: str):
+    if backend == "sqlite":
+        return SQLiteVersion(path)
+    if backend == "file":
+        return FileVersion(path)
+    if backend == "memory":
+        # Other workers' writes would never reach this process's version
+        if int(os.environ.get("WEB_CONCURRENCY", "1")) > 1:
+            raise ValueError(
+                "The memory analytics cache backend serves a single worker; "
+                "set ANALYTICS_CACHE_BACKEND to file or sqlite"
+            )
+        return MemoryVersion()
+    raise ValueError(f"Unknown analytics cache backend: {backend}")
+
+analytics_cache = AnalyticsCache(
+    create_version(settings.ANALYTICS_CACHE_BACKEND, settings.ANALYTICS_CACHE_VERSION_PATH),
+    max_entries=settings.ANALYTICS_CACHE_MAX_ENTRIES
+)
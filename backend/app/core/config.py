@@ -1,5 +1,6 @@
+import os
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Any, Dict, List, Optional
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "Bank Statement Extractor"
@@ -8,6 +9,29 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite:///./bank_statements.db"
+    # URL for the async engine used by read endpoints; derived from DATABASE_URL
+    # (aiosqlite for SQLite, asyncpg for PostgreSQL) when unset
+    ASYNC_DATABASE_URL: Optional[str] = None
+    # Engine profile applied to both engines. SQLite options become PRAGMAs on
+    # every new connection; pool options apply to pooled (file or server) databases.
+    DATABASE_PROFILE: str = "production"
+    DATABASE_PROFILES: Dict[str, Dict[str, Any]] = {
+        # WAL lets readers carry on while an ingest commits
+        "production": {
+            "sqlite_journal_mode": "WAL",
+            "sqlite_synchronous": "NORMAL",  # durable at checkpoints; safe with WAL
+            "sqlite_cache_size": -64000,  # KiB when negative: 64 MB page cache
+            "sqlite_mmap_size": 256 * 1024 * 1024,
+            "sqlite_busy_timeout": 15000,  # ms a writer waits for the lock
+            "pool_size": 10,
+            "max_overflow": 30,
+            "pool_timeout": 30,
+            "pool_pre_ping": True,
+            "pool_recycle": 1800
+        },
+        # SQLAlchemy and SQLite defaults (rollback journal, 5 + 10 connections)
+        "plain": {}
+    }
 
     # CORS
     ALLOWED_ORIGINS: List[str] = [
@@ -18,9 +42,67 @@ class Settings(BaseSettings):
 
     # File upload
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
+    # Whole request body of a batch upload; each file in it is still held to MAX_UPLOAD_SIZE
+    MAX_BATCH_UPLOAD_SIZE: int = 200 * 1024 * 1024
     UPLOAD_DIR: str = "uploads"
+    # Uploads up to this size are parsed from memory rather than written to
+    # UPLOAD_DIR and read back (0 sends every upload through disk)
+    UPLOAD_IN_MEMORY_MAX_SIZE: int = 2 * 1024 * 1024
+    # Also write uploads parsed from memory to UPLOAD_DIR, in the background as soon
+    # as they are accepted. Without the copy their jobs cannot resume after a
+    # restart, and reprocessing relies on the extraction cache alone.
+    PERSIST_UPLOADS: bool = True
     ALLOWED_EXTENSIONS: List[str] = [".pdf", ".PDF"]
 
+    # Rows per executemany INSERT when saving parsed transactions
+    BULK_INSERT_CHUNK_SIZE: int = 1000
+
+    # Rows fetched per round trip (and written per response chunk) when exporting
+    EXPORT_BATCH_SIZE: int = 2000
+
+    # Background ingestion: INGESTION_WORKERS threads run jobs and save results,
+    # statements are parsed on a pool of INGESTION_PROCESSES processes (0 parses
+    # on the threads themselves)
+    INGESTION_WORKERS: int = 2
+    INGESTION_PROCESSES: int = os.cpu_count() or 1
+    INGESTION_MAX_ATTEMPTS: int = 3
+    # A running job is only requeued at startup once it has been running this long;
+    # younger ones may belong to another live server worker
+    INGESTION_STALE_AFTER_SECONDS: int = 30 * 60
+    # Most files accepted by one batch upload, counting every PDF inside a ZIP
+    BATCH_UPLOAD_MAX_FILES: int = 500
+
+    # Parallel PDF extraction: documents with at least PARALLEL_EXTRACTION_MIN_PAGES
+    # pages are split across PARALLEL_EXTRACTION_WORKERS processes
+    PARALLEL_EXTRACTION_ENABLED: bool = True
+    PARALLEL_EXTRACTION_WORKERS: int = 4
+    PARALLEL_EXTRACTION_MIN_PAGES: int = 8
+
+    # Raw extraction cache (per-page text and tables, keyed by file hash)
+    EXTRACTION_CACHE_ENABLED: bool = True
+    EXTRACTION_CACHE_DIR: str = "extraction_cache"
+    EXTRACTION_CACHE_MAX_BYTES: int = 512 * 1024 * 1024  # 512MB
+
+    # Categorization results memoized per merchant key (0 disables the cache)
+    CATEGORIZER_CACHE_SIZE: int = 50000
+
+    # Online category model learned from user edits and approvals. Once it has seen
+    # CATEGORY_MODEL_MIN_UPDATES labels, its predictions replace the keyword rules
+    # when at least CATEGORY_MODEL_MIN_CONFIDENCE
+    CATEGORY_MODEL_ENABLED: bool = True
+    CATEGORY_MODEL_PATH: str = "models/category_model.joblib"
+    CATEGORY_MODEL_FEATURES: int = 2 ** 15
+    CATEGORY_MODEL_MIN_UPDATES: int = 200
+    CATEGORY_MODEL_MIN_CONFIDENCE: float = 0.7
+    CATEGORY_MODEL_SAVE_EVERY: int = 50
+
+    # Analytics result cache. The data version that invalidates it lives in a plain
+    # or SQLite file shared by all workers on the host, or in memory (single worker
+    # only; refused when WEB_CONCURRENCY asks for more)
+    ANALYTICS_CACHE_BACKEND: str = "file"  # file | sqlite | memory
+    ANALYTICS_CACHE_VERSION_PATH: str = "analytics_cache.version"
+    ANALYTICS_CACHE_MAX_ENTRIES: int = 256
+
     # Supported banks
     SUPPORTED_BANKS: List[str] = [
         "HSBC",
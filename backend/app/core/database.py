@@ -1,15 +1,90 @@
-from sqlalchemy import create_engine
+from typing import Any, Dict, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
-)
+# Profile keys that are SQLite PRAGMAs, and the create_engine arguments for pooling
+SQLITE_PRAGMAS = {
+    "sqlite_journal_mode": "journal_mode",
+    "sqlite_synchronous": "synchronous",
+    "sqlite_cache_size": "cache_size",
+    "sqlite_mmap_size": "mmap_size",
+    "sqlite_busy_timeout": "busy_timeout"
+}
+POOL_OPTIONS = ("pool_size", "max_overflow", "pool_timeout", "pool_pre_ping", "pool_recycle")
+
+def engine_profile(name: Optional[str] = None) -> Dict[str, Any]:
+    name = name or settings.DATABASE_PROFILE
+    if name not in settings.DATABASE_PROFILES:
+        raise ValueError(f"Unknown database profile: {name}")
+    return settings.DATABASE_PROFILES[name]
+
+def engine_options(url: str, profile: Dict[str, Any]) -> Dict[str, Any]:
+    """create_engine keyword arguments for a URL under a profile"""
+    url = make_url(url)
+    options = {}
+    if url.get_backend_name() == "sqlite":
+        if not url.get_driver_name().startswith("aiosqlite"):
+            options["connect_args"] = {"check_same_thread": False}
+        # In-memory databases use a single-connection pool that takes no sizing
+        if url.database in (None, "", ":memory:"):
+            return options
+    options.update({key: profile[key] for key in POOL_OPTIONS if key in profile})
+    return options
+
+def apply_sqlite_pragmas(engine: Engine, profile: Dict[str, Any]):
+    """Run the profile's PRAGMAs on every new connection of a SQLite engine"""
+    pragmas = [(SQLITE_PRAGMAS[key], value) for key, value in profile.items() if key in SQLITE_PRAGMAS]
+    if engine.dialect.name != "sqlite" or not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma, value in pragmas:
+                cursor.execute(f"PRAGMA {pragma}={value}")
+        finally:
+            cursor.close()
+
+def create_database_engine(url: str, profile_name: Optional[str] = None) -> Engine:
+    """Sync engine for `url`, configured by a named profile from settings"""
+    profile = engine_profile(profile_name)
+    engine = create_engine(url, **engine_options(url, profile))
+    apply_sqlite_pragmas(engine, profile)
+    return engine
+
+engine = create_database_engine(settings.DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async drivers for each backend's sync URL
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+def async_database_url(url: str) -> str:
+    """The async-driver form of a database URL"""
+    url = make_url(url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver:
+        url = url.set(drivername=driver)
+    return url.render_as_string(hide_password=False)
+
+def create_async_database_engine(url: str, profile_name: Optional[str] = None):
+    """Async engine for `url`, configured by a named profile from settings"""
+    profile = engine_profile(profile_name)
+    async_engine = create_async_engine(url, **engine_options(url, profile))
+    apply_sqlite_pragmas(async_engine.sync_engine, profile)
+    return async_engine
+
+# Used by read endpoints so their queries do not block the event loop;
+# writes stay on the sync engine, run off the loop in FastAPI's threadpool
+async_engine = create_async_database_engine(settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL))
+
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -18,3 +93,7 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
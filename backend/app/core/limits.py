@@ -0,0 +1,70 @@
+from typing import Dict
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+class _BodyTooLarge(Exception):
+    pass
+
+class RequestSizeLimitMiddleware:
+    """Reject request bodies over a per-path byte limit while they are still arriving.
+
+    A declared Content-Length over the limit is refused before any of the body
+    is read. Otherwise bytes are counted as the app receives them, and the
+    request is cut off with a 413 once the limit is passed, so an oversize
+    upload is never spooled in full.
+    """
+
+    def __init__(self, app: ASGIApp, limits: Dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        content_length = headers.get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            await self._reject(scope, receive, send, limit)
+            return
+
+        received = 0
+        too_large = False
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, too_large
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    too_large = True
+                    raise _BodyTooLarge()
+            return message
+
+        async def guarded_send(message: Message):
+            nonlocal response_started
+            # Whatever the app makes of the aborted body (FastAPI reports a 400
+            # parse error) is dropped in favour of the 413
+            if too_large and not response_started:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not too_large:
+                raise
+        if too_large and not response_started:
+            await self._reject(scope, receive, send, limit)
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send, limit: int):
+        response = JSONResponse(
+            {"detail": f"Request body exceeds the {limit // (1024 * 1024)}MB limit"}, status_code=413
+        )
+        await response(scope, receive, send)
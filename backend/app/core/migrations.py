@@ -0,0 +1,49 @@
+import os
+from typing import Optional, Set
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from app.core.database import engine
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def alembic_config() -> Config:
+    """Alembic config that works regardless of the current directory"""
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    # Leave the application's logging configuration alone
+    config.attributes["configure_logging"] = False
+    return config
+
+def _columns(inspector, table: str) -> Set[str]:
+    return {column["name"] for column in inspector.get_columns(table)}
+
+def _unversioned_revision(connection) -> Optional[str]:
+    """Revision matching a database created by create_all before migrations existed.
+
+    Only a schema with every change of 0002 is stamped at it. Anything older,
+    including create_all schemas from in between, is stamped 0001; 0002 checks
+    each table and column and adds only what is missing.
+    """
+    inspector = inspect(connection)
+    tables = set(inspector.get_table_names())
+    if "alembic_version" in tables or "transactions" not in tables:
+        return None
+    if (
+        "amount_cents" in _columns(inspector, "transactions")
+        and "file_hash" in _columns(inspector, "statements")
+        and "ingestion_jobs" in tables
+        and "file_hash" in _columns(inspector, "ingestion_jobs")
+    ):
+        return "0002"
+    return "0001"
+
+def upgrade_database(bind=None):
+    """Bring the database schema to the latest migration, adopting unversioned databases first"""
+    config = alembic_config()
+    with (bind or engine).begin() as connection:
+        config.attributes["connection"] = connection
+        revision = _unversioned_revision(connection)
+        if revision:
+            command.stamp(config, revision)
+        command.upgrade(config, "head")
@@ -0,0 +1,14 @@
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional
+
+def to_cents(value) -> Optional[int]:
+    """Convert a decimal amount (float, str or Decimal) to integer cents"""
+    if value is None:
+        return None
+    return int((Decimal(str(value)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+def from_cents(cents: Optional[int]) -> Optional[float]:
+    """Convert integer cents back to a decimal amount for API responses"""
+    if cents is None:
+        return None
+    return cents / 100
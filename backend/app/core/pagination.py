@@ -0,0 +1,27 @@
+import base64
+import json
+from datetime import datetime
+from typing import List, Sequence
+
+class InvalidCursor(ValueError):
+    """A pagination cursor that was not issued by this API"""
+
+def encode_cursor(values: Sequence) -> str:
+    """Opaque cursor for the sort key of the last row of a page"""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> List:
+    """Sort key values of a cursor, converted to `types`; raises InvalidCursor if malformed"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise InvalidCursor("Invalid cursor")
+        return [
+            datetime.fromisoformat(value) if kind is datetime else kind(value)
+            for kind, value in zip(types, payload)
+        ]
+    except InvalidCursor:
+        raise
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor("Invalid cursor") from e
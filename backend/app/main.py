@@ -1,28 +1,56 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from app.api import router
+from app.api.statements import job_queue
 from app.core.config import settings
-from app.core.database import engine, Base
+from app.core.database import async_engine
+from app.core.limits import RequestSizeLimitMiddleware
+from app.core.migrations import upgrade_database
+from app.ml.online_model import get_category_model
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create or migrate database tables
+    upgrade_database()
+    # Resume ingestion jobs interrupted by the last shutdown
+    job_queue.recover()
+    yield
+    job_queue.shutdown()
+    await async_engine.dispose()
+    # Persist category model updates made since the last periodic save
+    model = get_category_model()
+    if model is not None:
+        model.flush()
 
 app = FastAPI(
     title="Bank Statement Extractor",
     description="AI-powered bank statement extraction and analysis for Singapore banks",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# CORS middleware
+# Refuse oversize uploads while they arrive instead of after spooling them.
+# The single-file limit leaves room for the multipart framing around the file.
+app.add_middleware(
+    RequestSizeLimitMiddleware,
+    limits={
+        "/api/v1/statements/upload": settings.MAX_UPLOAD_SIZE + 64 * 1024,
+        "/api/v1/statements/upload/batch": settings.MAX_BATCH_UPLOAD_SIZE,
+    },
+)
+
+# CORS middleware (added last so it wraps the 413s too)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
 # Include API routes
 app.include_router(router, prefix="/api/v1")
 
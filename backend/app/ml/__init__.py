@@ -1 +1,2 @@
 from .categorizer import TransactionCategorizer
+from .online_model import OnlineCategoryModel, get_category_model
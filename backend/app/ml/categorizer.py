@@ -1,11 +1,176 @@
 import re
-from typing import Tuple
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from app.core.config import settings
 from app.models.transaction import TransactionCategory
+from app.parsers.batch import TransactionBatch
+
+# Tokens of a plain keyword pattern: \s* / \s+, escaped literals, literal characters
+_TOKEN = re.compile(r"\\s[*+]|\\[^A-Za-z0-9]|[^\\.^$*+?{}\[\]()|]")
+_WHITESPACE_TOKENS = {r"\s*", r"\s+"}
+_END = object()
+
+def _literal(token):
+    """Lowercased character an escaped or plain keyword token matches"""
+    if token is _END or token in _WHITESPACE_TOKENS:
+        return token
+    return token[-1].lower()
+
+class CompiledRuleMatcher:
+    """All categorization rules compiled into one keyword-trie regex.
+
+    Rule patterns are alternations of keywords, so every keyword is merged into a
+    trie, and the trie is emitted as a single regex with an empty marker group
+    wherever a keyword ends. A match at a position follows the one trie path
+    spelled by the text there. `lastindex` therefore names the deepest keyword
+    found, and a precomputed table gives the highest-priority rule on that path.
+    Taking the lowest rule index over all match positions returns the same rule
+    the old one-search-per-pattern loop found first. Rule sets that are not
+    plain keyword alternations fall back to that loop with precompiled patterns.
+    """
+
+    def __init__(self, rules: List[Tuple[str, TransactionCategory, float]]):
+        self._results = [(category, confidence) for _, category, confidence in rules]
+        self._patterns = [re.compile(pattern) for pattern, _, _ in rules]
+        try:
+            self._regex, self._path_priority = self._compile_trie([pattern for pattern, _, _ in rules])
+        except ValueError:
+            self._regex, self._path_priority = None, []
+
+    @staticmethod
+    def _compile_trie(patterns: List[str]):
+        trie = {}
+        for priority, pattern in enumerate(patterns):
+            for keyword in pattern.split("|"):
+                tokens = _TOKEN.findall(keyword)
+                if not tokens or "".join(tokens) != keyword:
+                    raise ValueError(f"not a keyword alternation: {pattern}")
+                node = trie
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                node[_END] = min(node.get(_END, priority), priority)
+
+        # Group number -> best rule priority on the path to that keyword end
+        path_priority = [None]
+
+        def emit(node, best, is_root=False):
+            children = [token for token in node if token is not _END]
+            whitespace = [token for token in children if token in _WHITESPACE_TOKENS]
+            if whitespace:
+                # Text after a whitespace run must not also continue a sibling branch,
+                # otherwise two keyword paths could match at the same position
+                siblings = {_literal(token) for token in children if token not in _WHITESPACE_TOKENS}
+                following = {_literal(token) for token in whitespace for token in node[token]}
+                if (is_root or len(whitespace) > 1 or siblings & following
+                        or any(token is _END or token in _WHITESPACE_TOKENS or token.isspace()
+                               for token in siblings | following)):
+                    raise ValueError("ambiguous whitespace branch")
+
+            regex = ""
+            if _END in node:
+                best = node[_END] if best is None else min(best, node[_END])
+                path_priority.append(best)
+                regex = "()"
+            if not children:
+                return regex
+
+            branches = "|".join(
+                (token if len(token) > 1 else re.escape(token)) + emit(node[token], best)
+                for token in children
+            )
+            return regex + (f"(?:{branches})?" if _END in node else f"(?:{branches})")
+
+        return re.compile(emit(trie, None, is_root=True)), path_priority
+
+    def best_match(self, text: str) -> Optional[Tuple[TransactionCategory, float]]:
+        """(category, confidence) of the highest-priority rule matching anywhere in `text`"""
+        if self._regex is None:
+            for i, pattern in enumerate(self._patterns):
+                if pattern.search(text):
+                    return self._results[i]
+            return None
+
+        best = None
+        match = self._regex.search(text)
+        while match:
+            priority = self._path_priority[match.lastindex]
+            if best is None or priority < best:
+                best = priority
+                if best == 0:
+                    break
+            match = self._regex.search(text, match.start() + 1)
+        return None if best is None else self._results[best]
+
+# Whitespace-separated tokens without letters (reference numbers, dates, times),
+# optionally behind a card mask such as XXXX or ****
+_REFERENCE_TOKEN = re.compile(r"(?<!\S)[x*#]*\d[\d\-/.:*]*(?!\S)")
+
+def merchant_key(description: str) -> str:
+    """Lowercased description with reference numbers, card suffixes and dates replaced by '#'.
+
+    "GRAB*TRIP 1234-5678" and "GRAB*TRIP 8765-4321" share the key "grab*trip #".
+    Only tokens made of digits and separators are replaced, and whitespace runs
+    become single spaces, so keyword rules match the key exactly as they match the
+    full description.
+    """
+    return _REFERENCE_TOKEN.sub("#", " ".join(description.lower().split()))
+
+class CategoryCache:
+    """Bounded LRU of (merchant key, is credit) -> (category, confidence)"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple[str, bool], Tuple[TransactionCategory, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, bool]) -> Optional[Tuple[TransactionCategory, float]]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: Tuple[str, bool], result: Tuple[TransactionCategory, float]):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "max_size": self.max_size
+        }
 
 class TransactionCategorizer:
     """ML-based transaction categorizer with keyword matching"""
 
-    def __init__(self):
+    def __init__(self, cache_size: Optional[int] = None, model=None, min_model_confidence: Optional[float] = None):
+        self.cache = CategoryCache(settings.CATEGORIZER_CACHE_SIZE if cache_size is None else cache_size)
+        # Optional OnlineCategoryModel consulted by batch_categorize before the rules
+        self.model = model
+        self.min_model_confidence = (
+            settings.CATEGORY_MODEL_MIN_CONFIDENCE if min_model_confidence is None else min_model_confidence
+        )
         # Define keyword patterns for each category
         self.category_patterns = {
             TransactionCategory.FOOD_DINING: [
@@ -64,38 +229,85 @@ class TransactionCategorizer:
                 r'loan|mortgage|instalment|installment|repayment|emi|housing\s*loan|car\s*loan'
             ]
         }
+        self.compile_patterns()
+
+    def compile_patterns(self):
+        """Compile category_patterns into single-pass matchers; call again after editing the patterns"""
+        rules = []
+        for category, patterns in self.category_patterns.items():
+            for pattern in patterns:
+                # Calculate confidence based on pattern match strength
+                confidence = 0.85 if len(pattern) > 20 else 0.75
+                rules.append((pattern, category, confidence))
+
+        income_rules = [
+            (pattern, TransactionCategory.INCOME, 0.95)
+            for pattern in self.category_patterns[TransactionCategory.INCOME]
+        ]
+        self._matcher = CompiledRuleMatcher(rules)
+        self._positive_matcher = CompiledRuleMatcher(income_rules + rules)
+        self.cache.clear()
 
     def categorize(self, description: str, amount: float = 0.0) -> Tuple[TransactionCategory, float]:
         """
         Categorize a transaction based on description and amount
         Returns: (category, confidence_score)
         """
-        description_lower = description.lower()
+        if self.cache.max_size <= 0:
+            return self._match(description.lower(), amount > 0)
 
-        # Check for income patterns (positive amounts usually)
-        if amount > 0:
-            if any(re.search(pattern, description_lower) for pattern in self.category_patterns[TransactionCategory.INCOME]):
-                return TransactionCategory.INCOME, 0.95
-
-        # Check each category
-        for category, patterns in self.category_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, description_lower):
-                    # Calculate confidence based on pattern match strength
-                    confidence = 0.85 if len(pattern) > 20 else 0.75
-                    return category, confidence
+        # The amount only matters through its sign, so results are memoized per merchant and sign
+        key = (merchant_key(description), amount > 0)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        result = self._match(*key)
+        self.cache.put(key, result)
+        return result
 
+    def _match(self, text: str, is_credit: bool) -> Tuple[TransactionCategory, float]:
+        # Income patterns take priority for positive amounts
+        matcher = self._positive_matcher if is_credit else self._matcher
         # Default to OTHER if no match found
-        return TransactionCategory.OTHER, 0.3
+        return matcher.best_match(text) or (TransactionCategory.OTHER, 0.3)
+
+    def cache_stats(self) -> Dict:
+        """Hit/miss/eviction counters of the merchant-key result cache"""
+        return self.cache.stats()
+
+    def batch_categorize(self, transactions):
+        """Categorize a batch of transactions
+
+        A TransactionBatch is categorized in place and returned; a list of dicts
+        gets a new list of dicts with the category fields added. When a model is
+        set, the whole batch is predicted in one call and rows it is unsure about
+        fall back to the keyword rules.
+        """
+        if isinstance(transactions, TransactionBatch):
+            prediction = None
+            if self.model is not None:
+                prediction = self.model.predict(transactions.descriptions, transactions.amount_cents)
+
+            categories = []
+            confidence_scores = array("d")
+            for i, (description, amount_cents) in enumerate(zip(transactions.descriptions, transactions.amount_cents)):
+                if prediction and prediction[1][i] >= self.min_model_confidence:
+                    category, confidence = TransactionCategory(prediction[0][i]), float(prediction[1][i])
+                else:
+                    category, confidence = self.categorize(description, amount_cents / 100)
+                categories.append(category)
+                confidence_scores.append(confidence)
+            transactions.set_categories(categories, confidence_scores)
+            return transactions
 
-    def batch_categorize(self, transactions: list) -> list:
-        """Categorize a batch of transactions"""
         results = []
         for trans in transactions:
-            category, confidence = self.categorize(
-                trans.get('description', ''),
-                trans.get('amount', 0.0)
-            )
+            # Dicts may carry integer cents or a legacy float amount in dollars
+            if 'amount_cents' in trans:
+                amount = trans['amount_cents'] / 100
+            else:
+                amount = trans.get('amount', 0.0)
+            category, confidence = self.categorize(trans.get('description', ''), amount)
             results.append({
                 **trans,
                 'category': category,
@@ -0,0 +1,140 @@
+import os
+import tempfile
+import threading
+from typing import List, Optional, Sequence, Tuple
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from app.core.config import settings
+from app.models.transaction import TransactionCategory
+from .categorizer import merchant_key
+
+# Bump when the feature layout changes; older model files are then ignored
+MODEL_VERSION = 1
+
+class OnlineCategoryModel:
+    """Linear categorizer learned incrementally from user edits and approvals.
+
+    Descriptions are reduced to merchant keys and hashed into a fixed number of
+    character n-gram features, so memory does not grow with the vocabulary. A
+    logistic-loss SGD classifier is updated with `partial_fit` as labels arrive,
+    never retrained from scratch. Predictions start once `min_updates` labels
+    have been seen. The model is saved every `save_every` updates and on `flush()`.
+    """
+
+    def __init__(self, path: str, n_features: int = 2 ** 15, min_updates: int = 200, save_every: int = 50):
+        self.path = path
+        self.n_features = n_features
+        self.min_updates = min_updates
+        self.save_every = save_every
+        self.classes = [category.value for category in TransactionCategory]
+        self.vectorizer = HashingVectorizer(
+            analyzer="char_wb",
+            ngram_range=(3, 5),
+            n_features=n_features,
+            alternate_sign=False
+        )
+        self.classifier = SGDClassifier(loss="log_loss", alpha=1e-5)
+        self.updates = 0
+        self._unsaved = 0
+        self._lock = threading.Lock()
+
+    @property
+    def is_trained(self) -> bool:
+        return hasattr(self.classifier, "classes_") and self.updates >= self.min_updates
+
+    def _features(self, descriptions: Sequence[str], amount_cents: Sequence[int]):
+        # The sign goes in as a pseudo-word so credits and debits of one merchant can differ
+        return self.vectorizer.transform([
+            f"{merchant_key(description)} {'credit' if amount > 0 else 'debit'}"
+            for description, amount in zip(descriptions, amount_cents)
+        ])
+
+    def predict(self, descriptions: Sequence[str], amount_cents: Sequence[int]) -> Optional[Tuple[List[str], np.ndarray]]:
+        """Most likely category value and its probability for every row, or None until trained"""
+        if not self.is_trained or not len(descriptions):
+            return None
+        features = self._features(descriptions, amount_cents)
+        with self._lock:
+            probabilities = self.classifier.predict_proba(features)
+            labels = self.classifier.classes_
+        best = probabilities.argmax(axis=1)
+        return [labels[i] for i in best], probabilities[np.arange(len(best)), best]
+
+    def learn(self, descriptions: Sequence[str], amount_cents: Sequence[int], categories: Sequence[str]):
+        """Update the model with confirmed categories; rows with unknown categories are skipped"""
+        known = set(self.classes)
+        rows = [
+            (description, amount, getattr(category, "value", category))
+            for description, amount, category in zip(descriptions, amount_cents, categories)
+            if getattr(category, "value", category) in known
+        ]
+        if not rows:
+            return
+        descriptions, amount_cents, labels = zip(*rows)
+        features = self._features(descriptions, amount_cents)
+        with self._lock:
+            self.classifier.partial_fit(features, labels, classes=self.classes)
+            self.updates += len(labels)
+            self._unsaved += len(labels)
+            if self._unsaved >= self.save_every:
+                self._save()
+
+    def flush(self):
+        """Save pending updates"""
+        with self._lock:
+            if self._unsaved:
+                self._save()
+
+    def _save(self):
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                joblib.dump({
+                    "version": MODEL_VERSION,
+                    "n_features": self.n_features,
+                    "updates": self.updates,
+                    "classifier": self.classifier
+                }, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._unsaved = 0
+
+    def load(self) -> bool:
+        """Load saved state from `path`; keeps the fresh model if there is none or it is stale"""
+        try:
+            state = joblib.load(self.path)
+        except Exception:
+            return False
+        if state.get("version") != MODEL_VERSION or state.get("n_features") != self.n_features:
+            return False
+        self.classifier = state["classifier"]
+        self.updates = state["updates"]
+        return True
+
+_model: Optional[OnlineCategoryModel] = None
+_model_lock = threading.Lock()
+
+def get_category_model() -> Optional[OnlineCategoryModel]:
+    """The process-wide model, loaded from disk on first use; None when disabled"""
+    global _model
+    if not settings.CATEGORY_MODEL_ENABLED:
+        return None
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                model = OnlineCategoryModel(
+                    settings.CATEGORY_MODEL_PATH,
+                    n_features=settings.CATEGORY_MODEL_FEATURES,
+                    min_updates=settings.CATEGORY_MODEL_MIN_UPDATES,
+                    save_every=settings.CATEGORY_MODEL_SAVE_EVERY
+                )
+                model.load()
+                _model = model
+    return _model
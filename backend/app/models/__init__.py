@@ -1 +1,3 @@
 from .transaction import Transaction, Statement
+from .job import IngestionJob, JobStatus
+from .rollup import DailyRollup
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from datetime import datetime
+import enum
+from app.core.database import Base
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class IngestionJob(Base):
+    __tablename__ = "ingestion_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    filename = Column(String, nullable=False)
+    file_path = Column(String, nullable=False)
+    file_hash = Column(String(64), index=True)
+    status = Column(String, default=JobStatus.QUEUED, index=True)
+    attempts = Column(Integer, default=0)
+    error = Column(Text)
+
+    # Result
+    statement_id = Column(Integer, ForeignKey("statements.id", ondelete="SET NULL"))
+
+    # Timings
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
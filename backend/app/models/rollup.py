@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index
+from app.core.database import Base
+
+class DailyRollup(Base):
+    """Per-day income/expense sums and counts of transactions.
+
+    One row per (day, category, status, statement), kept in step with the
+    transactions table by RollupService in the same database transaction as every
+    write. Analytics read these rows instead of scanning transactions. A missing
+    category or status is stored as an empty string so the key never contains NULL.
+    """
+    __tablename__ = "daily_rollups"
+    __table_args__ = (
+        Index("ix_daily_rollups_statement_day", "statement_id", "day"),
+    )
+
+    day = Column(Date, primary_key=True)
+    category = Column(String, primary_key=True)
+    status = Column(String, primary_key=True)
+    statement_id = Column(Integer, ForeignKey("statements.id"), primary_key=True)
+
+    # Integer cents, like Transaction.amount_cents
+    income_cents = Column(Integer, nullable=False, default=0)
+    expense_cents = Column(Integer, nullable=False, default=0)
+    count = Column(Integer, nullable=False, default=0)
@@ -1,8 +1,10 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Text, Enum, Index
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from datetime import datetime
 import enum
 from app.core.database import Base
+from app.core.money import to_cents, from_cents
 
 class TransactionStatus(str, enum.Enum):
     PENDING = "pending"
@@ -33,6 +35,7 @@ class Statement(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     filename = Column(String, nullable=False)
+    file_hash = Column(String(64), index=True)
     bank_name = Column(String, nullable=False)
     account_number = Column(String)
     statement_period_start = Column(DateTime)
@@ -45,14 +48,25 @@ class Statement(Base):
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    # Matched to the hot access paths; keep in sync with the migrations
+    __table_args__ = (
+        # Per-statement listings and analytics, ordered by date
+        Index("ix_transactions_statement_date", "statement_id", "transaction_date", "id"),
+        # Date-range queries (monthly summary, calendar)
+        Index("ix_transactions_date", "transaction_date", "id"),
+        # Review queues and category reports within a date range
+        Index("ix_transactions_status_date", "status", "transaction_date"),
+        Index("ix_transactions_category_date", "category", "transaction_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     statement_id = Column(Integer, ForeignKey("statements.id"), nullable=False)
 
     transaction_date = Column(DateTime, nullable=False)
     description = Column(Text, nullable=False)
-    amount = Column(Float, nullable=False)
-    balance = Column(Float)
+    # Money is stored as exact integer cents; `amount`/`balance` are decimal views
+    amount_cents = Column(Integer, nullable=False)
+    balance_cents = Column(Integer)
     reference = Column(String)
 
     # Categorization
@@ -65,10 +79,38 @@ class Transaction(Base):
     reviewed_at = Column(DateTime)
     edited_at = Column(DateTime)
     original_description = Column(Text)
-    original_amount = Column(Float)
+    original_amount_cents = Column(Integer)
 
     # Relations
     statement = relationship("Statement", back_populates="transactions")
 
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @hybrid_property
+    def amount(self):
+        return from_cents(self.amount_cents)
+
+    @amount.setter
+    def amount(self, value):
+        self.amount_cents = to_cents(value)
+
+    @amount.expression
+    def amount(cls):
+        return cls.amount_cents / 100.0
+
+    @hybrid_property
+    def balance(self):
+        return from_cents(self.balance_cents)
+
+    @balance.setter
+    def balance(self, value):
+        self.balance_cents = to_cents(value)
+
+    @hybrid_property
+    def original_amount(self):
+        return from_cents(self.original_amount_cents)
+
+    @original_amount.setter
+    def original_amount(self, value):
+        self.original_amount_cents = to_cents(value)
@@ -1,4 +1,7 @@
 from .base_parser import BaseParser
+from .document import ParsedDocument, open_document
+from .fingerprint import BankFingerprintIndex
+from .batch import TransactionBatch, TransactionRow
 from .hsbc_parser import HSBCParser
 from .dbs_parser import DBSParser
 from .ocbc_parser import OCBCParser
@@ -17,6 +20,8 @@ BANK_PARSERS = {
     "GXS": GXSParser,
 }
 
+BANK_FINGERPRINTS = BankFingerprintIndex(BANK_PARSERS)
+
 def get_parser(bank_name: str):
     parser_class = BANK_PARSERS.get(bank_name)
     if parser_class:
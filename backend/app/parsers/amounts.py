@@ -0,0 +1,72 @@
+import re
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Iterable, List, Optional
+
+# Currency tokens that may lead or trail an amount
+_CURRENCY = r"(?:SGD|USD|US\$|S\$|\$)"
+
+# One compiled pattern for every amount layout we see in statements:
+#   1,234.56   1 234.56   -1,234.56   1,234.56-   (1,234.56)   1,234.56 CR
+#   SGD 1,234.56 DR   S$12.50   12.50 SGD
+_AMOUNT = re.compile(
+    rf"""^\s*
+    (?P<open>\()?\s*
+    (?P<lead>[-+])?\s*
+    {_CURRENCY}?\s*
+    (?P<lead2>[-+])?\s*
+    (?P<whole>\d{{1,3}}(?:[ \u00a0]\d{{3}})+|\d[\d,]*|)
+    (?:\.(?P<frac>\d+))?\s*
+    {_CURRENCY}?\s*
+    (?P<close>\))?\s*
+    (?P<trail>-)?\s*
+    (?P<suffix>CR|DR)?\.?\s*$""",
+    re.IGNORECASE | re.VERBOSE
+)
+
+def parse_cents(value: Optional[str]) -> Optional[int]:
+    """Parse one amount cell to signed integer cents; None if blank or not an amount"""
+    if not value:
+        return None
+    match = _AMOUNT.match(value)
+    if not match:
+        return None
+    whole, frac = match.group("whole"), match.group("frac")
+    if not whole and not frac:
+        return None
+
+    whole = re.sub(r"[,\s]", "", whole) or "0"
+    if not frac:
+        cents = int(whole) * 100
+    elif len(frac) <= 2:
+        cents = int(whole) * 100 + int(frac.ljust(2, "0"))
+    else:
+        cents = int((Decimal(f"{whole}.{frac}") * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+    negative = (
+        (match.group("open") and match.group("close"))
+        or match.group("lead") == "-"
+        or match.group("lead2") == "-"
+        or match.group("trail")
+        or (match.group("suffix") or "").upper() == "DR"
+    )
+    return -cents if negative else cents
+
+def to_cents(amount) -> Optional[int]:
+    """Integer cents of a legacy float/Decimal/string amount in dollars; None stays None"""
+    if amount is None:
+        return None
+    if isinstance(amount, str):
+        return parse_cents(amount)
+    return int((Decimal(str(amount)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+def parse_cents_column(values: Iterable[Optional[str]]) -> List[Optional[int]]:
+    """Parse a whole column of amount cells; repeated cells are only parsed once"""
+    seen = {}
+    column = []
+    for value in values:
+        if value in seen:
+            column.append(seen[value])
+        else:
+            cents = seen[value] = parse_cents(value)
+            column.append(cents)
+    return column
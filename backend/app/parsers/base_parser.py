@@ -1,24 +1,34 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
-import pdfplumber
+from typing import List, Dict, Optional, Tuple
 import re
 from datetime import datetime
-import dateparser
+from .document import ParsedDocument, open_document
+from .dates import DateParser
+from .amounts import parse_cents, parse_cents_column
+from .batch import TransactionBatch
 
 class BaseParser(ABC):
     """Base class for all bank statement parsers"""
 
+    # (pattern, weight) pairs identifying the bank, matched case-insensitively.
+    # Stronger signatures first: they are also compiled into BankFingerprintIndex.
+    SIGNATURES: List[Tuple[str, int]] = []
+
+    # strptime formats tried before falling back to dateparser; formats without a
+    # year take it from the statement period
+    DATE_FORMATS: List[str] = ["%d %b %Y", "%d %B %Y", "%d/%m/%Y", "%d/%m/%y", "%d-%m-%Y", "%d-%b-%Y", "%d %b"]
+
     def __init__(self):
         self.bank_name = ""
         self.account_number = None
         self.period_start = None
         self.period_end = None
         self.transactions = []
+        self.date_parser = DateParser(self.DATE_FORMATS)
 
-    @abstractmethod
     def detect_bank(self, text: str) -> bool:
         """Detect if the PDF is from this bank"""
-        pass
+        return any(re.search(pattern, text, re.IGNORECASE) for pattern, _ in self.SIGNATURES)
 
     @abstractmethod
     def extract_account_info(self, text: str) -> Dict:
@@ -26,16 +36,20 @@ class BaseParser(ABC):
         pass
 
     @abstractmethod
-    def extract_transactions(self, pdf_path: str) -> List[Dict]:
+    def extract_transactions(self, document: ParsedDocument) -> TransactionBatch:
         """Extract transactions from PDF"""
         pass
 
-    def parse(self, pdf_path: str) -> Dict:
-        """Main parsing method"""
-        with pdfplumber.open(pdf_path) as pdf:
-            full_text = ""
-            for page in pdf.pages:
-                full_text += page.extract_text() or ""
+    def parse(self, source) -> Dict:
+        """Main parsing method
+
+        `source` is a PDF path, file object or bytes, or an already open
+        ParsedDocument; passing the document used for bank detection avoids
+        re-reading its pages.
+        """
+        with open_document(source) as document:
+            document.prefetch()
+            full_text = document.text()
 
             # Detect bank
             if not self.detect_bank(full_text):
@@ -43,9 +57,12 @@ class BaseParser(ABC):
 
             # Extract account info
             account_info = self.extract_account_info(full_text)
+            self.period_start = account_info.get("period_start")
+            self.period_end = account_info.get("period_end")
+            self.date_parser.set_period(self.period_start, self.period_end)
 
             # Extract transactions
-            transactions = self.extract_transactions(pdf_path)
+            transactions = self.extract_transactions(document)
 
             return {
                 "bank_name": self.bank_name,
@@ -55,26 +72,48 @@ class BaseParser(ABC):
                 "transactions": transactions
             }
 
+    def build_debit_credit_transactions(self, rows: List[Tuple]) -> TransactionBatch:
+        """Build transactions from (date, description, debit, credit, balance) rows.
+
+        Amount columns are converted to integer cents a whole column at a time.
+        Debits are stored negative and credits positive.
+        """
+        batch = TransactionBatch()
+        if not rows:
+            return batch
+        dates, descriptions, debits, credits, balances = zip(*rows)
+        debit_cents = parse_cents_column(debits)
+        credit_cents = parse_cents_column(credits)
+        balance_cents = parse_cents_column(balances)
+
+        for i in range(len(rows)):
+            amount = 0
+            if debits[i] and debits[i].strip():
+                amount = -abs(debit_cents[i] or 0)
+            elif credits[i] and credits[i].strip():
+                amount = abs(credit_cents[i] or 0)
+            batch.append(dates[i], descriptions[i], amount, (balance_cents[i] or 0) if balances[i] else None)
+        return batch
+
+    def build_signed_transactions(self, rows: List[Tuple]) -> TransactionBatch:
+        """Build transactions from (date, description, signed amount, balance) rows"""
+        batch = TransactionBatch()
+        if not rows:
+            return batch
+        dates, descriptions, amounts, balances = zip(*rows)
+        amount_cents = parse_cents_column(amounts)
+        balance_cents = parse_cents_column(balances)
+
+        for i in range(len(rows)):
+            batch.append(dates[i], descriptions[i], amount_cents[i] or 0, (balance_cents[i] or 0) if balances[i] else None)
+        return batch
+
     def clean_amount(self, amount_str: str) -> float:
         """Clean and convert amount string to float"""
-        if not amount_str:
-            return 0.0
-        # Remove currency symbols and spaces
-        cleaned = re.sub(r'[SGD$,\s]', '', amount_str)
-        # Handle negative amounts in parentheses
-        if '(' in cleaned and ')' in cleaned:
-            cleaned = '-' + cleaned.replace('(', '').replace(')', '')
-        try:
-            return float(cleaned)
-        except ValueError:
-            return 0.0
+        return (parse_cents(amount_str) or 0) / 100
 
     def parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse date string to datetime object"""
         if not date_str:
             return None
-        try:
-            parsed_date = dateparser.parse(date_str)
-            return parsed_date
-        except:
-            return None
+        return self.date_parser.parse(date_str)
@@ -0,0 +1,138 @@
+from array import array
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Sequence
+from .amounts import to_cents
+
+class TransactionBatch:
+    """Columnar transactions for one statement, filled by a parser and consumed in place.
+
+    Amounts live in typed arrays of integer cents instead of one dict per row. The
+    categorizer writes its columns into the same batch, and persistence reads the
+    columns directly. Iterating or indexing yields lightweight `TransactionRow`
+    views that behave like the per-row dicts parsers used to return.
+    """
+
+    __slots__ = (
+        "dates", "descriptions", "amount_cents", "balance_cents", "has_balance",
+        "categories", "confidence_scores", "auto_categorized"
+    )
+
+    def __init__(self):
+        self.dates: List[datetime] = []
+        self.descriptions: List[str] = []
+        self.amount_cents = array("q")
+        self.balance_cents = array("q")
+        self.has_balance = bytearray()
+        # Filled by TransactionCategorizer.batch_categorize
+        self.categories: List[str] = []
+        self.confidence_scores = array("d")
+        self.auto_categorized = bytearray()
+
+    def append(self, date: datetime, description: str, amount_cents: int, balance_cents: Optional[int] = None):
+        self.dates.append(date)
+        self.descriptions.append(description)
+        self.amount_cents.append(amount_cents)
+        self.balance_cents.append(balance_cents or 0)
+        self.has_balance.append(balance_cents is not None)
+
+    @classmethod
+    def from_dicts(cls, transactions: List[Dict]) -> "TransactionBatch":
+        """Build a batch from legacy per-row dicts, with amounts in cents or in dollars ("amount", "balance")"""
+        batch = cls()
+        for trans in transactions:
+            amount_cents = trans["amount_cents"] if "amount_cents" in trans else to_cents(trans.get("amount"))
+            balance_cents = trans["balance_cents"] if "balance_cents" in trans else to_cents(trans.get("balance"))
+            batch.append(trans["date"], trans["description"], amount_cents or 0, balance_cents)
+        return batch
+
+    @property
+    def is_categorized(self) -> bool:
+        return len(self.categories) == len(self.dates)
+
+    def set_categories(self, categories: List[str], confidence_scores: array, auto_categorized: bool = True):
+        """Store categorizer output for every row"""
+        self.categories = categories
+        self.confidence_scores = confidence_scores
+        self.auto_categorized = bytearray([auto_categorized]) * len(categories)
+
+    def balance_at(self, index: int) -> Optional[int]:
+        return self.balance_cents[index] if self.has_balance[index] else None
+
+    def insert_columns(self, statement_id: int) -> Dict[str, Sequence]:
+        """Column values for the transactions table, one sequence per column"""
+        count = len(self.dates)
+        return {
+            "statement_id": [statement_id] * count,
+            "transaction_date": self.dates,
+            "description": self.descriptions,
+            "amount_cents": self.amount_cents,
+            "balance_cents": [
+                cents if has_balance else None for cents, has_balance in zip(self.balance_cents, self.has_balance)
+            ],
+            "category": self.categories,
+            "confidence_score": self.confidence_scores,
+            "auto_categorized": [bool(flag) for flag in self.auto_categorized]
+        }
+
+    def to_dicts(self) -> List[Dict]:
+        return [dict(row) for row in self]
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, index: int) -> "TransactionRow":
+        if index < 0:
+            index += len(self.dates)
+        if not 0 <= index < len(self.dates):
+            raise IndexError("transaction index out of range")
+        return TransactionRow(self, index)
+
+    def __iter__(self) -> Iterator["TransactionRow"]:
+        for i in range(len(self.dates)):
+            yield TransactionRow(self, i)
+
+class TransactionRow(Mapping):
+    """Read-only dict-compatible view of one row of a TransactionBatch"""
+
+    __slots__ = ("_batch", "_index")
+
+    _BASE_KEYS = ("date", "description", "amount_cents", "balance_cents", "amount", "balance")
+    _CATEGORY_KEYS = ("category", "confidence_score", "auto_categorized")
+
+    def __init__(self, batch: TransactionBatch, index: int):
+        self._batch = batch
+        self._index = index
+
+    def _keys(self):
+        return self._BASE_KEYS + self._CATEGORY_KEYS if self._batch.is_categorized else self._BASE_KEYS
+
+    def __getitem__(self, key):
+        batch, i = self._batch, self._index
+        if key == "date":
+            return batch.dates[i]
+        if key == "description":
+            return batch.descriptions[i]
+        if key == "amount_cents":
+            return batch.amount_cents[i]
+        if key == "balance_cents":
+            return batch.balance_at(i)
+        if key == "amount":
+            return batch.amount_cents[i] / 100
+        if key == "balance":
+            balance = batch.balance_at(i)
+            return None if balance is None else balance / 100
+        if batch.is_categorized:
+            if key == "category":
+                return batch.categories[i]
+            if key == "confidence_score":
+                return batch.confidence_scores[i]
+            if key == "auto_categorized":
+                return bool(batch.auto_categorized[i])
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self):
+        return len(self._keys())
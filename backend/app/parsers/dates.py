@@ -0,0 +1,76 @@
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import dateparser
+
+_WHITESPACE = re.compile(r"\s+")
+_HAS_DIGIT = re.compile(r"\d")
+
+# Transactions posted shortly after the period end keep the period's year
+YEAR_INFERENCE_SLACK = timedelta(days=31)
+
+class DateParser:
+    """Date parser for one statement: strptime over the bank's declared formats first,
+    memoized per distinct string, with dateparser only as the fallback.
+
+    Formats without a year ("%d %b") take their year from the statement period,
+    so a December row on a December-January statement lands in the right year.
+    """
+
+    def __init__(self, formats: List[str], max_cache_size: int = 4096):
+        self.formats = formats
+        self.max_cache_size = max_cache_size
+        self.period_start: Optional[datetime] = None
+        self.period_end: Optional[datetime] = None
+        self._cache: Dict[str, Optional[datetime]] = {}
+        self._dated_formats = [fmt for fmt in formats if "%Y" in fmt or "%y" in fmt]
+        self._yearless_formats = [fmt for fmt in formats if fmt not in self._dated_formats]
+
+    def set_period(self, period_start: Optional[datetime], period_end: Optional[datetime]):
+        """Use the statement period to infer years; clears memoized results"""
+        self.period_start = period_start
+        self.period_end = period_end
+        self._cache.clear()
+
+    def parse(self, date_str: str) -> Optional[datetime]:
+        """Parse a date cell, or return None for cells that are not dates"""
+        key = _WHITESPACE.sub(" ", date_str.strip())
+        if key in self._cache:
+            return self._cache[key]
+
+        result = self._parse_uncached(key)
+        if len(self._cache) >= self.max_cache_size:
+            self._cache.clear()
+        self._cache[key] = result
+        return result
+
+    def _parse_uncached(self, value: str) -> Optional[datetime]:
+        # Every supported date has a digit; header and junk cells are rejected here
+        if not _HAS_DIGIT.search(value):
+            return None
+
+        for fmt in self._dated_formats:
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+
+        reference = self.period_end or self.period_start
+        if reference and self._yearless_formats:
+            for fmt in self._yearless_formats:
+                try:
+                    # Parse with the year attached so 29 Feb is validated against the right year
+                    parsed = datetime.strptime(f"{value} {reference.year}", f"{fmt} %Y")
+                except ValueError:
+                    continue
+                if self.period_end and parsed > self.period_end + YEAR_INFERENCE_SLACK:
+                    try:
+                        parsed = datetime.strptime(f"{value} {reference.year - 1}", f"{fmt} %Y")
+                    except ValueError:
+                        pass
+                return parsed
+
+        try:
+            return dateparser.parse(value)
+        except Exception:
+            return None
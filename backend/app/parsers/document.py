@@ -0,0 +1,167 @@
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+from pdfminer.pdftypes import resolve1
+from app.core.config import settings
+from .parallel import should_parallelize, extract_pages_parallel
+from .sources import open_pdf
+from .extraction_cache import extraction_cache
+
+class ParsedDocument:
+    """A statement PDF opened once per upload, with lazily cached per-page text and tables.
+
+    Detection, account-info extraction and transaction extraction all read from the
+    same instance, so each page is laid out by pdfplumber at most once per kind of
+    extraction no matter how many steps look at it.
+
+    `source` is a path, a binary file object or the PDF's bytes, so an upload can
+    be parsed from memory without first being written to disk.
+
+    When `file_hash` is given, raw extraction results are read from and written to
+    the on-disk extraction cache, so a cached file never needs pdfplumber at all.
+    """
+
+    def __init__(self, source, file_hash: Optional[str] = None):
+        self.source = source
+        self.file_hash = file_hash
+        self._pdf = None
+        self._page_count: Optional[int] = None
+        self._metadata: Optional[Dict] = None
+        self._fonts: Dict[int, List[str]] = {}
+        self._text: Dict[int, str] = {}
+        self._tables: Dict[int, List[List]] = {}
+        self.from_cache = False
+        self._complete = False
+
+        if file_hash and settings.EXTRACTION_CACHE_ENABLED:
+            entry = extraction_cache.get(file_hash)
+            if entry:
+                self._load_cache_entry(entry)
+
+    @property
+    def pdf(self):
+        """The underlying pdfplumber document, opened on first use"""
+        if self._pdf is None:
+            self._pdf = open_pdf(self.source)
+        return self._pdf
+
+    @property
+    def page_count(self) -> int:
+        if self._page_count is None:
+            self._page_count = len(self.pdf.pages)
+        return self._page_count
+
+    @property
+    def metadata(self) -> Dict:
+        """Document info dictionary (Producer, Creator, Title, ...)"""
+        if self._metadata is None:
+            self._metadata = self.pdf.metadata or {}
+        return self._metadata
+
+    def font_names(self, page_number: int) -> List[str]:
+        """Base font names declared in a page's resources, read without any layout analysis"""
+        if page_number in self._fonts:
+            return self._fonts[page_number]
+        names = []
+        try:
+            fonts = resolve1(self.pdf.pages[page_number].page_obj.resources.get("Font")) or {}
+            for font in fonts.values():
+                base_font = resolve1(font).get("BaseFont")
+                names.append(getattr(base_font, "name", str(base_font)))
+        except Exception:
+            pass
+        self._fonts[page_number] = names
+        return names
+
+    def page_text(self, page_number: int) -> str:
+        """Text of a single page (0-based)"""
+        if page_number not in self._text:
+            self._text[page_number] = self.pdf.pages[page_number].extract_text() or ""
+        return self._text[page_number]
+
+    def page_tables(self, page_number: int) -> List[List]:
+        """Tables of a single page (0-based)"""
+        if page_number not in self._tables:
+            self._tables[page_number] = self.pdf.pages[page_number].extract_tables()
+        return self._tables[page_number]
+
+    def prefetch(self):
+        """Extract text and tables for every page up front, in parallel when the document is large.
+
+        Pages are merged back in page order; anything already cached is kept. If the
+        process pool is unavailable, pages are extracted serially instead. Documents
+        with a file hash are then written to the extraction cache; without one,
+        serial extraction stays lazy.
+        """
+        if self._complete:
+            return
+
+        page_count = self.page_count
+        if len(self._tables) < page_count and should_parallelize(self.source, page_count):
+            try:
+                pages = extract_pages_parallel(self.source, page_count)
+            except Exception:
+                pages = []
+            for page_number, (text, tables) in enumerate(pages):
+                self._text.setdefault(page_number, text)
+                self._tables.setdefault(page_number, tables)
+
+        if self.file_hash and settings.EXTRACTION_CACHE_ENABLED:
+            for page_number in range(page_count):
+                self.page_text(page_number)
+                self.page_tables(page_number)
+            extraction_cache.put(self.file_hash, self._cache_entry())
+            self._complete = True
+
+    def _cache_entry(self) -> Dict:
+        metadata = {key: value for key, value in self.metadata.items() if isinstance(value, str)}
+        return {
+            "page_count": self.page_count,
+            "metadata": metadata,
+            "fonts": self.font_names(0) if self.page_count else [],
+            "pages": [[self._text[i], self._tables[i]] for i in range(self.page_count)]
+        }
+
+    def _load_cache_entry(self, entry: Dict):
+        self._page_count = entry["page_count"]
+        self._metadata = entry["metadata"]
+        self._fonts[0] = entry["fonts"]
+        for page_number, (text, tables) in enumerate(entry["pages"]):
+            self._text[page_number] = text
+            self._tables[page_number] = tables
+        self.from_cache = True
+        self._complete = True
+
+    def text(self, max_pages: Optional[int] = None) -> str:
+        """Text of the first `max_pages` pages, or the whole document"""
+        count = self.page_count if max_pages is None else min(max_pages, self.page_count)
+        return "\n".join(self.page_text(i) for i in range(count))
+
+    def iter_tables(self) -> Iterator[List]:
+        """Yield every table in the document in page order"""
+        for page_number in range(self.page_count):
+            for table in self.page_tables(page_number):
+                yield table
+
+    def close(self):
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+@contextmanager
+def open_document(source):
+    """Yield a ParsedDocument for `source`, reusing it if it already is one.
+
+    Documents created here are closed on exit; documents passed in are left open
+    for the caller that owns them.
+    """
+    if isinstance(source, ParsedDocument):
+        yield source
+        return
+    with ParsedDocument(source) as document:
+        yield document
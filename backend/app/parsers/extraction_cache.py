@@ -0,0 +1,170 @@
+import atexit
+import gzip
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Dict, Optional
+import pdfplumber
+from app.core.config import settings
+
+# Bump the suffix whenever the raw extraction (not row interpretation) changes
+EXTRACTOR_VERSION = f"pdfplumber-{pdfplumber.__version__}-1"
+
+# Each process keeps its own hit/miss/eviction counts and writes them to its own
+# file in this subdirectory; stats() sums the files
+COUNTERS_DIRNAME = "counters"
+# At most one counter write per process in this many seconds
+COUNTER_FLUSH_SECONDS = 2.0
+
+class ExtractionCache:
+    """On-disk cache of raw per-page text and tables, keyed by file hash and extractor version.
+
+    Entries are gzip-compressed JSON. Parser changes that only affect how rows are
+    interpreted can be re-applied to stored statements straight from this cache,
+    without running pdfplumber again. The directory is kept under `max_bytes` by
+    evicting the least recently used entries.
+
+    Lookups happen in the ingestion parse processes and in every server worker,
+    so counters are kept in memory per process and flushed (every
+    COUNTER_FLUSH_SECONDS and at exit) to a per-process file that no other
+    process writes, keeping lookups free of any shared lock.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, version: str = EXTRACTOR_VERSION):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.version = version
+        self._lock = threading.Lock()
+        self._pid = None
+        self._counts: Dict[str, int] = {}
+        self._counts_name = ""
+        self._flushed_at = 0.0
+        atexit.register(self.flush)
+
+    def _own_counts(self) -> Dict[str, int]:
+        # Called with the lock held. A forked child starts its own counts and file.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._counts = {"hits": 0, "misses": 0, "evictions": 0}
+            self._counts_name = f"{self._pid}-{uuid.uuid4().hex}.json"
+            self._flushed_at = 0.0
+        return self._counts
+
+    def _count(self, name: str):
+        with self._lock:
+            self._own_counts()[name] += 1
+            due = time.monotonic() - self._flushed_at >= COUNTER_FLUSH_SECONDS
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Write this process's counters to its file in the counters directory"""
+        with self._lock:
+            counts = dict(self._own_counts())
+            self._flushed_at = time.monotonic()
+            directory = os.path.join(self.directory, COUNTERS_DIRNAME)
+            path = os.path.join(directory, self._counts_name)
+            # Counters are informational; failing to write them never fails a lookup
+            try:
+                os.makedirs(directory, exist_ok=True)
+                with open(f"{path}.part", "w") as f:
+                    json.dump(counts, f)
+                os.replace(f"{path}.part", path)
+            except OSError:
+                pass
+
+    def counters(self) -> Dict[str, int]:
+        """Hits, misses and evictions summed over every process that used this directory"""
+        self.flush()
+        totals = {"hits": 0, "misses": 0, "evictions": 0}
+        directory = os.path.join(self.directory, COUNTERS_DIRNAME)
+        for name in os.listdir(directory) if os.path.isdir(directory) else []:
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(directory, name)) as f:
+                    counts = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for key in totals:
+                totals[key] += int(counts.get(key, 0))
+        return totals
+
+    def _path(self, file_hash: str) -> str:
+        return os.path.join(self.directory, f"{file_hash}.{self.version}.json.gz")
+
+    def get(self, file_hash: str) -> Optional[Dict]:
+        """Cached extraction for a file, or None"""
+        path = self._path(file_hash)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+            # Refresh the mtime so eviction treats the entry as recently used
+            os.utime(path)
+        except (OSError, ValueError):
+            self._count("misses")
+            return None
+        self._count("hits")
+        return entry
+
+    def put(self, file_hash: str, entry: Dict):
+        """Store an extraction and evict old entries if the cache is over budget"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(file_hash)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.part"
+        try:
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(entry, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self.evict()
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json.gz"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+        return entries
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits in max_bytes"""
+        if not os.path.isdir(self.directory):
+            return
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            total -= size
+            self._count("evictions")
+
+    def stats(self) -> Dict:
+        entries = self._entries() if os.path.isdir(self.directory) else []
+        counts = self.counters()
+        lookups = counts["hits"] + counts["misses"]
+        return {
+            "version": self.version,
+            "hits": counts["hits"],
+            "misses": counts["misses"],
+            "evictions": counts["evictions"],
+            "hit_rate": round(counts["hits"] / lookups, 4) if lookups else 0.0,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes
+        }
+
+extraction_cache = ExtractionCache(settings.EXTRACTION_CACHE_DIR, settings.EXTRACTION_CACHE_MAX_BYTES)
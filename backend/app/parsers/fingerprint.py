@@ -0,0 +1,72 @@
+import re
+from typing import Dict, Optional, Tuple
+from .document import ParsedDocument
+
+class BankFingerprintIndex:
+    """Single-pass bank detector built from every parser's SIGNATURES.
+
+    All signatures are compiled into one case-insensitive alternation, so a page
+    of text is scanned once regardless of how many banks are supported. Every
+    match adds its weight to its bank's score and the highest score wins, which
+    makes the result independent of parser registration order.
+    """
+
+    # A bank is conclusive once it reaches this score and at least doubles the runner-up
+    CONCLUSIVE_SCORE = 3
+
+    def __init__(self, parsers: Dict[str, type], max_pages: int = 1, fallback_pages: int = 2):
+        # Pages read for any match, and the limit when none of them matched at all
+        self.max_pages = max_pages
+        self.fallback_pages = max(fallback_pages, max_pages)
+        self._groups: Dict[str, Tuple[str, int]] = {}
+        alternatives = []
+        for bank_name, parser_class in parsers.items():
+            for pattern, weight in parser_class.SIGNATURES:
+                group = f"s{len(self._groups)}"
+                self._groups[group] = (bank_name, weight)
+                alternatives.append(f"(?P<{group}>{pattern})")
+        self._matcher = re.compile("|".join(alternatives), re.IGNORECASE)
+
+    def score(self, text: str, scores: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+        """Add the weight of every signature found in `text` to `scores`"""
+        scores = {} if scores is None else scores
+        for match in self._matcher.finditer(text):
+            bank_name, weight = self._groups[match.lastgroup]
+            scores[bank_name] = scores.get(bank_name, 0) + weight
+        return scores
+
+    def best(self, scores: Dict[str, int]) -> Optional[str]:
+        if not scores:
+            return None
+        return max(scores, key=scores.get)
+
+    def is_conclusive(self, scores: Dict[str, int]) -> bool:
+        ranked = sorted(scores.values(), reverse=True)
+        if not ranked or ranked[0] < self.CONCLUSIVE_SCORE:
+            return False
+        return len(ranked) == 1 or ranked[0] >= 2 * ranked[1]
+
+    def metadata_text(self, document: ParsedDocument) -> str:
+        """Producer/creator/title strings and first-page font names, none of which need text extraction"""
+        values = [str(value) for value in document.metadata.values() if isinstance(value, (str, bytes))]
+        if document.page_count:
+            # Subset fonts look like "ABCDEF+DBSSans-Bold"; split so word boundaries apply
+            values.extend(re.sub(r"[+\-,_]", " ", name) for name in document.font_names(0))
+        return " ".join(values)
+
+    def detect(self, document: ParsedDocument) -> Optional[str]:
+        """Detect the bank from metadata first, then page text one page at a time.
+
+        Only the first `max_pages` pages are read unless nothing has matched yet,
+        in which case reading continues up to `fallback_pages`.
+        """
+        scores = self.score(self.metadata_text(document))
+        if self.is_conclusive(scores):
+            return self.best(scores)
+
+        for page_number in range(min(self.fallback_pages, document.page_count)):
+            self.score(document.page_text(page_number), scores)
+            if self.is_conclusive(scores) or (scores and page_number + 1 >= self.max_pages):
+                break
+
+        return self.best(scores)
@@ -1,19 +1,25 @@
 import re
-import pdfplumber
-from typing import List, Dict
+from typing import Dict
 from .base_parser import BaseParser
+from .document import ParsedDocument
+from .batch import TransactionBatch
 
 class OCBCParser(BaseParser):
     """Parser for OCBC bank statements"""
 
+    # (pattern, weight) pairs used for bank detection
+    SIGNATURES = [
+        (r"\bOVERSEA-CHINESE\s+BANKING\b", 5),
+        (r"\bOCBC\s+BANK\b", 3),
+        (r"\bOCBC\b", 1),
+    ]
+
+    DATE_FORMATS = ["%d %b %Y", "%d/%m/%Y", "%d %b"]
+
     def __init__(self):
         super().__init__()
         self.bank_name = "OCBC"
 
-    def detect_bank(self, text: str) -> bool:
-        """Detect if this is an OCBC statement"""
-        return "OCBC BANK" in text.upper() or "OCBC" in text.upper()
-
     def extract_account_info(self, text: str) -> Dict:
         """Extract account information from OCBC statement"""
         info = {}
@@ -31,57 +37,39 @@ class OCBCParser(BaseParser):
 
         return info
 
-    def extract_transactions(self, pdf_path: str) -> List[Dict]:
+    def extract_transactions(self, document: ParsedDocument) -> TransactionBatch:
         """Extract transactions from OCBC statement"""
-        transactions = []
+        rows = []
+
+        for table in document.iter_tables():
+            if not table:
+                continue
+
+            for row in table:
+                if not row or len(row) < 3:
+                    continue
 
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                tables = page.extract_tables()
+                # Skip header rows
+                if any(header in str(row).upper() for header in ["DATE", "DESCRIPTION", "TRANSACTION", "BALANCE"]):
+                    continue
 
-                for table in tables:
-                    if not table:
+                # OCBC format: Date | Description | Debit | Credit | Balance
+                try:
+                    date_str = row[0] if row[0] else ""
+                    description = row[1] if len(row) > 1 and row[1] else ""
+                    debit = row[2] if len(row) > 2 and row[2] else ""
+                    credit = row[3] if len(row) > 3 and row[3] else ""
+                    balance = row[4] if len(row) > 4 and row[4] else ""
+
+                    if not date_str or not description:
+                        continue
+
+                    transaction_date = self.parse_date(date_str)
+                    if not transaction_date:
                         continue
 
-                    for row in table:
-                        if not row or len(row) < 3:
-                            continue
-
-                        # Skip header rows
-                        if any(header in str(row).upper() for header in ["DATE", "DESCRIPTION", "TRANSACTION", "BALANCE"]):
-                            continue
-
-                        # OCBC format: Date | Description | Debit | Credit | Balance
-                        try:
-                            date_str = row[0] if row[0] else ""
-                            description = row[1] if len(row) > 1 and row[1] else ""
-                            debit = row[2] if len(row) > 2 and row[2] else ""
-                            credit = row[3] if len(row) > 3 and row[3] else ""
-                            balance = row[4] if len(row) > 4 and row[4] else ""
-
-                            if not date_str or not description:
-                                continue
-
-                            transaction_date = self.parse_date(date_str)
-                            if not transaction_date:
-                                continue
-
-                            # Determine amount (debit is negative)
-                            amount = 0.0
-                            if debit and debit.strip():
-                                amount = -abs(self.clean_amount(debit))
-                            elif credit and credit.strip():
-                                amount = abs(self.clean_amount(credit))
-
-                            balance_amount = self.clean_amount(balance) if balance else None
-
-                            transactions.append({
-                                "date": transaction_date,
-                                "description": description.strip(),
-                                "amount": amount,
-                                "balance": balance_amount
-                            })
-                        except Exception as e:
-                            continue
-
-        return transactions
+                    rows.append((transaction_date, description.strip(), debit, credit, balance))
+                except Exception as e:
+                    continue
+
+        return self.build_debit_credit_transactions(rows)
@@ -0,0 +1,67 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+from app.core.config import settings
+from .sources import is_reopenable, open_pdf
+
+# Worker processes are spawned, never forked: pools are created lazily from
+# request and job threads, and forking while another thread holds a lock
+# (logging, the SQLAlchemy connection pool) can deadlock the child
+PROCESS_CONTEXT = multiprocessing.get_context("spawn")
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def get_executor() -> ProcessPoolExecutor:
+    """Process pool shared by every parse in this process, created on first use"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ProcessPoolExecutor(
+                    max_workers=settings.PARALLEL_EXTRACTION_WORKERS, mp_context=PROCESS_CONTEXT
+                )
+    return _executor
+
+def should_parallelize(source, page_count: int) -> bool:
+    """Only large documents are worth the cost of reopening them in workers.
+
+    Paths and in-memory bytes can be reopened there; open file objects cannot.
+    """
+    return (
+        settings.PARALLEL_EXTRACTION_ENABLED
+        and settings.PARALLEL_EXTRACTION_WORKERS > 1
+        and page_count >= settings.PARALLEL_EXTRACTION_MIN_PAGES
+        and is_reopenable(source)
+    )
+
+def split_pages(page_count: int, workers: int) -> List[Tuple[int, int]]:
+    """Split [0, page_count) into at most `workers` contiguous (start, stop) ranges"""
+    size, extra = divmod(page_count, workers)
+    ranges = []
+    start = 0
+    for i in range(min(workers, page_count)):
+        stop = start + size + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+def _extract_page_range(source, start: int, stop: int) -> List[Tuple[str, List]]:
+    """Worker entry point: open the PDF and return (text, tables) for pages [start, stop)"""
+    with open_pdf(source) as pdf:
+        results = []
+        for page in pdf.pages[start:stop]:
+            results.append((page.extract_text() or "", page.extract_tables()))
+            page.close()
+        return results
+
+def extract_pages_parallel(source, page_count: int) -> List[Tuple[str, List]]:
+    """(text, tables) for every page, extracted across the process pool and returned in page order"""
+    executor = get_executor()
+    ranges = split_pages(page_count, settings.PARALLEL_EXTRACTION_WORKERS)
+    futures = [executor.submit(_extract_page_range, source, start, stop) for start, stop in ranges]
+    pages = []
+    for future in futures:
+        pages.extend(future.result())
+    return pages
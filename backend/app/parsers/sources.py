@@ -0,0 +1,19 @@
+import io
+import os
+import pdfplumber
+
+# In-memory PDFs, e.g. an upload that was never written to disk
+PDF_BYTES_TYPES = (bytes, bytearray, memoryview)
+
+def open_pdf(source):
+    """Open a pdfplumber document from a path, a binary file object or the PDF's bytes.
+
+    Bytes are wrapped in a BytesIO, which shares the buffer instead of copying it.
+    """
+    if isinstance(source, PDF_BYTES_TYPES):
+        source = io.BytesIO(source)
+    return pdfplumber.open(source)
+
+def is_reopenable(source) -> bool:
+    """Whether `source` can be sent to another process and opened there (paths and bytes, not file objects)"""
+    return isinstance(source, (str, os.PathLike) + PDF_BYTES_TYPES)
@@ -1,19 +1,23 @@
 import re
-import pdfplumber
-from typing import List, Dict
+from typing import Dict
 from .base_parser import BaseParser
+from .document import ParsedDocument
+from .batch import TransactionBatch
 
 class TrustParser(BaseParser):
     """Parser for Trust Bank statements"""
 
+    # (pattern, weight) pairs used for bank detection
+    SIGNATURES = [
+        (r"\bTRUST\s*BANK\b", 3),
+    ]
+
+    DATE_FORMATS = ["%d %b %Y", "%d %b"]
+
     def __init__(self):
         super().__init__()
         self.bank_name = "Trust"
 
-    def detect_bank(self, text: str) -> bool:
-        """Detect if this is a Trust Bank statement"""
-        return "TRUST BANK" in text.upper() or "TRUSTBANK" in text.upper()
-
     def extract_account_info(self, text: str) -> Dict:
         """Extract account information from Trust Bank statement"""
         info = {}
@@ -31,50 +35,38 @@ class TrustParser(BaseParser):
 
         return info
 
-    def extract_transactions(self, pdf_path: str) -> List[Dict]:
+    def extract_transactions(self, document: ParsedDocument) -> TransactionBatch:
         """Extract transactions from Trust Bank statement"""
-        transactions = []
+        rows = []
+
+        for table in document.iter_tables():
+            if not table:
+                continue
+
+            for row in table:
+                if not row or len(row) < 3:
+                    continue
 
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                tables = page.extract_tables()
+                # Skip header rows
+                if any(header in str(row).upper() for header in ["DATE", "DESCRIPTION", "TRANSACTION", "BALANCE"]):
+                    continue
 
-                for table in tables:
-                    if not table:
+                # Trust format: Date | Description | Amount | Balance
+                try:
+                    date_str = row[0] if row[0] else ""
+                    description = row[1] if len(row) > 1 and row[1] else ""
+                    amount_str = row[2] if len(row) > 2 and row[2] else ""
+                    balance = row[3] if len(row) > 3 and row[3] else ""
+
+                    if not date_str or not description:
+                        continue
+
+                    transaction_date = self.parse_date(date_str)
+                    if not transaction_date:
                         continue
 
-                    for row in table:
-                        if not row or len(row) < 3:
-                            continue
-
-                        # Skip header rows
-                        if any(header in str(row).upper() for header in ["DATE", "DESCRIPTION", "TRANSACTION", "BALANCE"]):
-                            continue
-
-                        # Trust format: Date | Description | Amount | Balance
-                        try:
-                            date_str = row[0] if row[0] else ""
-                            description = row[1] if len(row) > 1 and row[1] else ""
-                            amount_str = row[2] if len(row) > 2 and row[2] else ""
-                            balance = row[3] if len(row) > 3 and row[3] else ""
-
-                            if not date_str or not description:
-                                continue
-
-                            transaction_date = self.parse_date(date_str)
-                            if not transaction_date:
-                                continue
-
-                            amount = self.clean_amount(amount_str) if amount_str else 0.0
-                            balance_amount = self.clean_amount(balance) if balance else None
-
-                            transactions.append({
-                                "date": transaction_date,
-                                "description": description.strip(),
-                                "amount": amount,
-                                "balance": balance_amount
-                            })
-                        except Exception as e:
-                            continue
-
-        return transactions
+                    rows.append((transaction_date, description.strip(), amount_str, balance))
+                except Exception as e:
+                    continue
+
+        return self.build_signed_transactions(rows)
@@ -1,2 +1,3 @@
 from .statement_service import StatementService
 from .transaction_service import TransactionService
+from .job_service import JobQueue
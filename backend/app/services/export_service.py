@@ -0,0 +1,133 @@
+import csv
+import io
+import json
+import tempfile
+from datetime import datetime
+from typing import Iterator, List, Optional
+from openpyxl import Workbook
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.money import from_cents
+from app.models.transaction import Statement, Transaction
+from app.services.transaction_service import TransactionFilters
+
+# Exported columns, in file order
+EXPORT_COLUMNS = (
+    Transaction.id,
+    Transaction.statement_id,
+    Statement.bank_name,
+    Transaction.transaction_date,
+    Transaction.description,
+    Transaction.amount_cents,
+    Transaction.balance_cents,
+    Transaction.category,
+    Transaction.confidence_score,
+    Transaction.status,
+    Transaction.auto_categorized,
+    Transaction.reviewed_at,
+    Transaction.edited_at,
+    Transaction.original_description,
+    Transaction.original_amount_cents
+)
+HEADER = [
+    "id", "statement_id", "bank_name", "transaction_date", "description", "amount", "balance",
+    "category", "confidence_score", "status", "auto_categorized", "reviewed_at", "edited_at",
+    "original_description", "original_amount"
+]
+MONEY_FIELDS = {"amount", "balance", "original_amount"}
+
+# Rows per worksheet; Excel stops at 1,048,576 including the header row
+XLSX_SHEET_ROWS = 1048575
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "xlsx": ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "xlsx")
+}
+
+class ExportService:
+    """Streams filtered transactions out as CSV, NDJSON or XLSX in constant memory.
+
+    Rows come from a server-side cursor `batch_size` at a time and are written
+    out per batch, so neither the result set nor the file is ever held whole.
+    Each export opens its own session, because the response body is produced
+    after the request's session has been closed.
+    """
+
+    def __init__(self, batch_size: Optional[int] = None, session_factory=SessionLocal):
+        self.batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+        self.session_factory = session_factory
+
+    def _batches(self, filters: TransactionFilters) -> Iterator[List[list]]:
+        """Export rows, `batch_size` at a time, in (date, id) order with amounts as decimals"""
+        money = [HEADER.index(field) for field in MONEY_FIELDS]
+        db = self.session_factory()
+        try:
+            query = filters.apply(
+                db.query(*EXPORT_COLUMNS).join(Statement, Transaction.statement_id == Statement.id)
+            ).order_by(Transaction.transaction_date, Transaction.id).yield_per(self.batch_size)
+            batch = []
+            for row in query:
+                row = list(row)
+                for i in money:
+                    row[i] = from_cents(row[i])
+                batch.append(row)
+                if len(batch) == self.batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        finally:
+            db.close()
+
+    def csv(self, filters: TransactionFilters) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(HEADER)
+        for batch in self._batches(filters):
+            writer.writerows(
+                [value.isoformat() if isinstance(value, datetime) else value for value in row] for row in batch
+            )
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+    def ndjson(self, filters: TransactionFilters) -> Iterator[bytes]:
+        for batch in self._batches(filters):
+            yield "".join(
+                json.dumps(dict(zip(HEADER, row)), default=datetime.isoformat, ensure_ascii=False) + "\n"
+                for row in batch
+            ).encode("utf-8")
+
+    def xlsx(self, filters: TransactionFilters) -> Iterator[bytes]:
+        """XLSX via openpyxl's write-only mode.
+
+        Write-only sheets spool their rows to temporary files, and the finished
+        workbook is zipped into a temporary file that is then streamed. Memory
+        stays flat, but the first byte is only sent once every row is written,
+        since a zip's entries cannot be emitted before their sheets are complete.
+        """
+        workbook = Workbook(write_only=True)
+        sheet = None
+        sheet_rows = XLSX_SHEET_ROWS
+        for batch in self._batches(filters):
+            for row in batch:
+                if sheet_rows == XLSX_SHEET_ROWS:
+                    sheet = workbook.create_sheet(f"Transactions {len(workbook.worksheets) + 1}")
+                    sheet.append(HEADER)
+                    sheet_rows = 0
+                sheet.append(row)
+                sheet_rows += 1
+        if sheet is None:
+            workbook.create_sheet("Transactions 1").append(HEADER)
+
+        with tempfile.TemporaryFile() as output:
+            workbook.save(output)
+            output.seek(0)
+            for chunk in iter(lambda: output.read(1024 * 1024), b""):
+                yield chunk
+
+    def stream(self, filters: TransactionFilters, export_format: str) -> Iterator[bytes]:
+        return getattr(self, export_format)(filters)
@@ -0,0 +1,258 @@
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.job import IngestionJob, JobStatus
+from app.models.transaction import Statement
+from app.parsers.parallel import PROCESS_CONTEXT
+from app.services.statement_service import StatementService
+from app.services.upload_store import store_upload_bytes
+
+def _init_parse_worker():
+    # Statements are already spread across the worker processes; splitting each
+    # one's pages over another pool would only oversubscribe the cores
+    settings.PARALLEL_EXTRACTION_ENABLED = False
+
+class JobQueue:
+    """Persistent ingestion queue: jobs live in the ingestion_jobs table and run on a bounded thread pool.
+
+    Uploads return as soon as their job row is committed. Each job thread hands
+    the PDF to a process pool for parsing, so statements are parsed on every
+    core at once, then categorizes and inserts the result itself. Jobs left
+    queued or running by a previous process are picked up again by `recover`
+    at startup.
+    """
+
+    def __init__(
+        self, statement_service: StatementService, max_workers: int = settings.INGESTION_WORKERS,
+        processes: int = settings.INGESTION_PROCESSES
+    ):
+        self.statement_service = statement_service
+        self.processes = processes
+        # A thread waits on one parse at a time, so keep at least one per process
+        self.max_workers = max(max_workers, processes)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._parse_executor: Optional[ProcessPoolExecutor] = None
+        self._store_executor: Optional[ThreadPoolExecutor] = None
+        # Pools are created on first use from several job threads at once
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ingestion")
+        return self._executor
+
+    @property
+    def parse_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Process pool for `parse_statement`, or None to parse on the job threads"""
+        if self.processes < 1:
+            return None
+        if self._parse_executor is None:
+            with self._lock:
+                if self._parse_executor is None:
+                    self._parse_executor = ProcessPoolExecutor(
+                        max_workers=self.processes, mp_context=PROCESS_CONTEXT, initializer=_init_parse_worker
+                    )
+        return self._parse_executor
+
+    @property
+    def store_executor(self) -> ThreadPoolExecutor:
+        """Threads writing in-memory uploads to the content store, apart from the job threads"""
+        if self._store_executor is None:
+            with self._lock:
+                if self._store_executor is None:
+                    self._store_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="upload-store")
+        return self._store_executor
+
+    def _discard_parse_executor(self, broken: ProcessPoolExecutor):
+        """Shut down a broken process pool so the next job creates a fresh one"""
+        with self._lock:
+            if self._parse_executor is not broken:
+                # Another job thread already replaced it
+                return
+            self._parse_executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def enqueue(
+        self, db: Session, file_path: str, filename: str, file_hash: Optional[str] = None,
+        data: Optional[bytes] = None
+    ) -> IngestionJob:
+        """Record a job for an uploaded file and schedule it.
+
+        With `data`, the PDF is parsed from memory. If PERSIST_UPLOADS is set it
+        is also written to `file_path` straight away, in the background and
+        alongside the parse, so the job can still be recovered after a restart.
+        """
+        job = IngestionJob(filename=filename, file_path=file_path, file_hash=file_hash, status=JobStatus.QUEUED)
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        stored = None
+        if data is not None and settings.PERSIST_UPLOADS:
+            stored = self.store_executor.submit(store_upload_bytes, file_hash, data)
+        self.executor.submit(self._run, job.id, data, stored)
+        return job
+
+    def get_job(self, db: Session, job_id: int) -> Optional[IngestionJob]:
+        """Get a job by ID"""
+        return db.query(IngestionJob).filter(IngestionJob.id == job_id).first()
+
+    async def get_job_async(self, db: AsyncSession, job_id: int) -> Optional[IngestionJob]:
+        return await db.get(IngestionJob, job_id)
+
+    def get_active_job(self, db: Session, file_hash: str) -> Optional[IngestionJob]:
+        """Get a queued or running job for the same file, if there is one"""
+        return db.query(IngestionJob).filter(
+            IngestionJob.file_hash == file_hash,
+            IngestionJob.status.in_([JobStatus.QUEUED, JobStatus.RUNNING])
+        ).first()
+
+    def recover(self) -> int:
+        """Reschedule jobs interrupted by a restart; returns how many were resubmitted.
+
+        Every server worker calls this at startup. Queued jobs are resubmitted
+        as they are (only one worker can claim each, see `_run`), but a running
+        job is only requeued once it is older than INGESTION_STALE_AFTER_SECONDS,
+        since a younger one may still be running in a sibling worker.
+        """
+        stale_before = datetime.utcnow() - timedelta(seconds=settings.INGESTION_STALE_AFTER_SECONDS)
+        db = SessionLocal()
+        try:
+            pending = db.query(IngestionJob).filter(
+                IngestionJob.status.in_([JobStatus.QUEUED, JobStatus.RUNNING])
+            ).order_by(IngestionJob.id).all()
+
+            resubmit = []
+            for job in pending:
+                if job.status == JobStatus.RUNNING and job.started_at and job.started_at > stale_before:
+                    continue
+                if not os.path.exists(job.file_path):
+                    # An upload parsed from memory that was never written to disk
+                    values = dict(
+                        status=JobStatus.FAILED,
+                        error="Interrupted by a restart before the upload was stored; upload the file again",
+                        finished_at=datetime.utcnow()
+                    )
+                elif job.attempts >= settings.INGESTION_MAX_ATTEMPTS:
+                    values = dict(
+                        status=JobStatus.FAILED,
+                        error=f"Interrupted after {job.attempts} attempts",
+                        finished_at=datetime.utcnow()
+                    )
+                elif job.status == JobStatus.RUNNING:
+                    values = dict(status=JobStatus.QUEUED)
+                else:
+                    resubmit.append(job.id)
+                    continue
+                # Conditional on the status read above, so a job another worker
+                # changed in the meantime is left alone
+                changed = db.execute(
+                    update(IngestionJob)
+                    .where(IngestionJob.id == job.id, IngestionJob.status == job.status)
+                    .values(**values)
+                ).rowcount
+                if changed and values["status"] == JobStatus.QUEUED:
+                    resubmit.append(job.id)
+            db.commit()
+        finally:
+            db.close()
+
+        for job_id in resubmit:
+            self.executor.submit(self._run, job_id)
+        return len(resubmit)
+
+    def shutdown(self, wait: bool = False):
+        """Stop accepting work; unfinished jobs stay in the table for `recover`"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            parse_executor, self._parse_executor = self._parse_executor, None
+            store_executor, self._store_executor = self._store_executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+        if parse_executor is not None:
+            parse_executor.shutdown(wait=wait, cancel_futures=True)
+        # Let pending upload writes finish, so their jobs can be recovered
+        if store_executor is not None:
+            store_executor.shutdown(wait=True)
+
+    def _discard_upload(self, db: Session, job: IngestionJob):
+        """Remove a failed job's stored file, unless a statement or another active job uses the same content.
+
+        Uploads are stored by content hash, so one file can back several
+        statements and jobs; a file without a hash is never removed.
+        """
+        if not job.file_hash or not os.path.exists(job.file_path):
+            return
+        statement = db.query(Statement.id).filter(Statement.file_hash == job.file_hash).first()
+        other_job = db.query(IngestionJob.id).filter(
+            IngestionJob.file_hash == job.file_hash,
+            IngestionJob.id != job.id,
+            IngestionJob.status.in_([JobStatus.QUEUED, JobStatus.RUNNING])
+        ).first()
+        if not statement and not other_job:
+            os.remove(job.file_path)
+
+    def _run(self, job_id: int, data: Optional[bytes] = None, stored: Optional[Future] = None):
+        db = SessionLocal()
+        try:
+            # Claim the job in one statement: with several server workers (or a
+            # job resubmitted by `recover`), only the first to claim it runs it
+            claimed = db.execute(
+                update(IngestionJob)
+                .where(IngestionJob.id == job_id, IngestionJob.status == JobStatus.QUEUED)
+                .values(
+                    status=JobStatus.RUNNING,
+                    started_at=datetime.utcnow(),
+                    attempts=func.coalesce(IngestionJob.attempts, 0) + 1
+                )
+            ).rowcount
+            db.commit()
+            if claimed != 1:
+                return
+            job = self.get_job(db, job_id)
+
+            parse_executor = self.parse_executor
+            try:
+                result = self.statement_service.process_statement(
+                    db, job.file_path if data is None else data, job.filename, job.file_hash,
+                    executor=parse_executor
+                )
+            except BrokenProcessPool:
+                # A worker died mid-parse (e.g. crashed on a malformed PDF). The
+                # pool cannot be reused, so replace it for the jobs that follow.
+                db.rollback()
+                self._discard_parse_executor(parse_executor)
+                result = {"error": "Error processing statement: parser process exited unexpectedly"}
+            except Exception as e:
+                db.rollback()
+                result = {"error": f"Error processing statement: {str(e)}"}
+
+            if "error" in result:
+                job.status = JobStatus.FAILED
+                job.error = result["error"]
+                if stored is not None:
+                    # Let the background write land before deciding on cleanup
+                    stored.exception()
+                self._discard_upload(db, job)
+            else:
+                job.status = JobStatus.COMPLETED
+                job.statement_id = result["statement_id"]
+                if stored is not None:
+                    try:
+                        stored.result()
+                    except OSError as e:
+                        job.error = f"Statement processed, but the upload could not be stored: {str(e)}"
+            job.finished_at = datetime.utcnow()
+            db.commit()
+        finally:
+            db.close()
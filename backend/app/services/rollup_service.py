@@ -0,0 +1,213 @@
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import Date, cast, case, delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models.rollup import DailyRollup
+from app.models.transaction import Transaction, TransactionStatus
+from app.parsers.batch import TransactionBatch
+
+# Income and expense totals of a group of transactions, in integer cents
+INCOME_CENTS = func.coalesce(func.sum(case((Transaction.amount_cents > 0, Transaction.amount_cents), else_=0)), 0)
+EXPENSE_CENTS = func.coalesce(func.sum(case((Transaction.amount_cents < 0, -Transaction.amount_cents), else_=0)), 0)
+
+# (statement_id, day, category, status)
+RollupKey = Tuple[int, date, str, str]
+# (statement_id, transaction_date, category, status, amount_cents) of one transaction
+RollupRow = Tuple[int, datetime, Optional[str], Optional[str], int]
+
+def _label(value) -> str:
+    """Stored form of a category or status key (enum member, string or None)"""
+    return getattr(value, "value", value) or ""
+
+def _day(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        # SQLite returns date() results as text
+        return date.fromisoformat(value[:10])
+    return value
+
+class RollupService:
+    """Keeps daily_rollups in step with the transactions table.
+
+    Every write path turns its change into signed deltas per rollup key and
+    applies them as upserts inside the caller's transaction; nothing here
+    commits. `rebuild` and `check` recompute the rollups from the raw table.
+    """
+
+    def snapshot(self, transaction: Transaction) -> RollupRow:
+        """Rollup-relevant fields of a transaction, taken before and after a change"""
+        return (
+            transaction.statement_id,
+            transaction.transaction_date,
+            transaction.category,
+            transaction.status,
+            transaction.amount_cents
+        )
+
+    @staticmethod
+    def _add(deltas: Dict[RollupKey, List[int]], row: RollupRow, sign: int = 1):
+        statement_id, when, category, status, amount_cents = row
+        delta = deltas[(statement_id, _day(when), _label(category), _label(status))]
+        if amount_cents > 0:
+            delta[0] += sign * amount_cents
+        else:
+            delta[1] += sign * -amount_cents
+        delta[2] += sign
+
+    def replace(self, db: Session, before: RollupRow, after: RollupRow):
+        """Move one transaction from its old rollup key and amount to its new ones"""
+        self.replace_many(db, [(before, after)])
+
+    def replace_many(self, db: Session, changes: List[Tuple[RollupRow, RollupRow]]):
+        """`replace` for many transactions, applied as one set of deltas"""
+        deltas = defaultdict(lambda: [0, 0, 0])
+        for before, after in changes:
+            if before != after:
+                self._add(deltas, before, -1)
+                self._add(deltas, after, 1)
+        self.apply(db, deltas)
+
+    def add_batch(self, db: Session, statement_id: int, batch: TransactionBatch):
+        """Roll up a freshly inserted statement; new transactions are all pending"""
+        status = TransactionStatus.PENDING.value
+        # Total by (date, category) in one tight pass, then fold into rollup keys
+        totals = defaultdict(lambda: [0, 0, 0])
+        for when, category, amount_cents in zip(batch.dates, batch.categories, batch.amount_cents):
+            total = totals[(when, category)]
+            if amount_cents > 0:
+                total[0] += amount_cents
+            else:
+                total[1] -= amount_cents
+            total[2] += 1
+
+        deltas = defaultdict(lambda: [0, 0, 0])
+        for (when, category), (income, expenses, count) in totals.items():
+            delta = deltas[(statement_id, _day(when), _label(category), status)]
+            delta[0] += income
+            delta[1] += expenses
+            delta[2] += count
+        self.apply(db, deltas)
+
+    def move_status(self, db: Session, transaction_ids: List[int], status: str):
+        """Move the rollups of many transactions to `status`, before they are updated in bulk"""
+        day = self._day_expression(db)
+        groups = db.query(
+            Transaction.statement_id, day, Transaction.category, Transaction.status,
+            INCOME_CENTS, EXPENSE_CENTS, func.count(Transaction.id)
+        ).filter(
+            Transaction.id.in_(transaction_ids),
+            func.coalesce(Transaction.status, "") != status
+        ).group_by(Transaction.statement_id, day, Transaction.category, Transaction.status)
+
+        deltas = defaultdict(lambda: [0, 0, 0])
+        for statement_id, when, category, old_status, income, expenses, count in groups:
+            for key_status, sign in ((old_status, -1), (status, 1)):
+                delta = deltas[(statement_id, _day(when), _label(category), _label(key_status))]
+                delta[0] += sign * int(income)
+                delta[1] += sign * int(expenses)
+                delta[2] += sign
+        self.apply(db, deltas)
+
+    def delete_statement(self, db: Session, statement_id: int):
+        db.execute(delete(DailyRollup).where(DailyRollup.statement_id == statement_id))
+
+    def apply(self, db: Session, deltas: Dict[RollupKey, List[int]]):
+        """Add signed deltas to their rollup rows, creating and removing rows as needed"""
+        changes = [
+            {
+                "statement_id": statement_id, "day": day, "category": category, "status": status,
+                "income_cents": income, "expense_cents": expenses, "count": count
+            }
+            for (statement_id, day, category, status), (income, expenses, count) in deltas.items()
+            if income or expenses or count
+        ]
+        if not changes:
+            return
+
+        dialect = db.get_bind().dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            upsert = (sqlite if dialect == "sqlite" else postgresql).insert(DailyRollup)
+            upsert = upsert.on_conflict_do_update(
+                index_elements=["day", "category", "status", "statement_id"],
+                set_={
+                    "income_cents": DailyRollup.income_cents + upsert.excluded.income_cents,
+                    "expense_cents": DailyRollup.expense_cents + upsert.excluded.expense_cents,
+                    "count": DailyRollup.count + upsert.excluded.count
+                }
+            )
+            db.execute(upsert, changes)
+        else:
+            for change in changes:
+                self._apply_portable(db, change)
+
+        # Keys whose last transaction moved away
+        db.execute(delete(DailyRollup).where(
+            DailyRollup.statement_id.in_({change["statement_id"] for change in changes}),
+            DailyRollup.count <= 0
+        ))
+
+    def _apply_portable(self, db: Session, change: Dict):
+        row = db.get(DailyRollup, (change["day"], change["category"], change["status"], change["statement_id"]))
+        if row is None:
+            db.add(DailyRollup(**change))
+        else:
+            row.income_cents += change["income_cents"]
+            row.expense_cents += change["expense_cents"]
+            row.count += change["count"]
+        db.flush()
+
+    @staticmethod
+    def _day_expression(db: Session):
+        # SQLite has no DATE type; date() yields the same YYYY-MM-DD text the Date column stores
+        if db.get_bind().dialect.name == "sqlite":
+            return func.date(Transaction.transaction_date)
+        return cast(Transaction.transaction_date, Date)
+
+    def _raw_groups(self, db: Session, statement_id: Optional[int] = None):
+        day = self._day_expression(db)
+        category = func.coalesce(Transaction.category, "")
+        status = func.coalesce(Transaction.status, "")
+        query = select(
+            Transaction.statement_id, day, category, status,
+            INCOME_CENTS, EXPENSE_CENTS, func.count(Transaction.id)
+        )
+        if statement_id:
+            query = query.where(Transaction.statement_id == statement_id)
+        return query.group_by(Transaction.statement_id, day, category, status)
+
+    def rebuild(self, db: Session, statement_id: Optional[int] = None) -> int:
+        """Recompute rollups from the transactions table; returns the number of rollup rows"""
+        clear = delete(DailyRollup)
+        if statement_id:
+            clear = clear.where(DailyRollup.statement_id == statement_id)
+        db.execute(clear)
+        db.execute(insert(DailyRollup).from_select(
+            ["statement_id", "day", "category", "status", "income_cents", "expense_cents", "count"],
+            self._raw_groups(db, statement_id)
+        ))
+        query = db.query(func.count()).select_from(DailyRollup)
+        if statement_id:
+            query = query.filter(DailyRollup.statement_id == statement_id)
+        return query.scalar()
+
+    def check(self, db: Session) -> List[Dict]:
+        """Rollup keys whose stored sums differ from the transactions table"""
+        raw = {
+            (statement_id, _day(day), category, status): (int(income), int(expenses), count)
+            for statement_id, day, category, status, income, expenses, count in db.execute(self._raw_groups(db))
+        }
+        stored = {
+            (row.statement_id, row.day, row.category, row.status): (row.income_cents, row.expense_cents, row.count)
+            for row in db.query(DailyRollup)
+        }
+        return [
+            {
+                "statement_id": key[0], "day": key[1].isoformat(), "category": key[2], "status": key[3],
+                "expected": raw.get(key), "stored": stored.get(key)
+            }
+            for key in sorted(raw.keys() | stored.keys(), key=lambda k: (k[0], k[1], k[2], k[3]))
+            if raw.get(key) != stored.get(key)
+        ]
@@ -1,56 +1,103 @@
 import os
+from concurrent.futures import Executor
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.models.transaction import Statement, Transaction
-from app.parsers import get_parser, BANK_PARSERS
+from app.core.cache import analytics_cache
+from app.core.config import settings
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.transaction import Statement, Transaction, TransactionStatus
+from app.parsers import get_parser, BANK_FINGERPRINTS, ParsedDocument, TransactionBatch, open_document
+from app.parsers.sources import is_reopenable
 from app.ml.categorizer import TransactionCategorizer
+from app.ml.online_model import get_category_model
+from app.services.rollup_service import RollupService
+from app.services.upload_store import content_path
+
+# Fields a review changes, carried over to the new row when a statement is reprocessed
+REVIEW_FIELDS = (
+    "description", "amount_cents", "category", "auto_categorized", "confidence_score", "status",
+    "reviewed_at", "edited_at", "original_description", "original_amount_cents"
+)
+
+def parse_statement(source, file_hash: Optional[str] = None) -> Dict:
+    """Detect the bank and parse a statement PDF (path, file object or bytes) without touching the database.
+
+    Module level and free of shared state so it can run in a worker process.
+    Returns {"bank_name", "parsed_data"}, or {"error"} if the file cannot be parsed.
+    """
+    try:
+        # Open the PDF once and share its page cache across every step
+        with ParsedDocument(source, file_hash=file_hash) as document:
+            try:
+                bank_name = BANK_FINGERPRINTS.detect(document)
+            except Exception:
+                bank_name = None
+            if not bank_name:
+                return {"error": "Unable to detect bank. Supported banks: HSBC, DBS, OCBC, Citibank, SCB, Trust, GXS"}
+
+            parser = get_parser(bank_name)
+            if not parser:
+                return {"error": f"Parser not found for {bank_name}"}
+
+            parsed_data = parser.parse(document)
+            if not parsed_data:
+                return {"error": "Failed to parse statement"}
+            return {"bank_name": bank_name, "parsed_data": parsed_data}
+    except Exception as e:
+        return {"error": f"Error processing statement: {str(e)}"}
 
 class StatementService:
     """Service for processing bank statements"""
 
     def __init__(self):
-        self.categorizer = TransactionCategorizer()
+        self.categorizer = TransactionCategorizer(model=get_category_model())
+        self.rollups = RollupService()
 
-    def detect_bank(self, pdf_path: str) -> Optional[str]:
+    def detect_bank(self, source) -> Optional[str]:
         """Detect which bank the statement is from"""
-        # Try each parser to detect the bank
-        for bank_name, parser_class in BANK_PARSERS.items():
-            parser = parser_class()
-            try:
-                with open(pdf_path, 'rb'):
-                    import pdfplumber
-                    with pdfplumber.open(pdf_path) as pdf:
-                        text = ""
-                        for page in pdf.pages[:2]:  # Check first 2 pages only
-                            text += page.extract_text() or ""
-                        if parser.detect_bank(text):
-                            return bank_name
-            except Exception as e:
-                continue
-        return None
-
-    def process_statement(self, db: Session, pdf_path: str, filename: str) -> Dict:
-        """Process a bank statement PDF"""
-        # Detect bank
-        bank_name = self.detect_bank(pdf_path)
-        if not bank_name:
-            return {"error": "Unable to detect bank. Supported banks: HSBC, DBS, OCBC, Citibank, SCB, Trust, GXS"}
-
-        # Get appropriate parser
-        parser = get_parser(bank_name)
-        if not parser:
-            return {"error": f"Parser not found for {bank_name}"}
-
-        # Parse the PDF
         try:
-            parsed_data = parser.parse(pdf_path)
-            if not parsed_data:
-                return {"error": "Failed to parse statement"}
+            with open_document(source) as document:
+                return BANK_FINGERPRINTS.detect(document)
+        except Exception as e:
+            return None
+
+    def process_statement(
+        self, db: Session, source, filename: str, file_hash: Optional[str] = None,
+        executor: Optional[Executor] = None
+    ) -> Dict:
+        """Process a bank statement PDF given as a path, a binary file object or its bytes.
+
+        Parsing runs on `executor` (e.g. the ingestion process pool) when one is
+        given and the source can be sent to it; saving the result always happens
+        here, on `db`.
+        """
+        # An identical file that was already processed is returned without parsing
+        if file_hash:
+            existing = self.get_processed_statement(db, file_hash)
+            if existing:
+                return self.statement_result(db, existing)
 
+        if executor is None or not is_reopenable(source):
+            parsed = parse_statement(source, file_hash)
+        else:
+            parsed = executor.submit(parse_statement, source, file_hash).result()
+        return self.save_parsed(db, parsed, filename, file_hash)
+
+    def save_parsed(self, db: Session, parsed: Dict, filename: str, file_hash: Optional[str]) -> Dict:
+        """Categorize and store the result of `parse_statement` as a new statement"""
+        if "error" in parsed:
+            return parsed
+        bank_name = parsed["bank_name"]
+        parsed_data = parsed["parsed_data"]
+
+        try:
             # Create statement record
             statement = Statement(
                 filename=filename,
+                file_hash=file_hash,
                 bank_name=bank_name,
                 account_number=parsed_data.get("account_number"),
                 statement_period_start=parsed_data.get("period_start"),
@@ -62,32 +109,20 @@ class StatementService:
             db.flush()
 
             # Categorize and save transactions
-            transactions_data = parsed_data.get("transactions", [])
-            categorized_transactions = self.categorizer.batch_categorize(transactions_data)
-
-            for trans_data in categorized_transactions:
-                transaction = Transaction(
-                    statement_id=statement.id,
-                    transaction_date=trans_data["date"],
-                    description=trans_data["description"],
-                    amount=trans_data["amount"],
-                    balance=trans_data.get("balance"),
-                    category=trans_data["category"],
-                    confidence_score=trans_data["confidence_score"],
-                    auto_categorized=trans_data["auto_categorized"]
-                )
-                db.add(transaction)
+            categorized_transactions = self._add_transactions(db, statement, parsed_data.get("transactions", []))
+            # Read before commit expires the instance, so no refresh query is needed
+            statement_id = statement.id
 
             db.commit()
-            db.refresh(statement)
+            analytics_cache.invalidate()
 
             return {
                 "success": True,
-                "statement_id": statement.id,
+                "statement_id": statement_id,
                 "bank_name": bank_name,
-                "account_number": statement.account_number,
-                "period_start": statement.statement_period_start,
-                "period_end": statement.statement_period_end,
+                "account_number": parsed_data.get("account_number"),
+                "period_start": parsed_data.get("period_start"),
+                "period_end": parsed_data.get("period_end"),
                 "transaction_count": len(categorized_transactions)
             }
 
@@ -95,19 +130,220 @@ class StatementService:
             db.rollback()
             return {"error": f"Error processing statement: {str(e)}"}
 
+    def _add_transactions(self, db: Session, statement: Statement, transactions) -> TransactionBatch:
+        """Categorize parsed transactions and bulk insert them for a statement.
+
+        The batch columns are zipped into row parameters and inserted with Core
+        executemany INSERTs of BULK_INSERT_CHUNK_SIZE rows, bypassing the ORM unit
+        of work (SQLAlchemy batches them into multi-row statements where the
+        dialect supports it), and the daily rollups are updated to match. Both are
+        part of the caller's transaction and become visible on its commit.
+        """
+        if not isinstance(transactions, TransactionBatch):
+            transactions = TransactionBatch.from_dicts(transactions)
+        categorized_transactions = self.categorizer.batch_categorize(transactions)
+
+        columns = categorized_transactions.insert_columns(statement.id)
+        # Column defaults given once for the batch instead of evaluated per row
+        now = datetime.utcnow()
+        count = len(categorized_transactions)
+        columns.update(
+            status=[TransactionStatus.PENDING.value] * count, created_at=[now] * count, updated_at=[now] * count
+        )
+        rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+        chunk_size = settings.BULK_INSERT_CHUNK_SIZE
+        for start in range(0, len(rows), chunk_size):
+            db.execute(insert(Transaction.__table__), rows[start:start + chunk_size])
+        self.rollups.add_batch(db, statement.id, categorized_transactions)
+
+        return categorized_transactions
+
+    def reprocess_statement(self, db: Session, statement_id: int, discard_edits: bool = False) -> Dict:
+        """Re-run the parser on a stored statement, reading raw pages from the extraction cache.
+
+        Used after a parser's row interpretation changes. pdfplumber only runs if
+        the cache entry is missing. Transactions are replaced, but reviewed ones
+        (edited, approved, rejected or recategorized) keep their review when the
+        parser still produces a row with the same date, original description and
+        original amount. If any reviewed transaction has no such row, nothing is
+        changed unless `discard_edits` is set.
+        """
+        statement = self.get_statement(db, statement_id)
+        if not statement:
+            return {"error": "Statement not found"}
+        if not statement.file_hash:
+            return {"error": "Statement was uploaded before content hashing and cannot be reprocessed"}
+
+        parser = get_parser(statement.bank_name)
+        if not parser:
+            return {"error": f"Parser not found for {statement.bank_name}"}
+
+        try:
+            with ParsedDocument(content_path(statement.file_hash), file_hash=statement.file_hash) as document:
+                parsed_data = parser.parse(document)
+            if not parsed_data:
+                return {"error": "Failed to parse statement"}
+
+            transactions = parsed_data.get("transactions", [])
+            if not isinstance(transactions, TransactionBatch):
+                transactions = TransactionBatch.from_dicts(transactions)
+            reviews, discarded = self._match_reviews(db, statement.id, transactions)
+            if discarded and not discard_edits:
+                return {
+                    "error": f"{discarded} reviewed transactions no longer match a parsed row; "
+                             "reprocess with discard_edits to drop their review"
+                }
+
+            db.query(Transaction).filter(Transaction.statement_id == statement.id).delete(synchronize_session=False)
+            self.rollups.delete_statement(db, statement.id)
+            statement.account_number = parsed_data.get("account_number")
+            statement.statement_period_start = parsed_data.get("period_start")
+            statement.statement_period_end = parsed_data.get("period_end")
+            statement.processed_at = datetime.utcnow()
+
+            categorized_transactions = self._add_transactions(db, statement, transactions)
+            self._restore_reviews(db, statement.id, categorized_transactions, reviews)
+            db.commit()
+            analytics_cache.invalidate()
+
+            return {
+                "success": True,
+                "statement_id": statement.id,
+                "bank_name": statement.bank_name,
+                "transaction_count": len(categorized_transactions),
+                "reviews_kept": len(reviews),
+                "reviews_discarded": discarded,
+                "from_cache": document.from_cache
+            }
+
+        except Exception as e:
+            db.rollback()
+            return {"error": f"Error reprocessing statement: {str(e)}"}
+
+    def _match_reviews(
+        self, db: Session, statement_id: int, batch: TransactionBatch
+    ) -> Tuple[List[Tuple[int, Dict]], int]:
+        """Pair a statement's reviewed transactions with rows of a new parse.
+
+        Returns ([(batch index, review fields)], number of reviewed transactions
+        without a matching row). Rows match on date and the description and
+        amount as originally parsed, i.e. before any edit.
+        """
+        reviewed = db.query(Transaction).filter(
+            Transaction.statement_id == statement_id,
+            (func.coalesce(Transaction.status, TransactionStatus.PENDING.value) != TransactionStatus.PENDING.value)
+            | Transaction.edited_at.isnot(None)
+            | Transaction.reviewed_at.isnot(None)
+            | (Transaction.auto_categorized == False)  # noqa: E712
+        ).order_by(Transaction.id).all()
+
+        by_key: Dict[Tuple, List[Transaction]] = {}
+        for transaction in reviewed:
+            if transaction.original_description:
+                key = (
+                    transaction.transaction_date, transaction.original_description, transaction.original_amount_cents
+                )
+            else:
+                key = (transaction.transaction_date, transaction.description, transaction.amount_cents)
+            by_key.setdefault(key, []).append(transaction)
+
+        reviews = []
+        for index, key in enumerate(zip(batch.dates, batch.descriptions, batch.amount_cents)):
+            candidates = by_key.get(key)
+            if candidates:
+                transaction = candidates.pop(0)
+                reviews.append((index, {field: getattr(transaction, field) for field in REVIEW_FIELDS}))
+        discarded = sum(len(candidates) for candidates in by_key.values())
+        return reviews, discarded
+
+    def _restore_reviews(
+        self, db: Session, statement_id: int, batch: TransactionBatch, reviews: List[Tuple[int, Dict]]
+    ):
+        """Copy carried-over review fields onto freshly inserted rows and move their rollups to match"""
+        if not reviews:
+            return
+        # Rows were inserted in batch order, so ids follow it
+        ids = db.execute(
+            select(Transaction.id).where(Transaction.statement_id == statement_id).order_by(Transaction.id)
+        ).scalars().all()
+        db.execute(update(Transaction), [{"id": ids[index], **fields} for index, fields in reviews])
+
+        pending = TransactionStatus.PENDING.value
+        self.rollups.replace_many(db, [
+            (
+                (statement_id, batch.dates[index], batch.categories[index], pending, batch.amount_cents[index]),
+                (statement_id, batch.dates[index], fields["category"], fields["status"], fields["amount_cents"])
+            )
+            for index, fields in reviews
+        ])
+
     def get_statement(self, db: Session, statement_id: int) -> Optional[Statement]:
         """Get a statement by ID"""
         return db.query(Statement).filter(Statement.id == statement_id).first()
 
+    def get_processed_statement(self, db: Session, file_hash: str) -> Optional[Statement]:
+        """Get the completed statement for a file hash, if that file was processed before"""
+        return db.query(Statement).filter(
+            Statement.file_hash == file_hash,
+            Statement.status == "completed"
+        ).first()
+
+    def statement_result(self, db: Session, statement: Statement) -> Dict:
+        """Result dict for a statement that already exists"""
+        transaction_count = db.query(func.count(Transaction.id)).filter(
+            Transaction.statement_id == statement.id
+        ).scalar()
+        return {
+            "success": True,
+            "duplicate": True,
+            "statement_id": statement.id,
+            "bank_name": statement.bank_name,
+            "account_number": statement.account_number,
+            "period_start": statement.statement_period_start,
+            "period_end": statement.statement_period_end,
+            "transaction_count": transaction_count
+        }
+
+    async def get_statement_async(self, db: AsyncSession, statement_id: int) -> Optional[Statement]:
+        return await db.get(Statement, statement_id)
+
     def get_all_statements(self, db: Session, skip: int = 0, limit: int = 100):
         """Get all statements"""
-        return db.query(Statement).offset(skip).limit(limit).all()
+        return db.query(Statement).order_by(Statement.id).offset(skip).limit(limit).all()
+
+    async def get_all_statements_async(self, db: AsyncSession, skip: int = 0, limit: int = 100) -> List[Statement]:
+        return (await db.scalars(select(Statement).order_by(Statement.id).offset(skip).limit(limit))).all()
+
+    @staticmethod
+    def _statements_query(limit: int, cursor: Optional[str]):
+        query = select(Statement)
+        if cursor:
+            after_id, = decode_cursor(cursor, (int,))
+            query = query.where(Statement.id > after_id)
+        return query.order_by(Statement.id).limit(limit + 1)
+
+    @staticmethod
+    def _statements_page(statements: List[Statement], limit: int) -> Tuple[List[Statement], Optional[str]]:
+        next_cursor = None
+        if len(statements) > limit:
+            statements = statements[:limit]
+            next_cursor = encode_cursor((statements[-1].id,))
+        return statements, next_cursor
+
+    def list_statements(self, db: Session, limit: int = 100, cursor: Optional[str] = None) -> Tuple[List[Statement], Optional[str]]:
+        """One page of statements in id order and the cursor of the next page"""
+        return self._statements_page(db.scalars(self._statements_query(limit, cursor)).all(), limit)
+
+    async def list_statements_async(self, db: AsyncSession, limit: int = 100, cursor: Optional[str] = None) -> Tuple[List[Statement], Optional[str]]:
+        return self._statements_page((await db.scalars(self._statements_query(limit, cursor))).all(), limit)
 
     def delete_statement(self, db: Session, statement_id: int) -> bool:
         """Delete a statement and its transactions"""
         statement = self.get_statement(db, statement_id)
         if statement:
+            self.rollups.delete_statement(db, statement.id)
             db.delete(statement)
             db.commit()
+            analytics_cache.invalidate()
             return True
         return False
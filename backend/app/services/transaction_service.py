@@ -1,30 +1,204 @@
-from datetime import datetime
-from typing import List, Optional, Dict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Dict, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
-from app.models.transaction import Transaction, TransactionStatus, TransactionCategory
+from sqlalchemy import DateTime, Integer, String, Text, bindparam, case, func, or_, select, update
+from app.models.transaction import Statement, Transaction, TransactionStatus, TransactionCategory
+from app.models.rollup import DailyRollup
+from app.core.cache import analytics_cache
+from app.core.money import from_cents, to_cents
+from app.core.pagination import decode_cursor, encode_cursor
+from app.ml.online_model import get_category_model
+from app.services.rollup_service import RollupService
+
+def month_range(year: int, month: int) -> Tuple[datetime, datetime]:
+    """Half-open [start, end) datetime range of a calendar month, usable by date indexes"""
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return start, end
+
+# Columns a transaction listing needs; the rest stay in the database
+LIST_COLUMNS = (
+    Transaction.id,
+    Transaction.statement_id,
+    Transaction.transaction_date,
+    Transaction.description,
+    Transaction.amount_cents,
+    Transaction.category,
+    Transaction.confidence_score,
+    Transaction.status,
+    Transaction.auto_categorized,
+    Transaction.original_description
+)
+
+@dataclass
+class TransactionFilters:
+    """Server-side filters for transaction listings; unset fields do not filter"""
+    statement_id: Optional[int] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None  # inclusive
+    category: Optional[str] = None
+    status: Optional[str] = None
+    min_amount: Optional[float] = None  # signed; expenses are negative
+    max_amount: Optional[float] = None
+    bank: Optional[str] = None
+    search: Optional[str] = None
+
+    def apply(self, query):
+        if self.statement_id:
+            query = query.filter(Transaction.statement_id == self.statement_id)
+        if self.start_date:
+            query = query.filter(Transaction.transaction_date >= datetime.combine(self.start_date, datetime.min.time()))
+        if self.end_date:
+            query = query.filter(Transaction.transaction_date < datetime.combine(self.end_date + timedelta(days=1), datetime.min.time()))
+        if self.category:
+            query = query.filter(Transaction.category == self.category)
+        if self.status:
+            query = query.filter(Transaction.status == self.status)
+        if self.min_amount is not None:
+            query = query.filter(Transaction.amount_cents >= to_cents(self.min_amount))
+        if self.max_amount is not None:
+            query = query.filter(Transaction.amount_cents <= to_cents(self.max_amount))
+        if self.bank:
+            # A subquery rather than a join keeps the date index usable for ordering
+            query = query.filter(Transaction.statement_id.in_(
+                select(Statement.id).where(Statement.bank_name == self.bank)
+            ))
+        if self.search:
+            query = query.filter(Transaction.description.icontains(self.search, autoescape=True))
+        return query
+
+# Statuses set by the review actions of bulk_update
+BULK_REVIEW_STATUSES = {"approve": TransactionStatus.APPROVED, "reject": TransactionStatus.REJECTED}
+
+def _bulk_edit_statement(now: datetime):
+    """Per-row UPDATE for edited transactions, run as one executemany.
+
+    Unset fields arrive as NULL and keep their value. On a transaction's first
+    edit the original description and amount are captured from the pre-update
+    row, as update_transaction does.
+    """
+    table = Transaction.__table__
+    first_edit = func.coalesce(table.c.original_description, "") == ""
+    return update(table).where(table.c.id == bindparam("b_id")).values(
+        description=func.coalesce(bindparam("b_description", type_=Text), table.c.description),
+        amount_cents=func.coalesce(bindparam("b_amount_cents", type_=Integer), table.c.amount_cents),
+        category=func.coalesce(bindparam("b_category", type_=String), table.c.category),
+        status=bindparam("b_status", type_=String),
+        edited_at=now,
+        auto_categorized=False,
+        reviewed_at=func.coalesce(bindparam("b_reviewed_at", type_=DateTime), table.c.reviewed_at),
+        original_description=case((first_edit, table.c.description), else_=table.c.original_description),
+        original_amount_cents=case((first_edit, table.c.amount_cents), else_=table.c.original_amount_cents)
+    )
 
 class TransactionService:
     """Service for managing transactions"""
 
+    def __init__(self):
+        self.rollups = RollupService()
+
     def get_transaction(self, db: Session, transaction_id: int) -> Optional[Transaction]:
         """Get a transaction by ID"""
         return db.query(Transaction).filter(Transaction.id == transaction_id).first()
 
-    def get_transactions_by_statement(self, db: Session, statement_id: int) -> List[Transaction]:
-        """Get all transactions for a statement"""
-        return db.query(Transaction).filter(Transaction.statement_id == statement_id).all()
+    async def get_transaction_async(self, db: AsyncSession, transaction_id: int) -> Optional[Transaction]:
+        return await db.get(Transaction, transaction_id)
+
+    def get_transactions_by_statement(
+        self, db: Session, statement_id: int, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[Transaction], Optional[str]]:
+        """One page of a statement's transactions in date order and the cursor of the next page"""
+        query = self._list_query(TransactionFilters(statement_id=statement_id), limit, cursor, False, (Transaction,))
+        return self._page_rows(db.scalars(query).all(), limit)
+
+    async def get_transactions_by_statement_async(
+        self, db: AsyncSession, statement_id: int, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[Transaction], Optional[str]]:
+        query = self._list_query(TransactionFilters(statement_id=statement_id), limit, cursor, False, (Transaction,))
+        return self._page_rows((await db.scalars(query)).all(), limit)
+
+    @staticmethod
+    def _list_query(
+        filters: TransactionFilters, limit: int, cursor: Optional[str], descending: bool, columns=LIST_COLUMNS
+    ):
+        query = filters.apply(select(*columns))
+        if cursor:
+            after_date, after_id = decode_cursor(cursor, (datetime, int))
+            # The plain bound on transaction_date lets the index seek straight to the page
+            if descending:
+                query = query.filter(Transaction.transaction_date <= after_date, or_(
+                    Transaction.transaction_date < after_date, Transaction.id < after_id
+                ))
+            else:
+                query = query.filter(Transaction.transaction_date >= after_date, or_(
+                    Transaction.transaction_date > after_date, Transaction.id > after_id
+                ))
+        if descending:
+            query = query.order_by(Transaction.transaction_date.desc(), Transaction.id.desc())
+        else:
+            query = query.order_by(Transaction.transaction_date, Transaction.id)
+        # One extra row tells whether another page follows
+        return query.limit(limit + 1)
+
+    @staticmethod
+    def _list_item(row) -> Dict:
+        item = dict(row._mapping)
+        item["amount"] = from_cents(item.pop("amount_cents"))
+        return item
+
+    @staticmethod
+    def _page_rows(rows, limit: int) -> Tuple[List, Optional[str]]:
+        """Drop the look-ahead row of a `_list_query` result; the cursor is set if it was there"""
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor((rows[-1].transaction_date, rows[-1].id))
+        return rows, next_cursor
+
+    def _list_page(self, rows, limit: int) -> Tuple[List[Dict], Optional[str]]:
+        rows, next_cursor = self._page_rows(rows, limit)
+        return [self._list_item(row) for row in rows], next_cursor
+
+    def list_transactions(
+        self,
+        db: Session,
+        filters: TransactionFilters,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        descending: bool = True
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """One page of matching transactions in (date, id) order and the cursor of the next page.
+
+        Pages are keyed on the last (transaction_date, id) seen rather than an
+        offset, so every page costs the same however deep it is.
+        """
+        rows = db.execute(self._list_query(filters, limit, cursor, descending)).all()
+        return self._list_page(rows, limit)
+
+    async def list_transactions_async(
+        self,
+        db: AsyncSession,
+        filters: TransactionFilters,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        descending: bool = True
+    ) -> Tuple[List[Dict], Optional[str]]:
+        rows = (await db.execute(self._list_query(filters, limit, cursor, descending))).all()
+        return self._list_page(rows, limit)
 
     def update_transaction(self, db: Session, transaction_id: int, updates: Dict) -> Optional[Transaction]:
         """Update a transaction"""
         transaction = self.get_transaction(db, transaction_id)
         if not transaction:
             return None
+        before = self.rollups.snapshot(transaction)
 
         # Store original values if this is the first edit
         if not transaction.original_description:
             transaction.original_description = transaction.description
-            transaction.original_amount = transaction.amount
+            transaction.original_amount_cents = transaction.amount_cents
 
         # Update fields
         for key, value in updates.items():
@@ -34,9 +208,13 @@ class TransactionService:
         transaction.status = TransactionStatus.EDITED
         transaction.edited_at = datetime.utcnow()
         transaction.auto_categorized = False
+        self.rollups.replace(db, before, self.rollups.snapshot(transaction))
 
         db.commit()
+        analytics_cache.invalidate()
         db.refresh(transaction)
+        if "category" in updates:
+            self._learn([transaction])
         return transaction
 
     def approve_transaction(self, db: Session, transaction_id: int) -> Optional[Transaction]:
@@ -45,10 +223,14 @@ class TransactionService:
         if not transaction:
             return None
 
+        before = self.rollups.snapshot(transaction)
         transaction.status = TransactionStatus.APPROVED
         transaction.reviewed_at = datetime.utcnow()
+        self.rollups.replace(db, before, self.rollups.snapshot(transaction))
         db.commit()
+        analytics_cache.invalidate()
         db.refresh(transaction)
+        self._learn([transaction])
         return transaction
 
     def reject_transaction(self, db: Session, transaction_id: int) -> Optional[Transaction]:
@@ -57,14 +239,18 @@ class TransactionService:
         if not transaction:
             return None
 
+        before = self.rollups.snapshot(transaction)
         transaction.status = TransactionStatus.REJECTED
         transaction.reviewed_at = datetime.utcnow()
+        self.rollups.replace(db, before, self.rollups.snapshot(transaction))
         db.commit()
+        analytics_cache.invalidate()
         db.refresh(transaction)
         return transaction
 
     def bulk_approve(self, db: Session, transaction_ids: List[int]) -> int:
         """Approve multiple transactions"""
+        self.rollups.move_status(db, transaction_ids, TransactionStatus.APPROVED.value)
         count = db.query(Transaction).filter(
             Transaction.id.in_(transaction_ids)
         ).update({
@@ -72,79 +258,197 @@ class TransactionService:
             Transaction.reviewed_at: datetime.utcnow()
         }, synchronize_session=False)
         db.commit()
+        analytics_cache.invalidate()
+        if count:
+            self._learn(db.query(
+                Transaction.description, Transaction.amount_cents, Transaction.category
+            ).filter(Transaction.id.in_(transaction_ids)).all())
         return count
 
-    def get_analytics(self, db: Session, statement_id: Optional[int] = None) -> Dict:
-        """Get transaction analytics"""
-        query = db.query(Transaction)
-        if statement_id:
-            query = query.filter(Transaction.statement_id == statement_id)
+    def bulk_update(self, db: Session, operations: List[Dict]) -> List[Dict]:
+        """Apply many update/categorize/approve/reject operations in one DB transaction.
+
+        Each operation is a dict with `id`, `action` and, for update and
+        categorize, any of `description`, `amount` and `category`. Operations on
+        the same transaction are folded in order into a single change, so the
+        result matches applying them one by one through the single-transaction
+        methods. Returns one result per transaction id, in request order.
+        """
+        ids = list(dict.fromkeys(operation["id"] for operation in operations))
+        current = {
+            row.id: row for row in db.execute(select(
+                Transaction.id, Transaction.statement_id, Transaction.transaction_date,
+                Transaction.category, Transaction.status, Transaction.amount_cents
+            ).where(Transaction.id.in_(ids)))
+        }
+
+        changes = {}
+        for operation in operations:
+            if operation["id"] not in current:
+                continue
+            change = changes.setdefault(operation["id"], {
+                "b_id": operation["id"], "b_description": None, "b_amount_cents": None, "b_category": None,
+                "b_status": None, "b_reviewed_at": None, "edited": False, "learn": False
+            })
+            if operation["action"] in ("update", "categorize"):
+                if operation.get("description") is not None:
+                    change["b_description"] = operation["description"]
+                if operation.get("amount") is not None:
+                    change["b_amount_cents"] = to_cents(operation["amount"])
+                if operation.get("category") is not None:
+                    change["b_category"] = operation["category"]
+                    change["learn"] = True
+                change["b_status"] = TransactionStatus.EDITED.value
+                change["edited"] = True
+            else:
+                change["b_status"] = BULK_REVIEW_STATUSES[operation["action"]].value
+                change["b_reviewed_at"] = datetime.utcnow()
+                if operation["action"] == "approve":
+                    change["learn"] = True
 
-        transactions = query.all()
+        if changes:
+            self.rollups.replace_many(db, [
+                (
+                    (row.statement_id, row.transaction_date, row.category, row.status, row.amount_cents),
+                    (
+                        row.statement_id, row.transaction_date,
+                        change["b_category"] or row.category, change["b_status"],
+                        row.amount_cents if change["b_amount_cents"] is None else change["b_amount_cents"]
+                    )
+                )
+                for row, change in ((current[id_], change) for id_, change in changes.items())
+            ])
 
-        # Calculate analytics
-        total_income = sum(t.amount for t in transactions if t.amount > 0)
-        total_expenses = sum(abs(t.amount) for t in transactions if t.amount < 0)
-        net_amount = total_income - total_expenses
+            edits = [change for change in changes.values() if change["edited"]]
+            if edits:
+                db.execute(_bulk_edit_statement(datetime.utcnow()), [
+                    {key: value for key, value in change.items() if key.startswith("b_")} for change in edits
+                ])
+            # Transactions that were only approved or rejected share one UPDATE per status
+            for status in BULK_REVIEW_STATUSES.values():
+                reviewed = [id_ for id_, change in changes.items() if not change["edited"] and change["b_status"] == status.value]
+                if reviewed:
+                    db.execute(update(Transaction.__table__).where(Transaction.id.in_(reviewed)).values(
+                        status=status.value, reviewed_at=datetime.utcnow()
+                    ))
+            db.commit()
+            analytics_cache.invalidate()
 
-        # Category breakdown
+        rows = {row.id: row for row in db.execute(select(*LIST_COLUMNS).where(Transaction.id.in_(list(changes))))}
+        self._learn([rows[id_] for id_, change in changes.items() if change["learn"]])
+
+        results = []
+        for id_ in ids:
+            if id_ in rows:
+                results.append({"id": id_, "success": True, "error": None, "transaction": self._list_item(rows[id_])})
+            else:
+                results.append({"id": id_, "success": False, "error": "Transaction not found", "transaction": None})
+        return results
+
+    def _learn(self, transactions):
+        """Feed user-confirmed categories to the online category model"""
+        model = get_category_model()
+        if model is None or not transactions:
+            return
+        model.learn(
+            [t.description for t in transactions],
+            [t.amount_cents for t in transactions],
+            [t.category for t in transactions]
+        )
+
+    @staticmethod
+    def _analytics_queries(statement_id: Optional[int]):
+        by_category = select(
+            DailyRollup.category,
+            func.sum(DailyRollup.count),
+            func.sum(DailyRollup.income_cents),
+            func.sum(DailyRollup.expense_cents)
+        ).group_by(DailyRollup.category).order_by(DailyRollup.category)
+        by_status = select(DailyRollup.status, func.sum(DailyRollup.count)).group_by(DailyRollup.status)
+        if statement_id:
+            by_category = by_category.where(DailyRollup.statement_id == statement_id)
+            by_status = by_status.where(DailyRollup.statement_id == statement_id)
+        return by_category, by_status
+
+    @staticmethod
+    def _analytics_result(category_rows, status_rows) -> Dict:
+        # Exact integer cents
+        total_transactions = total_income = total_expenses = 0
         category_breakdown = {}
-        for trans in transactions:
-            category = trans.category
-            if category not in category_breakdown:
-                category_breakdown[category] = {
-                    "total": 0,
-                    "count": 0,
-                    "transactions": []
-                }
-            category_breakdown[category]["total"] += abs(trans.amount)
-            category_breakdown[category]["count"] += 1
+        for category, count, income, expenses in category_rows:
+            total_transactions += int(count)
+            total_income += int(income)
+            total_expenses += int(expenses)
+            category_breakdown[category or None] = {
+                "total": from_cents(int(income) + int(expenses)),
+                "count": int(count),
+                "transactions": []
+            }
 
         # Status breakdown
-        status_counts = {
-            "pending": len([t for t in transactions if t.status == TransactionStatus.PENDING]),
-            "approved": len([t for t in transactions if t.status == TransactionStatus.APPROVED]),
-            "rejected": len([t for t in transactions if t.status == TransactionStatus.REJECTED]),
-            "edited": len([t for t in transactions if t.status == TransactionStatus.EDITED])
-        }
+        status_counts = {status.value: 0 for status in TransactionStatus}
+        for status, count in status_rows:
+            if status in status_counts:
+                status_counts[status] = int(count)
 
         return {
-            "total_transactions": len(transactions),
-            "total_income": round(total_income, 2),
-            "total_expenses": round(total_expenses, 2),
-            "net_amount": round(net_amount, 2),
+            "total_transactions": total_transactions,
+            "total_income": from_cents(total_income),
+            "total_expenses": from_cents(total_expenses),
+            "net_amount": from_cents(total_income - total_expenses),
             "category_breakdown": category_breakdown,
             "status_breakdown": status_counts
         }
 
-    def get_monthly_summary(self, db: Session, year: int, month: int) -> Dict:
-        """Get monthly transaction summary"""
-        transactions = db.query(Transaction).filter(
-            extract('year', Transaction.transaction_date) == year,
-            extract('month', Transaction.transaction_date) == month
-        ).all()
+    def get_analytics(self, db: Session, statement_id: Optional[int] = None) -> Dict:
+        """Get transaction analytics from the daily rollups, without touching raw transactions"""
+        by_category, by_status = self._analytics_queries(statement_id)
+        return self._analytics_result(db.execute(by_category).all(), db.execute(by_status).all())
+
+    async def get_analytics_async(self, db: AsyncSession, statement_id: Optional[int] = None) -> Dict:
+        by_category, by_status = self._analytics_queries(statement_id)
+        return self._analytics_result((await db.execute(by_category)).all(), (await db.execute(by_status)).all())
 
-        income = sum(t.amount for t in transactions if t.amount > 0)
-        expenses = sum(abs(t.amount) for t in transactions if t.amount < 0)
+    @staticmethod
+    def _monthly_query(year: int, month: int):
+        start, end = month_range(year, month)
+        return select(
+            DailyRollup.day,
+            func.sum(DailyRollup.count),
+            func.sum(DailyRollup.income_cents),
+            func.sum(DailyRollup.expense_cents)
+        ).where(
+            DailyRollup.day >= start.date(),
+            DailyRollup.day < end.date()
+        ).group_by(DailyRollup.day).order_by(DailyRollup.day)
 
-        # Daily breakdown
+    @staticmethod
+    def _monthly_result(year: int, month: int, rows) -> Dict:
+        income = expenses = transaction_count = 0
         daily_breakdown = {}
-        for trans in transactions:
-            day = trans.transaction_date.day
-            if day not in daily_breakdown:
-                daily_breakdown[day] = {"income": 0, "expenses": 0, "count": 0}
-            if trans.amount > 0:
-                daily_breakdown[day]["income"] += trans.amount
-            else:
-                daily_breakdown[day]["expenses"] += abs(trans.amount)
-            daily_breakdown[day]["count"] += 1
+        for day, count, day_income, day_expenses in rows:
+            income += int(day_income)
+            expenses += int(day_expenses)
+            transaction_count += int(count)
+            daily_breakdown[day.day] = {
+                "income": from_cents(int(day_income)),
+                "expenses": from_cents(int(day_expenses)),
+                "count": int(count)
+            }
 
         return {
             "year": year,
             "month": month,
-            "total_income": round(income, 2),
-            "total_expenses": round(expenses, 2),
-            "net_amount": round(income - expenses, 2),
-            "transaction_count": len(transactions),
+            "total_income": from_cents(income),
+            "total_expenses": from_cents(expenses),
+            "net_amount": from_cents(income - expenses),
+            "transaction_count": transaction_count,
             "daily_breakdown": daily_breakdown
         }
+
+    def get_monthly_summary(self, db: Session, year: int, month: int) -> Dict:
+        """Get monthly transaction summary from at most one group of rollup rows per day"""
+        return self._monthly_result(year, month, db.execute(self._monthly_query(year, month)).all())
+
+    async def get_monthly_summary_async(self, db: AsyncSession, year: int, month: int) -> Dict:
+        return self._monthly_result(year, month, (await db.execute(self._monthly_query(year, month))).all())
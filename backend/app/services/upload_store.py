@@ -0,0 +1,148 @@
+import hashlib
+import os
+import tempfile
+from typing import TYPE_CHECKING, BinaryIO, Tuple
+import aiofiles
+import aiofiles.os
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from fastapi import UploadFile
+
+CHUNK_SIZE = 1024 * 1024
+# Readers accept the %PDF- signature anywhere in the first 1024 bytes
+PDF_SIGNATURE = b"%PDF-"
+PDF_HEADER_WINDOW = 1024
+
+class UploadRejected(ValueError):
+    """An upload that is not stored: too large or not a PDF"""
+
+class UploadTooLarge(UploadRejected):
+    pass
+
+class NotAPDF(UploadRejected):
+    pass
+
+class UploadDigest:
+    """Size cap, PDF signature check and sha256 of an upload, fed chunk by chunk as it is written.
+
+    `update` raises as soon as the cap is crossed or the header shows the file
+    is not a PDF, so a bad upload is rejected without reading the rest of it.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+        self._head = b""
+
+    def update(self, chunk: bytes):
+        self.size += len(chunk)
+        if self.size > self.max_size:
+            raise UploadTooLarge(f"File exceeds the {self.max_size // (1024 * 1024)}MB upload limit")
+        if len(self._head) < PDF_HEADER_WINDOW:
+            self._head += chunk[:PDF_HEADER_WINDOW - len(self._head)]
+            if len(self._head) == PDF_HEADER_WINDOW:
+                self._check_signature()
+        self.sha256.update(chunk)
+
+    def _check_signature(self):
+        if PDF_SIGNATURE not in self._head:
+            raise NotAPDF("File is not a PDF")
+
+    def hexdigest(self) -> str:
+        """sha256 of the whole upload; also checks the signature of files shorter than the header window"""
+        self._check_signature()
+        return self.sha256.hexdigest()
+
+def content_path(file_hash: str) -> str:
+    """Location of a stored upload: UPLOAD_DIR/<first two hex digits>/<sha256>.pdf"""
+    return os.path.join(settings.UPLOAD_DIR, file_hash[:2], f"{file_hash}.pdf")
+
+def _temp_path() -> str:
+    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=settings.UPLOAD_DIR, suffix=".part")
+    os.close(fd)
+    return tmp_path
+
+def _final_path(file_hash: str) -> str:
+    path = content_path(file_hash)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+def save_upload(fileobj: BinaryIO, max_size: int = settings.MAX_UPLOAD_SIZE) -> Tuple[str, str]:
+    """Copy an upload into the content-addressed store, checking and hashing it in the same pass.
+
+    Returns (sha256 hex digest, stored path). Identical files land on the same
+    path, so re-uploading a statement never creates a second copy. Raises
+    UploadTooLarge or NotAPDF, leaving nothing behind, if the file is rejected.
+    """
+    digest = UploadDigest(max_size)
+    tmp_path = _temp_path()
+    try:
+        with open(tmp_path, "wb") as buffer:
+            for chunk in iter(lambda: fileobj.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+                buffer.write(chunk)
+
+        file_hash = digest.hexdigest()
+        path = _final_path(file_hash)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return file_hash, path
+
+def store_upload_bytes(file_hash: str, data: bytes) -> str:
+    """Write an upload held in memory to the content-addressed store; returns its path"""
+    path = content_path(file_hash)
+    if os.path.exists(path):
+        return path
+    tmp_path = _temp_path()
+    try:
+        with open(tmp_path, "wb") as buffer:
+            buffer.write(data)
+        os.replace(tmp_path, _final_path(file_hash))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+def read_upload(fileobj: BinaryIO, max_size: int = settings.MAX_UPLOAD_SIZE) -> Tuple[str, bytes]:
+    """Read a small upload into memory with the same checks as `save_upload`; returns (sha256 hex digest, bytes)"""
+    digest = UploadDigest(max_size)
+    chunks = []
+    for chunk in iter(lambda: fileobj.read(CHUNK_SIZE), b""):
+        digest.update(chunk)
+        chunks.append(chunk)
+    return digest.hexdigest(), b"".join(chunks)
+
+async def read_upload_async(upload: "UploadFile", max_size: int = settings.MAX_UPLOAD_SIZE) -> Tuple[str, bytes]:
+    """`read_upload` for an UploadFile"""
+    digest = UploadDigest(max_size)
+    chunks = []
+    while chunk := await upload.read(CHUNK_SIZE):
+        digest.update(chunk)
+        chunks.append(chunk)
+    return digest.hexdigest(), b"".join(chunks)
+
+async def save_upload_async(upload: "UploadFile", max_size: int = settings.MAX_UPLOAD_SIZE) -> Tuple[str, str]:
+    """`save_upload` for an UploadFile, writing with aiofiles so the event loop is never blocked on disk"""
+    digest = UploadDigest(max_size)
+    tmp_path = _temp_path()
+    try:
+        async with aiofiles.open(tmp_path, "wb") as buffer:
+            while chunk := await upload.read(CHUNK_SIZE):
+                digest.update(chunk)
+                await buffer.write(chunk)
+
+        file_hash = digest.hexdigest()
+        path = _final_path(file_hash)
+        await aiofiles.os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            await aiofiles.os.remove(tmp_path)
+        raise
+    return file_hash, path
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+"""
+Benchmark: analytics from raw transactions vs from daily rollups
+
+Fills a scratch SQLite database, then compares the original load-everything
+get_analytics / get_monthly_summary and a SQL GROUP BY over the raw table with
+the rollup-backed versions in TransactionService. Reports wall time, peak
+traced memory, and whether all of them produce the same numbers.
+
+    cd backend && python -m benchmarks.bench_analytics [--rows 200000]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, extract, func, insert
+from sqlalchemy.orm import sessionmaker
+from app.core.migrations import upgrade_database
+from app.core.money import from_cents
+from app.models.transaction import Statement, Transaction, TransactionCategory, TransactionStatus
+from app.services.rollup_service import RollupService, INCOME_CENTS, EXPENSE_CENTS
+from app.services.transaction_service import TransactionService, month_range
+
+def fill(db, rows: int):
+    random.seed(5)
+    statement = Statement(filename="bench.pdf", bank_name="DBS", status="completed")
+    db.add(statement)
+    db.flush()
+    categories = list(TransactionCategory)
+    statuses = list(TransactionStatus)
+    start = datetime(2024, 1, 1)
+    chunk = []
+    for i in range(rows):
+        chunk.append({
+            "statement_id": statement.id,
+            "transaction_date": start + timedelta(days=i % 90),
+            "description": f"MERCHANT {i % 500}",
+            "amount_cents": random.randint(-50000, 50000),
+            "category": random.choice(categories),
+            "status": random.choice(statuses)
+        })
+        if len(chunk) == 5000:
+            db.execute(insert(Transaction.__table__), chunk)
+            chunk = []
+    if chunk:
+        db.execute(insert(Transaction.__table__), chunk)
+    RollupService().rebuild(db)
+    db.commit()
+
+def legacy_analytics(db):
+    """get_analytics as it was: every row loaded, aggregated in Python"""
+    transactions = db.query(Transaction).all()
+    total_income = sum(t.amount_cents for t in transactions if t.amount_cents > 0)
+    total_expenses = sum(abs(t.amount_cents) for t in transactions if t.amount_cents < 0)
+    category_breakdown = {}
+    for trans in transactions:
+        breakdown = category_breakdown.setdefault(trans.category, {"total": 0, "count": 0, "transactions": []})
+        breakdown["total"] += abs(trans.amount_cents)
+        breakdown["count"] += 1
+    for breakdown in category_breakdown.values():
+        breakdown["total"] = from_cents(breakdown["total"])
+    status_counts = {
+        status.value: len([t for t in transactions if t.status == status]) for status in TransactionStatus
+    }
+    return {
+        "total_transactions": len(transactions),
+        "total_income": from_cents(total_income),
+        "total_expenses": from_cents(total_expenses),
+        "net_amount": from_cents(total_income - total_expenses),
+        "category_breakdown": category_breakdown,
+        "status_breakdown": status_counts
+    }
+
+def legacy_monthly(db, year: int, month: int):
+    """get_monthly_summary as it was: every row of the month loaded, grouped in Python"""
+    start, end = month_range(year, month)
+    transactions = db.query(Transaction).filter(
+        Transaction.transaction_date >= start, Transaction.transaction_date < end
+    ).all()
+    income = sum(t.amount_cents for t in transactions if t.amount_cents > 0)
+    expenses = sum(abs(t.amount_cents) for t in transactions if t.amount_cents < 0)
+    daily_breakdown = {}
+    for trans in transactions:
+        day = daily_breakdown.setdefault(trans.transaction_date.day, {"income": 0, "expenses": 0, "count": 0})
+        if trans.amount_cents > 0:
+            day["income"] += trans.amount_cents
+        else:
+            day["expenses"] += abs(trans.amount_cents)
+        day["count"] += 1
+    for day in daily_breakdown.values():
+        day["income"] = from_cents(day["income"])
+        day["expenses"] = from_cents(day["expenses"])
+    return {
+        "year": year,
+        "month": month,
+        "total_income": from_cents(income),
+        "total_expenses": from_cents(expenses),
+        "net_amount": from_cents(income - expenses),
+        "transaction_count": len(transactions),
+        "daily_breakdown": daily_breakdown
+    }
+
+def grouped_monthly(db, year: int, month: int):
+    """get_monthly_summary as a GROUP BY over raw transactions (scans the month's rows)"""
+    start, end = month_range(year, month)
+    day = extract("day", Transaction.transaction_date)
+    rows = db.query(day, func.count(Transaction.id), INCOME_CENTS, EXPENSE_CENTS).filter(
+        Transaction.transaction_date >= start, Transaction.transaction_date < end
+    ).group_by(day).order_by(day)
+    income = expenses = transaction_count = 0
+    daily_breakdown = {}
+    for day_of_month, count, day_income, day_expenses in rows:
+        income += day_income
+        expenses += day_expenses
+        transaction_count += count
+        daily_breakdown[int(day_of_month)] = {
+            "income": from_cents(day_income), "expenses": from_cents(day_expenses), "count": count
+        }
+    return {
+        "year": year,
+        "month": month,
+        "total_income": from_cents(income),
+        "total_expenses": from_cents(expenses),
+        "net_amount": from_cents(income - expenses),
+        "transaction_count": transaction_count,
+        "daily_breakdown": daily_breakdown
+    }
+
+def measure(db, run):
+    db.expunge_all()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = run(db)
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+def main():
+    parser = argparse.ArgumentParser(description="Analytics aggregation benchmark")
+    parser.add_argument("--rows", type=int, default=200000)
+    args = parser.parse_args()
+
+    service = TransactionService()
+    cases = [
+        ("get_analytics", [
+            ("python loops", legacy_analytics),
+            ("daily rollups", service.get_analytics),
+        ]),
+        ("get_monthly_summary", [
+            ("python loops", lambda db: legacy_monthly(db, 2024, 2)),
+            ("SQL GROUP BY", lambda db: grouped_monthly(db, 2024, 2)),
+            ("daily rollups", lambda db: service.get_monthly_summary(db, 2024, 2)),
+        ]),
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'analytics.db')}")
+        upgrade_database(engine)
+        db = sessionmaker(bind=engine)()
+        fill(db, args.rows)
+
+        for name, variants in cases:
+            print(f"{name} ({args.rows} rows)")
+            results = []
+            for label, run in variants:
+                result, elapsed, peak = measure(db, run)
+                results.append(result)
+                print(f"  {label:<14}{elapsed * 1000:>9.1f} ms  peak {peak / 2**20:>7.1f} MB")
+            print(f"  same result: {all(result == results[0] for result in results)}")
+
+        db.close()
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
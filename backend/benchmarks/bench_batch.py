@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""
+Benchmark: per-row dicts vs columnar TransactionBatch through parse -> categorize
+
+Measures wall time, peak traced memory and the number of live allocations
+left after the pipeline for a synthetic statement.
+
+    cd backend && python -m benchmarks.bench_batch [--rows 5000]
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from app.ml.categorizer import TransactionCategorizer
+from app.parsers.batch import TransactionBatch
+
+DESCRIPTIONS = [
+    "GRAB*TRIP 1234-5678", "NTUC FP-XYZ 0923", "SALARY ACME PTE LTD", "NETFLIX.COM",
+    "PAYNOW TRANSFER TO J TAN", "STARBUCKS ORCHARD", "SP SERVICES BILL", "LAZADA SG",
+]
+
+def make_rows(count: int):
+    random.seed(7)
+    start = datetime(2024, 1, 1)
+    return [
+        (start + timedelta(days=i % 31), random.choice(DESCRIPTIONS), random.randint(-50000, 50000), random.randint(0, 10**7))
+        for i in range(count)
+    ]
+
+def dict_pipeline(rows, categorizer):
+    transactions = [
+        {"date": date, "description": description, "amount_cents": amount, "balance_cents": balance}
+        for date, description, amount, balance in rows
+    ]
+    return categorizer.batch_categorize(transactions)
+
+def batch_pipeline(rows, categorizer):
+    batch = TransactionBatch()
+    for date, description, amount, balance in rows:
+        batch.append(date, description, amount, balance)
+    return categorizer.batch_categorize(batch)
+
+def measure(label, pipeline, rows, categorizer):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    started = time.perf_counter()
+    result = pipeline(rows, categorizer)
+    elapsed = time.perf_counter() - started
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    retained = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    print(f"{label:<18} {elapsed:>7.3f}s  peak {peak / 1024:>9,.0f} KiB  "
+          f"retained {retained / 1024:>9,.0f} KiB  blocks {blocks:>9,}")
+    del result
+    return peak
+
+def main():
+    parser = argparse.ArgumentParser(description="TransactionBatch memory benchmark")
+    parser.add_argument("--rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    categorizer = TransactionCategorizer()
+
+    legacy = measure("list of dicts", dict_pipeline, rows, categorizer)
+    columnar = measure("TransactionBatch", batch_pipeline, rows, categorizer)
+    print(f"peak memory reduced {legacy / columnar:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Benchmark: batch ingestion throughput by number of parse processes
+
+Queues COPIES jobs for each given statement PDF, as a batch upload does, and
+times how long the ingestion queue takes to finish all of them with parsing on
+the job threads (0 processes, as before) and on pools of 1, 2, 4, ... processes.
+Jobs are queued without a content hash, so every copy is parsed from scratch
+instead of being deduplicated or read from the extraction cache. Reports
+statements/s and speedup over the thread-only queue.
+
+    cd backend && python -m benchmarks.bench_batch_upload STATEMENT.pdf [...] [--copies 12] [--processes 0,1,2,4]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+# Point the app's engines at a scratch database before they are created. Spawned
+# parse processes import this module again and must reuse the same directory.
+directory = os.environ.get("BENCH_BATCH_UPLOAD_DIR") or tempfile.mkdtemp()
+os.environ["BENCH_BATCH_UPLOAD_DIR"] = directory
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(directory, 'batch.db')}"
+
+from sqlalchemy import func, select
+from app.core.database import SessionLocal, engine
+from app.core.migrations import upgrade_database
+from app.models.job import IngestionJob, JobStatus
+from app.services.job_service import JobQueue
+from app.services.statement_service import StatementService
+
+def run(paths, copies: int, processes: int, statement_service: StatementService) -> float:
+    queue = JobQueue(statement_service, processes=processes)
+    if queue.parse_executor is not None:
+        # Start the workers before timing, as a running server already has them
+        list(queue.parse_executor.map(abs, range(processes)))
+
+    db = SessionLocal()
+    try:
+        db.query(IngestionJob).delete()
+        db.commit()
+        started = time.perf_counter()
+        for _ in range(copies):
+            for path in paths:
+                queue.enqueue(db, path, os.path.basename(path))
+        total = copies * len(paths)
+        while True:
+            finished = db.execute(
+                select(func.count()).where(IngestionJob.status.in_([JobStatus.COMPLETED, JobStatus.FAILED]))
+            ).scalar_one()
+            db.rollback()
+            if finished >= total:
+                break
+            time.sleep(0.05)
+        elapsed = time.perf_counter() - started
+        failed = db.query(IngestionJob).filter(IngestionJob.status == JobStatus.FAILED).count()
+    finally:
+        db.close()
+        queue.shutdown(wait=True)
+    if failed:
+        print(f"    {failed} of {total} jobs failed")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch ingestion throughput by parse processes")
+    parser.add_argument("pdfs", nargs="+", help="statement PDFs to ingest")
+    parser.add_argument("--copies", type=int, default=12, help="jobs per PDF")
+    parser.add_argument("--processes", default="0,1,2,4")
+    args = parser.parse_args()
+
+    upgrade_database()
+    statement_service = StatementService()
+    # Work on copies in the scratch directory
+    paths = [shutil.copy(path, directory) for path in args.pdfs]
+    total = args.copies * len(paths)
+
+    print(f"{total} statements ({len(paths)} PDFs x {args.copies}), {os.cpu_count()} cores")
+    baseline = None
+    for processes in (int(value) for value in args.processes.split(",")):
+        elapsed = run(paths, args.copies, processes, statement_service)
+        baseline = baseline or elapsed
+        label = "job threads" if processes == 0 else f"{processes} processes"
+        print(f"  {label:<13}{elapsed:>7.2f}s  {total / elapsed:>7.1f} statements/s  x{baseline / elapsed:.2f}")
+    engine.dispose()
+
+if __name__ == "__main__":
+    main()
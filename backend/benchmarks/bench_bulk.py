@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Benchmark: reviewing a statement one call at a time vs one bulk call
+
+Applies the same review session to a scratch SQLite database, through the
+single-transaction methods (one SELECT, UPDATE, commit and refresh each) and
+through TransactionService.bulk_update. Reports time and committed DB
+transactions, and whether both leave the same rows and consistent rollups.
+
+    cd backend && python -m benchmarks.bench_bulk [--operations 400]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+# Keep the benchmark's approvals out of the real category model
+os.environ["CATEGORY_MODEL_ENABLED"] = "false"
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.core.migrations import upgrade_database
+from app.models.transaction import Transaction, TransactionCategory
+from app.services.rollup_service import RollupService
+from app.services.transaction_service import TransactionService
+from benchmarks.bench_analytics import fill
+
+def review_session(count: int, max_id: int):
+    random.seed(17)
+    categories = [category.value for category in TransactionCategory]
+    operations = []
+    for transaction_id in random.sample(range(1, max_id + 1), count):
+        action = random.choices(["approve", "categorize", "update", "reject"], weights=[6, 2, 1, 1])[0]
+        operation = {"id": transaction_id, "action": action}
+        if action == "categorize":
+            operation["category"] = random.choice(categories)
+        elif action == "update":
+            operation.update(description=f"EDITED {transaction_id}", amount=-12.34)
+        operations.append(operation)
+    return operations
+
+def one_by_one(service, db, operations):
+    for operation in operations:
+        if operation["action"] == "approve":
+            service.approve_transaction(db, operation["id"])
+        elif operation["action"] == "reject":
+            service.reject_transaction(db, operation["id"])
+        else:
+            updates = {key: operation[key] for key in ("description", "amount", "category") if key in operation}
+            service.update_transaction(db, operation["id"], updates)
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk review benchmark")
+    parser.add_argument("--operations", type=int, default=400)
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    service = TransactionService()
+    operations = review_session(args.operations, args.rows)
+    states = []
+    with tempfile.TemporaryDirectory() as directory:
+        for label, run in (
+            ("one call per operation", lambda db: one_by_one(service, db, operations)),
+            ("bulk_update", lambda db: service.bulk_update(db, operations)),
+        ):
+            engine = create_engine(f"sqlite:///{os.path.join(directory, f'{len(states)}.db')}")
+            upgrade_database(engine)
+            db = sessionmaker(bind=engine, autoflush=False)()
+            fill(db, args.rows)
+            commits = []
+            event.listen(engine, "commit", lambda conn: commits.append(1))
+
+            started = time.perf_counter()
+            run(db)
+            elapsed = time.perf_counter() - started
+            print(f"{label:<24}{elapsed * 1000:>9.1f} ms  {len(commits):>4} commits")
+
+            states.append(sorted(
+                (t.id, t.description, t.amount_cents, t.category, t.status, t.original_description, t.original_amount_cents)
+                for t in db.query(Transaction).filter(Transaction.id.in_([op["id"] for op in operations]))
+            ))
+            assert RollupService().check(db) == [], f"{label}: rollups out of step"
+            db.close()
+            engine.dispose()
+    print(f"same result: {states[0] == states[1]}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+"""
+Benchmark: request latency under mixed read/write load, sync vs async sessions
+
+Serves the real API in-process next to "legacy" copies of the same routes that
+run a sync Session inside `async def`, as every route did before. Concurrent
+clients read transaction pages and single transactions and approve
+transactions, while a background thread keeps ingesting statements the way
+the job workers do. Reports p50/p99 latency per request kind for both.
+
+    cd backend && python -m benchmarks.bench_concurrency [--rows 100000] [--clients 20] [--seconds 10]
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+# Point the app's engines at a scratch database before they are created
+directory = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(directory, 'concurrency.db')}"
+# Keep the benchmark's approvals out of the real category model
+os.environ["CATEGORY_MODEL_ENABLED"] = "false"
+
+import httpx
+from fastapi import APIRouter, FastAPI
+from app.api import router
+from app.core.database import SessionLocal, async_engine, engine
+from app.core.migrations import upgrade_database
+from app.models.transaction import Statement, TransactionCategory
+from app.services.statement_service import StatementService
+from app.services.transaction_service import TransactionService, TransactionFilters
+from benchmarks.bench_analytics import fill
+from benchmarks.bench_insert import make_batch
+
+service = TransactionService()
+legacy = APIRouter()
+
+# Each legacy route closes its session before returning; holding it until the
+# dependency teardown, as get_db does, can exhaust the pool and stall the loop
+
+@legacy.get("/transactions/")
+async def legacy_list(category: str = None):
+    with SessionLocal() as db:
+        items, next_cursor = service.list_transactions(db, TransactionFilters(category=category))
+    return {"items": items, "next_cursor": next_cursor}
+
+@legacy.get("/transactions/{transaction_id}")
+async def legacy_get(transaction_id: int):
+    with SessionLocal() as db:
+        return {"id": service.get_transaction(db, transaction_id).id}
+
+@legacy.post("/transactions/{transaction_id}/approve")
+async def legacy_approve(transaction_id: int):
+    with SessionLocal() as db:
+        return {"id": service.approve_transaction(db, transaction_id).id}
+
+app = FastAPI()
+app.include_router(router, prefix="/api/v1")
+app.include_router(legacy, prefix="/legacy")
+
+def ingest(stop: threading.Event, batch_rows: int):
+    """Keep inserting statements, like the ingestion workers do"""
+    statement_service = StatementService()
+    batch = make_batch(batch_rows)
+    while not stop.is_set():
+        db = SessionLocal()
+        try:
+            statement = Statement(filename="load.pdf", bank_name="DBS", status="completed")
+            db.add(statement)
+            db.flush()
+            statement_service._add_transactions(db, statement, batch)
+            db.commit()
+        finally:
+            db.close()
+
+async def client(http, prefix: str, max_id: int, deadline: float, latencies):
+    categories = [category.value for category in TransactionCategory]
+    while time.perf_counter() < deadline:
+        kind = random.choices(["list", "get", "approve"], weights=[6, 3, 1])[0]
+        transaction_id = random.randint(1, max_id)
+        started = time.perf_counter()
+        if kind == "list":
+            response = await http.get(f"{prefix}/transactions/", params={"category": random.choice(categories)})
+        elif kind == "get":
+            response = await http.get(f"{prefix}/transactions/{transaction_id}")
+        else:
+            response = await http.post(f"{prefix}/transactions/{transaction_id}/approve")
+        # Failures (e.g. "database is locked" on a contended write) are counted, not timed
+        latencies[kind if response.is_success else f"{kind} fail"].append(time.perf_counter() - started)
+
+def percentile(values, fraction: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+async def run(prefix: str, clients: int, seconds: float, max_id: int):
+    latencies = defaultdict(list)
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        deadline = time.perf_counter() + seconds
+        await asyncio.gather(*(client(http, prefix, max_id, deadline, latencies) for _ in range(clients)))
+    return latencies
+
+def main():
+    parser = argparse.ArgumentParser(description="Mixed-load latency benchmark")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--ingest-rows", type=int, default=5000, help="rows per ingested statement")
+    args = parser.parse_args()
+
+    upgrade_database()
+    db = SessionLocal()
+    fill(db, args.rows)
+    db.close()
+
+    stop = threading.Event()
+    writer = threading.Thread(target=ingest, args=(stop, args.ingest_rows), daemon=True)
+    writer.start()
+    try:
+        print(f"{args.clients} clients, {args.seconds:g}s each, {args.rows} rows + ingest of {args.ingest_rows}-row statements")
+        for label, prefix in (("sync session in async def", "/legacy"), ("async session", "/api/v1")):
+            latencies = asyncio.run(run(prefix, args.clients, args.seconds, args.rows))
+            print(f"  {label}")
+            for kind, values in sorted(latencies.items()):
+                print(
+                    f"    {kind:<13}{len(values) / args.seconds:>7.0f} req/s"
+                    f"  p50 {percentile(values, 0.5) * 1000:>7.1f} ms  p99 {percentile(values, 0.99) * 1000:>7.1f} ms"
+                )
+    finally:
+        stop.set()
+        writer.join()
+        asyncio.run(async_engine.dispose())
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark: date cell parsing, rows per second
+
+Compares the per-row dateparser.parse call the parsers used to make with the
+per-bank DateParser fast path (strptime formats + memo + year inference).
+
+    cd backend && python -m benchmarks.bench_dates [--rows 5000]
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+import dateparser
+from app.parsers.dbs_parser import DBSParser
+
+def make_cells(rows: int):
+    """Date column of a statement: mostly dates, some header/junk cells"""
+    random.seed(42)
+    start = datetime(2023, 12, 1)
+    junk = ["Date", "Balance B/F", "Total", "Page 2 of 3", "CURRENCY: SGD"]
+    cells = []
+    for i in range(rows):
+        if i % 10 == 0:
+            cells.append(random.choice(junk))
+            continue
+        day = start + timedelta(days=random.randint(0, 60))
+        fmt = random.choice(["%d %b %Y", "%d %b", "%d/%m/%Y"])
+        cells.append(day.strftime(fmt))
+    return cells
+
+def bench(label, fn, cells):
+    started = time.perf_counter()
+    parsed = sum(1 for cell in cells if fn(cell) is not None)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<20} {len(cells) / elapsed:>12,.0f} rows/s  ({parsed} dates, {elapsed:.3f}s)")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Date cell parsing benchmark")
+    parser.add_argument("--rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    cells = make_cells(args.rows)
+
+    def legacy(cell):
+        try:
+            return dateparser.parse(cell)
+        except Exception:
+            return None
+
+    statement_parser = DBSParser()
+    statement_parser.date_parser.set_period(datetime(2023, 12, 1), datetime(2024, 1, 31))
+
+    baseline = bench("dateparser.parse", legacy, cells)
+    fast = bench("DateParser", statement_parser.parse_date, cells)
+    print(f"speedup: {baseline / fast:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+Benchmark: concurrent readers during a large ingest, per database engine profile
+
+For each profile, fills a scratch SQLite database, then runs reader threads
+that fetch transaction pages and analytics while a writer thread keeps
+ingesting large statements. Reports reader latency (p50/p99/max), reader
+errors and ingest throughput. With the rollback journal ("plain"), readers
+stall whenever the writer commits; with WAL ("production") they do not.
+Readers and writer share one process, so readers that are no longer blocked
+also take CPU (and the GIL) away from the ingest.
+
+    cd backend && python -m benchmarks.bench_engine_profiles [--rows 100000] [--readers 8] [--seconds 10]
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from app.core.database import create_database_engine
+from app.core.migrations import upgrade_database
+from app.models.transaction import Statement, TransactionCategory
+from app.services.statement_service import StatementService
+from app.services.transaction_service import TransactionService, TransactionFilters
+from benchmarks.bench_analytics import fill
+from benchmarks.bench_insert import make_batch
+
+def ingest(session_factory, stop: threading.Event, batch, counts):
+    statement_service = StatementService()
+    while not stop.is_set():
+        db = session_factory()
+        try:
+            statement = Statement(filename="ingest.pdf", bank_name="DBS", status="completed")
+            db.add(statement)
+            db.flush()
+            statement_service._add_transactions(db, statement, batch)
+            db.commit()
+            counts["rows"] += len(batch)
+        except OperationalError:
+            db.rollback()
+            counts["errors"] += 1
+        finally:
+            db.close()
+
+def read(session_factory, stop: threading.Event, latencies, errors):
+    service = TransactionService()
+    categories = [category.value for category in TransactionCategory]
+    while not stop.is_set():
+        db = session_factory()
+        started = time.perf_counter()
+        try:
+            if random.random() < 0.8:
+                service.list_transactions(db, TransactionFilters(category=random.choice(categories)))
+            else:
+                service.get_analytics(db)
+            latencies.append(time.perf_counter() - started)
+        except OperationalError:
+            errors.append(time.perf_counter() - started)
+        finally:
+            db.close()
+
+def percentile(values, fraction: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+def run(profile: str, directory: str, args):
+    engine = create_database_engine(f"sqlite:///{os.path.join(directory, f'{profile}.db')}", profile)
+    upgrade_database(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    db = session_factory()
+    fill(db, args.rows)
+    db.close()
+
+    stop = threading.Event()
+    counts = {"rows": 0, "errors": 0}
+    latencies, errors = [], []
+    threads = [threading.Thread(target=ingest, args=(session_factory, stop, make_batch(args.ingest_rows), counts))]
+    threads += [
+        threading.Thread(target=read, args=(session_factory, stop, latencies, errors)) for _ in range(args.readers)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    print(f"  {profile}")
+    if latencies:
+        print(
+            f"    reads  {len(latencies) / args.seconds:>7.0f}/s  p50 {percentile(latencies, 0.5) * 1000:>7.1f} ms"
+            f"  p99 {percentile(latencies, 0.99) * 1000:>7.1f} ms  max {max(latencies) * 1000:>7.1f} ms  errors {len(errors)}"
+        )
+    print(f"    ingest {counts['rows'] / args.seconds:>7.0f} rows/s  errors {counts['errors']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Readers during ingest, per engine profile")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--ingest-rows", type=int, default=20000, help="rows per ingested statement")
+    parser.add_argument("--profiles", default="plain,production")
+    args = parser.parse_args()
+
+    print(f"{args.readers} readers, {args.seconds:g}s, {args.rows} rows + ingest of {args.ingest_rows}-row statements")
+    with tempfile.TemporaryDirectory() as directory:
+        for profile in args.profiles.split(","):
+            run(profile, directory, args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""
+Benchmark: streaming transaction export in CSV, NDJSON and XLSX
+
+Fills a scratch SQLite database and drains ExportService for each format,
+reporting time to first chunk, total time, bytes written and how far the
+process RSS grew while exporting. RSS growth should stay flat as --rows grows.
+
+    cd backend && python -m benchmarks.bench_export [--rows 200000] [--formats csv,ndjson,xlsx]
+"""
+import argparse
+import os
+import tempfile
+import time
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.migrations import upgrade_database
+from app.services.export_service import ExportService
+from app.services.transaction_service import TransactionFilters
+from benchmarks.bench_analytics import fill
+
+def rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+def main():
+    parser = argparse.ArgumentParser(description="Transaction export benchmark")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--formats", default="csv,ndjson,xlsx")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'export.db')}")
+        upgrade_database(engine)
+        session_factory = sessionmaker(bind=engine)
+        db = session_factory()
+        fill(db, args.rows)
+        db.close()
+
+        service = ExportService(session_factory=session_factory)
+        print(f"export ({args.rows} rows)")
+        for export_format in args.formats.split(","):
+            baseline = peak = rss_mb()
+            started = time.perf_counter()
+            first_chunk = None
+            size = 0
+            for chunk in service.stream(TransactionFilters(), export_format):
+                if first_chunk is None:
+                    first_chunk = time.perf_counter() - started
+                size += len(chunk)
+                peak = max(peak, rss_mb())
+            elapsed = time.perf_counter() - started
+            print(
+                f"  {export_format:<7} first chunk {first_chunk * 1000:>8.1f} ms  total {elapsed:>6.2f} s"
+                f"  {size / 2**20:>7.1f} MB out  RSS +{peak - baseline:>6.1f} MB"
+            )
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Benchmark: persisting a parsed statement's transactions
+
+Compares the previous path, one ORM Transaction object per row (db.add +
+commit), with the bulk INSERT path in StatementService._add_transactions, on a
+fresh SQLite file. Both paths include categorizing the batch.
+
+    cd backend && python -m benchmarks.bench_insert [--rows 10000]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.models.transaction import Statement, Transaction
+from app.parsers.batch import TransactionBatch
+from app.services.statement_service import StatementService
+
+DESCRIPTIONS = [
+    "GRAB*TRIP 1234-5678", "NTUC FP-XYZ 0923", "SALARY ACME PTE LTD", "NETFLIX.COM",
+    "PAYNOW TRANSFER TO J TAN", "STARBUCKS ORCHARD", "SP SERVICES BILL", "LAZADA SG",
+]
+
+def make_batch(count: int) -> TransactionBatch:
+    random.seed(11)
+    start = datetime(2024, 1, 1)
+    batch = TransactionBatch()
+    for i in range(count):
+        batch.append(start + timedelta(days=i % 31), random.choice(DESCRIPTIONS),
+                     random.randint(-50000, 50000), random.randint(0, 10**7))
+    return batch
+
+def new_session(directory: str, name: str):
+    engine = create_engine(f"sqlite:///{os.path.join(directory, name)}")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    statement = Statement(filename=name, bank_name="DBS", status="completed")
+    db.add(statement)
+    db.flush()
+    return db, statement
+
+def orm_insert(db, statement, batch: TransactionBatch, categorizer):
+    columns = categorizer.batch_categorize(batch).insert_columns(statement.id)
+    for values in zip(*columns.values()):
+        db.add(Transaction(**dict(zip(columns, values))))
+    db.commit()
+
+def main():
+    parser = argparse.ArgumentParser(description="Transaction insert benchmark")
+    parser.add_argument("--rows", type=int, default=10000)
+    args = parser.parse_args()
+
+    service = StatementService()
+    batch = make_batch(args.rows)
+    # Warm the merchant-key cache so neither run pays for first-time matching
+    service.categorizer.batch_categorize(batch)
+
+    with tempfile.TemporaryDirectory() as directory:
+        db, statement = new_session(directory, "orm.db")
+        started = time.perf_counter()
+        orm_insert(db, statement, batch, service.categorizer)
+        orm_elapsed = time.perf_counter() - started
+        db.close()
+
+        db, statement = new_session(directory, "bulk.db")
+        started = time.perf_counter()
+        service._add_transactions(db, statement, batch)
+        db.commit()
+        bulk_elapsed = time.perf_counter() - started
+        inserted = db.query(func.count(Transaction.id)).scalar()
+        db.close()
+
+    print(f"ORM objects    {args.rows / orm_elapsed:>12,.0f} rows/s")
+    print(f"bulk insert    {args.rows / bulk_elapsed:>12,.0f} rows/s ({inserted} rows)")
+    print(f"speedup: {orm_elapsed / bulk_elapsed:.1f}x")
+
+if __name__ == "__main__":
+    main()
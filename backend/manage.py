@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Backend maintenance commands
+
+    python manage.py reprocess [STATEMENT_ID ...] [--discard-edits]
+                                                    re-run parsers on stored statements, keeping reviews
+    python manage.py cache-stats                    show extraction cache counters
+    python manage.py rollups rebuild|check          recompute or verify analytics rollups
+
+Commands that change data bump the analytics cache version, which a running server
+sees straight away with the default file backend (or sqlite); with the memory
+backend, restart it afterwards.
+"""
+import argparse
+import json
+import sys
+import time
+from app.core.cache import analytics_cache
+from app.core.database import SessionLocal
+from app.models.transaction import Statement
+from app.parsers.extraction_cache import extraction_cache
+from app.services.rollup_service import RollupService
+from app.services.statement_service import StatementService
+
+def reprocess(args):
+    statement_service = StatementService()
+    db = SessionLocal()
+    try:
+        statement_ids = args.statement_ids or [
+            statement_id for (statement_id,) in
+            db.query(Statement.id).filter(Statement.file_hash.isnot(None)).order_by(Statement.id)
+        ]
+        started = time.perf_counter()
+        failed = 0
+        for statement_id in statement_ids:
+            result = statement_service.reprocess_statement(db, statement_id, discard_edits=args.discard_edits)
+            if "error" in result:
+                failed += 1
+                print(f"statement {statement_id}: {result['error']}")
+            elif args.verbose:
+                print(f"statement {statement_id}: {result['transaction_count']} transactions, "
+                      f"{result['reviews_kept']} reviews kept, {result['reviews_discarded']} discarded"
+                      f"{' (cached)' if result['from_cache'] else ''}")
+        elapsed = time.perf_counter() - started
+        print(f"Reprocessed {len(statement_ids) - failed}/{len(statement_ids)} statements in {elapsed:.2f}s")
+    finally:
+        db.close()
+    print(json.dumps(extraction_cache.stats(), indent=2))
+
+def cache_stats(args):
+    print(json.dumps(extraction_cache.stats(), indent=2))
+
+def rollups(args):
+    rollup_service = RollupService()
+    db = SessionLocal()
+    try:
+        if args.action == "rebuild":
+            started = time.perf_counter()
+            rows = rollup_service.rebuild(db)
+            db.commit()
+            analytics_cache.invalidate()
+            print(f"Rebuilt {rows} rollup rows in {time.perf_counter() - started:.2f}s")
+            return
+
+        mismatches = rollup_service.check(db)
+        for mismatch in mismatches[:args.limit]:
+            print(json.dumps(mismatch))
+        if mismatches:
+            print(f"{len(mismatches)} rollup keys differ from transactions; run 'manage.py rollups rebuild'")
+            sys.exit(1)
+        print("Rollups match transactions")
+    finally:
+        db.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Bank Statement Extractor maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    reprocess_parser = commands.add_parser("reprocess", help="Re-run parsers on stored statements")
+    reprocess_parser.add_argument("statement_ids", nargs="*", type=int, help="Statements to reprocess (default: all)")
+    reprocess_parser.add_argument(
+        "--discard-edits", action="store_true",
+        help="Replace statements whose reviewed transactions no longer match a parsed row, dropping those reviews"
+    )
+    reprocess_parser.add_argument("-v", "--verbose", action="store_true")
+    reprocess_parser.set_defaults(func=reprocess)
+
+    stats_parser = commands.add_parser("cache-stats", help="Show extraction cache counters")
+    stats_parser.set_defaults(func=cache_stats)
+
+    rollups_parser = commands.add_parser("rollups", help="Rebuild or check the analytics rollups")
+    rollups_parser.add_argument("action", choices=["rebuild", "check"])
+    rollups_parser.add_argument("--limit", type=int, default=20, help="Mismatches to print (check)")
+    rollups_parser.set_defaults(func=rollups)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Initial schema, as previously created by Base.metadata.create_all
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "statements",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("filename", sa.String(), nullable=False),
+        sa.Column("bank_name", sa.String(), nullable=False),
+        sa.Column("account_number", sa.String(), nullable=True),
+        sa.Column("statement_period_start", sa.DateTime(), nullable=True),
+        sa.Column("statement_period_end", sa.DateTime(), nullable=True),
+        sa.Column("uploaded_at", sa.DateTime(), nullable=True),
+        sa.Column("processed_at", sa.DateTime(), nullable=True),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_statements_id", "statements", ["id"])
+
+    op.create_table(
+        "transactions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("statement_id", sa.Integer(), nullable=False),
+        sa.Column("transaction_date", sa.DateTime(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("balance", sa.Float(), nullable=True),
+        sa.Column("reference", sa.String(), nullable=True),
+        sa.Column("category", sa.String(), nullable=True),
+        sa.Column("auto_categorized", sa.Boolean(), nullable=True),
+        sa.Column("confidence_score", sa.Float(), nullable=True),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.Column("reviewed_at", sa.DateTime(), nullable=True),
+        sa.Column("edited_at", sa.DateTime(), nullable=True),
+        sa.Column("original_description", sa.Text(), nullable=True),
+        sa.Column("original_amount", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["statement_id"], ["statements.id"]),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_transactions_id", "transactions", ["id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_transactions_id", table_name="transactions")
+    op.drop_table("transactions")
+    op.drop_index("ix_statements_id", table_name="statements")
+    op.drop_table("statements")
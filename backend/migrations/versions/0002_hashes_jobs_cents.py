@@ -0,0 +1,115 @@
+"""Content hashes, ingestion jobs and integer-cent money columns
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00
+
+Covers three schema changes that predate migrations and were originally applied
+with create_all: statement content hashes, the ingestion_jobs table and the
+switch from Float amounts to integer cents. A database created by create_all at
+an application version between 0001 and this revision can have any subset of
+them, so every step checks the live schema first and only adds what is missing.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+
+    if not _has_column(inspector, "statements", "file_hash"):
+        with op.batch_alter_table("statements") as batch_op:
+            batch_op.add_column(sa.Column("file_hash", sa.String(length=64), nullable=True))
+    if not _has_index(inspector, "statements", "ix_statements_file_hash"):
+        op.create_index("ix_statements_file_hash", "statements", ["file_hash"])
+
+    if not inspector.has_table("ingestion_jobs"):
+        op.create_table(
+            "ingestion_jobs",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("filename", sa.String(), nullable=False),
+            sa.Column("file_path", sa.String(), nullable=False),
+            sa.Column("file_hash", sa.String(length=64), nullable=True),
+            sa.Column("status", sa.String(), nullable=True),
+            sa.Column("attempts", sa.Integer(), nullable=True),
+            sa.Column("error", sa.Text(), nullable=True),
+            sa.Column("statement_id", sa.Integer(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("started_at", sa.DateTime(), nullable=True),
+            sa.Column("finished_at", sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(["statement_id"], ["statements.id"], ondelete="SET NULL"),
+            sa.PrimaryKeyConstraint("id")
+        )
+    elif not _has_column(inspector, "ingestion_jobs", "file_hash"):
+        # Job tables from before content hashing
+        with op.batch_alter_table("ingestion_jobs") as batch_op:
+            batch_op.add_column(sa.Column("file_hash", sa.String(length=64), nullable=True))
+    for name, column in (
+        ("ix_ingestion_jobs_id", "id"), ("ix_ingestion_jobs_file_hash", "file_hash"), ("ix_ingestion_jobs_status", "status")
+    ):
+        if not _has_index(inspector, "ingestion_jobs", name):
+            op.create_index(name, "ingestion_jobs", [column])
+
+    # Money moves from floats to exact integer cents
+    if not _has_column(inspector, "transactions", "amount_cents"):
+        with op.batch_alter_table("transactions") as batch_op:
+            batch_op.add_column(sa.Column("amount_cents", sa.Integer(), nullable=True))
+            batch_op.add_column(sa.Column("balance_cents", sa.Integer(), nullable=True))
+            batch_op.add_column(sa.Column("original_amount_cents", sa.Integer(), nullable=True))
+        op.execute(
+            "UPDATE transactions SET "
+            "amount_cents = CAST(ROUND(amount * 100) AS INTEGER), "
+            "balance_cents = CAST(ROUND(balance * 100) AS INTEGER), "
+            "original_amount_cents = CAST(ROUND(original_amount * 100) AS INTEGER)"
+        )
+        with op.batch_alter_table("transactions") as batch_op:
+            batch_op.alter_column("amount_cents", existing_type=sa.Integer(), nullable=False)
+            batch_op.drop_column("amount")
+            batch_op.drop_column("balance")
+            batch_op.drop_column("original_amount")
+
+
+def _has_column(inspector, table: str, column: str) -> bool:
+    return inspector.has_table(table) and column in {c["name"] for c in inspector.get_columns(table)}
+
+
+def _has_index(inspector, table: str, index: str) -> bool:
+    return inspector.has_table(table) and index in {i["name"] for i in inspector.get_indexes(table)}
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.add_column(sa.Column("amount", sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column("balance", sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column("original_amount", sa.Float(), nullable=True))
+    op.execute(
+        "UPDATE transactions SET "
+        "amount = amount_cents / 100.0, "
+        "balance = balance_cents / 100.0, "
+        "original_amount = original_amount_cents / 100.0"
+    )
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.alter_column("amount", existing_type=sa.Float(), nullable=False)
+        batch_op.drop_column("amount_cents")
+        batch_op.drop_column("balance_cents")
+        batch_op.drop_column("original_amount_cents")
+
+    op.drop_index("ix_ingestion_jobs_status", table_name="ingestion_jobs")
+    op.drop_index("ix_ingestion_jobs_file_hash", table_name="ingestion_jobs")
+    op.drop_index("ix_ingestion_jobs_id", table_name="ingestion_jobs")
+    op.drop_table("ingestion_jobs")
+
+    with op.batch_alter_table("statements") as batch_op:
+        batch_op.drop_index("ix_statements_file_hash")
+        batch_op.drop_column("file_hash")
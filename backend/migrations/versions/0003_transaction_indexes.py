@@ -0,0 +1,33 @@
+"""Composite indexes on transactions for the hot query paths
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_transactions_statement_date", "transactions", ["statement_id", "transaction_date", "id"])
+    op.create_index("ix_transactions_date", "transactions", ["transaction_date", "id"])
+    op.create_index("ix_transactions_status_date", "transactions", ["status", "transaction_date"])
+    op.create_index("ix_transactions_category_date", "transactions", ["category", "transaction_date"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_transactions_category_date", table_name="transactions")
+    op.drop_index("ix_transactions_status_date", table_name="transactions")
+    op.drop_index("ix_transactions_date", table_name="transactions")
+    op.drop_index("ix_transactions_statement_date", table_name="transactions")
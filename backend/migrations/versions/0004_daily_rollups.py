@@ -0,0 +1,52 @@
+"""Daily rollups of transaction sums and counts for analytics
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "daily_rollups",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("category", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("statement_id", sa.Integer(), nullable=False),
+        sa.Column("income_cents", sa.Integer(), nullable=False),
+        sa.Column("expense_cents", sa.Integer(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["statement_id"], ["statements.id"]),
+        sa.PrimaryKeyConstraint("day", "category", "status", "statement_id")
+    )
+    op.create_index("ix_daily_rollups_statement_day", "daily_rollups", ["statement_id", "day"])
+
+    # Backfill from existing transactions
+    day = "date(transaction_date)" if op.get_bind().dialect.name == "sqlite" else "CAST(transaction_date AS DATE)"
+    op.execute(
+        "INSERT INTO daily_rollups (statement_id, day, category, status, income_cents, expense_cents, count) "
+        f"SELECT statement_id, {day}, COALESCE(category, ''), COALESCE(status, ''), "
+        "SUM(CASE WHEN amount_cents > 0 THEN amount_cents ELSE 0 END), "
+        "SUM(CASE WHEN amount_cents < 0 THEN -amount_cents ELSE 0 END), "
+        "COUNT(*) FROM transactions "
+        f"GROUP BY statement_id, {day}, COALESCE(category, ''), COALESCE(status, '')"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_daily_rollups_statement_day", table_name="daily_rollups")
+    op.drop_table("daily_rollups")
@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.cache import MemoryVersion, analytics_cache
+from app.core.config import settings
+from app.core.migrations import upgrade_database
+from app.models.transaction import Statement
+from app.parsers.batch import TransactionBatch
+from app.services.statement_service import StatementService
+
+@pytest.fixture(autouse=True)
+def isolated_settings(tmp_path, monkeypatch):
+    """Keep uploads, caches and the category model out of the working tree"""
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path / "uploads"))
+    monkeypatch.setattr(settings, "EXTRACTION_CACHE_DIR", str(tmp_path / "extraction_cache"))
+    monkeypatch.setattr(settings, "CATEGORY_MODEL_ENABLED", False)
+    # Analytics cached against one test's database must not answer for the next
+    monkeypatch.setattr(analytics_cache, "version", MemoryVersion())
+
+@pytest.fixture
+def engine(tmp_path):
+    """A fresh SQLite database migrated to head"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    upgrade_database(engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+@pytest.fixture
+def make_statement(db):
+    """Insert a statement with (date, description, amount_cents) rows through the bulk insert path; returns its id"""
+    def make(rows, file_hash=None):
+        statement = Statement(filename="statement.pdf", file_hash=file_hash, bank_name="DBS", status="completed")
+        db.add(statement)
+        db.flush()
+        batch = TransactionBatch()
+        for when, description, amount_cents in rows:
+            batch.append(when, description, amount_cents)
+        StatementService()._add_transactions(db, statement, batch)
+        db.commit()
+        return statement.id
+
+    return make
@@ -0,0 +1,43 @@
+import pytest
+from app.parsers.amounts import parse_cents, parse_cents_column
+
+@pytest.mark.parametrize("value, cents", [
+    ("1,234.56", 123456),
+    ("-1,234.56", -123456),
+    ("1,234.56-", -123456),
+    ("+12.50", 1250),
+    ("0.05", 5),
+    (".5", 50),
+    ("1.005", 101),
+    # Parentheses
+    ("(1,234.56)", -123456),
+    ("( 12.50 )", -1250),
+    # Trailing CR / DR
+    ("1,234.56 CR", 123456),
+    ("12.50 DR", -1250),
+    ("12.50DR", -1250),
+    ("12.50 dr.", -1250),
+    # Leading currency
+    ("SGD 1,234.56 DR", -123456),
+    ("S$12.50", 1250),
+    ("-$5", -500),
+    ("US$3.10", 310),
+    # Trailing currency
+    ("12.50 SGD", 1250),
+    ("12.50 SGD CR", 1250),
+    ("(12.50 SGD)", -1250),
+    # Space-grouped digits
+    ("1 234.00", 123400),
+    ("1 234 567.89", 123456789),
+    ("1 234.00", 123400),
+    ("SGD 1 234.00 DR", -123400),
+])
+def test_parse_cents(value, cents):
+    assert parse_cents(value) == cents
+
+@pytest.mark.parametrize("value", [None, "", "   ", "abc", "CR", "SGD", "12 34", "1,234.56 XYZ"])
+def test_parse_cents_rejects_non_amounts(value):
+    assert parse_cents(value) is None
+
+def test_parse_cents_column_reuses_repeated_cells():
+    assert parse_cents_column(["1.00", None, "1.00", "(2.00)"]) == [100, None, 100, -200]
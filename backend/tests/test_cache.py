@@ -0,0 +1,22 @@
+import pytest
+from app.core.cache import AnalyticsCache, create_version
+
+@pytest.mark.parametrize("backend", ["file", "sqlite"])
+def test_write_in_one_worker_invalidates_another(backend, tmp_path):
+    path = str(tmp_path / "analytics_cache.version")
+    # Two workers on the same host, each with its own cache
+    first = AnalyticsCache(create_version(backend, path))
+    second = AnalyticsCache(create_version(backend, path))
+    first.get("summary", lambda: 1)
+    assert second.get("summary", lambda: 1)[1] == first.etag("summary")
+
+    first.invalidate()
+    assert second.get("summary", lambda: 2)[0] == 2
+    assert second.etag("summary") == first.etag("summary")
+
+def test_memory_backend_refused_with_several_workers(monkeypatch, tmp_path):
+    monkeypatch.setenv("WEB_CONCURRENCY", "4")
+    with pytest.raises(ValueError, match="single worker"):
+        create_version("memory", str(tmp_path / "unused"))
+    monkeypatch.setenv("WEB_CONCURRENCY", "1")
+    assert create_version("memory", str(tmp_path / "unused")).get()
@@ -0,0 +1,91 @@
+from datetime import datetime
+import random
+import re
+import pytest
+from app.ml.categorizer import TransactionCategorizer
+from app.models.transaction import TransactionCategory
+from app.parsers.batch import TransactionBatch
+
+# (description, amount in dollars, category, confidence) as the original
+# per-rule categorizer returned them for legacy {"description", "amount"} dicts
+LEGACY_RESULTS = [
+    ("SALARY ACME PTE LTD", 5000.0, TransactionCategory.INCOME, 0.95),
+    ("SALARY ACME PTE LTD", -5000.0, TransactionCategory.INCOME, 0.85),
+    ("GIRO TRANSFER FROM J TAN", 120.5, TransactionCategory.TRANSFER, 0.85),
+    ("GRAB*TRIP 1234", -12.3, TransactionCategory.TRANSPORT, 0.85),
+    ("NTUC FP-XYZ 0923", -45.0, TransactionCategory.GROCERIES, 0.85),
+    ("NETFLIX.COM", -15.98, TransactionCategory.ENTERTAINMENT, 0.85),
+    ("INTEREST CREDIT", 0.42, TransactionCategory.INCOME, 0.95),
+    ("PAYNOW TRANSFER TO J TAN", -50.0, TransactionCategory.TRANSFER, 0.85),
+    ("UNKNOWN MERCHANT", 10.0, TransactionCategory.OTHER, 0.3),
+]
+
+@pytest.fixture
+def categorizer():
+    return TransactionCategorizer(cache_size=0)
+
+def test_legacy_amount_dicts_categorize_as_before(categorizer):
+    rows = [{"description": description, "amount": amount} for description, amount, _, _ in LEGACY_RESULTS]
+    results = categorizer.batch_categorize(rows)
+    assert [(r["category"], r["confidence_score"]) for r in results] == [
+        (category, confidence) for _, _, category, confidence in LEGACY_RESULTS
+    ]
+
+def test_cents_dicts_categorize_like_amount_dicts(categorizer):
+    rows = [
+        {"description": description, "amount_cents": round(amount * 100)}
+        for description, amount, _, _ in LEGACY_RESULTS
+    ]
+    assert [r["category"] for r in categorizer.batch_categorize(rows)] == [row[2] for row in LEGACY_RESULTS]
+
+def test_batch_from_legacy_amount_dicts():
+    batch = TransactionBatch.from_dicts([
+        {"date": datetime(2024, 1, 2), "description": "SALARY", "amount": 5000.1, "balance": 12.35},
+        {"date": datetime(2024, 1, 3), "description": "NETFLIX", "amount": -15.98},
+        {"date": datetime(2024, 1, 4), "description": "NTUC", "amount_cents": -4500, "balance_cents": 0},
+    ])
+    assert list(batch.amount_cents) == [500010, -1598, -4500]
+    assert [row["balance_cents"] for row in batch] == [1235, None, 0]
+
+# The compiled single-pass matcher must agree with the original rule-by-rule loop
+def reference_categorize(patterns, description: str, amount: float):
+    """The original categorizer: income first for credits, then every rule in declaration order"""
+    text = description.lower()
+    if amount > 0 and any(re.search(pattern, text) for pattern in patterns[TransactionCategory.INCOME]):
+        return TransactionCategory.INCOME, 0.95
+    for category, category_patterns in patterns.items():
+        for pattern in category_patterns:
+            if re.search(pattern, text):
+                return category, 0.85 if len(pattern) > 20 else 0.75
+    return TransactionCategory.OTHER, 0.3
+
+def keywords(patterns):
+    """Literal examples of every alternative of every rule"""
+    words = []
+    for category_patterns in patterns.values():
+        for pattern in category_patterns:
+            for alternative in pattern.split("|"):
+                words.append(re.sub(r"\\s\*|\\s\+|\\s", " ", alternative).replace("\\", ""))
+    return words
+
+def descriptions(patterns, count: int = 3000):
+    random.seed(7)
+    words = keywords(patterns)
+    noise = ["POS", "PAYMENT", "SG", "1234", "REF#99", "*", "-", "PTE LTD", "TO", "FROM", "x"]
+    samples = [word.upper() for word in words]
+    for _ in range(count):
+        parts = random.sample(words, random.randint(1, 3)) + random.sample(noise, random.randint(0, 3))
+        random.shuffle(parts)
+        # Glue some parts together so keywords also appear inside longer tokens
+        samples.append(random.choice([" ", "", "*"]).join(parts).upper())
+    return samples
+
+@pytest.mark.parametrize("cache_size", [0, 10000], ids=["matcher", "cached"])
+def test_matches_original_rules(cache_size):
+    categorizer = TransactionCategorizer(cache_size=cache_size)
+    patterns = categorizer.category_patterns
+    for description in descriptions(patterns):
+        for amount in (-12.5, 0.0, 12.5):
+            assert categorizer.categorize(description, amount) == reference_categorize(patterns, description, amount), (
+                description, amount
+            )
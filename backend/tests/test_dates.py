@@ -0,0 +1,45 @@
+from datetime import datetime
+import pytest
+from app.parsers.dates import DateParser
+
+FORMATS = ["%d %b %Y", "%d/%m/%Y", "%d %b"]
+
+@pytest.fixture
+def parser():
+    parser = DateParser(FORMATS)
+    # A statement that runs across the year boundary
+    parser.set_period(datetime(2023, 12, 15), datetime(2024, 1, 14))
+    return parser
+
+@pytest.mark.parametrize("value, expected", [
+    ("20 Dec", datetime(2023, 12, 20)),
+    ("31 Dec", datetime(2023, 12, 31)),
+    ("02 Jan", datetime(2024, 1, 2)),
+    # Posted after the period end but within the slack: still the period's year
+    ("10 Feb", datetime(2024, 2, 10)),
+    # Too long after the period end: the previous year
+    ("20 Mar", datetime(2023, 3, 20)),
+    ("05  Jan", datetime(2024, 1, 5)),
+    ("03 Jan 2024", datetime(2024, 1, 3)),
+    ("28/12/2023", datetime(2023, 12, 28)),
+])
+def test_infers_year_from_period(parser, value, expected):
+    assert parser.parse(value) == expected
+
+def test_leap_day_uses_inferred_year():
+    parser = DateParser(FORMATS)
+    parser.set_period(datetime(2024, 2, 1), datetime(2024, 2, 29))
+    assert parser.parse("29 Feb") == datetime(2024, 2, 29)
+
+def test_rejects_cells_without_digits(parser):
+    assert parser.parse("Balance B/F") is None
+    assert parser.parse("") is None
+
+def test_set_period_clears_memoized_years(parser):
+    assert parser.parse("20 Dec") == datetime(2023, 12, 20)
+    parser.set_period(datetime(2024, 12, 1), datetime(2024, 12, 31))
+    assert parser.parse("20 Dec") == datetime(2024, 12, 20)
+
+def test_falls_back_to_dateparser():
+    parser = DateParser(["%d/%m/%Y"])
+    assert parser.parse("2024-03-05") == datetime(2024, 3, 5)
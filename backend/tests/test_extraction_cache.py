@@ -0,0 +1,26 @@
+from concurrent.futures import ProcessPoolExecutor
+from app.parsers.extraction_cache import ExtractionCache
+from app.parsers.parallel import PROCESS_CONTEXT
+
+def _lookup(directory: str, file_hash: str) -> bool:
+    return ExtractionCache(directory, max_bytes=10**6).get(file_hash) is not None
+
+def test_counters_add_up_across_processes(tmp_path):
+    cache = ExtractionCache(str(tmp_path), max_bytes=10**6)
+    cache.put("a" * 64, {"pages": []})
+    assert cache.get("a" * 64) == {"pages": []}
+    assert cache.get("b" * 64) is None
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=PROCESS_CONTEXT) as pool:
+        assert pool.submit(_lookup, str(tmp_path), "a" * 64).result()
+        assert not pool.submit(_lookup, str(tmp_path), "c" * 64).result()
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 2, 0)
+    assert stats["entries"] == 1
+
+def test_counts_eviction(tmp_path):
+    cache = ExtractionCache(str(tmp_path), max_bytes=1)
+    cache.put("a" * 64, {"pages": []})
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,49 @@
+from app.parsers.fingerprint import BankFingerprintIndex
+
+class Bank:
+    SIGNATURES = [(r"\bDBS\s+BANK\b", 3)]
+
+class OtherBank:
+    SIGNATURES = [(r"\bHSBC\b", 3)]
+
+class PagedDocument:
+    """Just enough of ParsedDocument for detection, recording which pages were read"""
+
+    metadata = {}
+
+    def __init__(self, *pages):
+        self.pages = pages
+        self.read = []
+
+    @property
+    def page_count(self):
+        return len(self.pages)
+
+    def font_names(self, page_number):
+        return []
+
+    def page_text(self, page_number):
+        self.read.append(page_number)
+        return self.pages[page_number]
+
+INDEX = BankFingerprintIndex({"DBS": Bank, "HSBC": OtherBank})
+
+def test_reads_only_the_first_page_when_it_matches():
+    document = PagedDocument("Statement from DBS Bank", "HSBC transfer", "more")
+    assert INDEX.detect(document) == "DBS"
+    assert document.read == [0]
+
+def test_stops_after_the_first_page_on_an_inconclusive_match():
+    document = PagedDocument("DBS Bank HSBC", "DBS Bank")
+    INDEX.detect(document)
+    assert document.read == [0]
+
+def test_falls_back_to_the_second_page_when_the_first_has_no_match():
+    document = PagedDocument("cover letter", "Statement from DBS Bank", "HSBC")
+    assert INDEX.detect(document) == "DBS"
+    assert document.read == [0, 1]
+
+def test_no_match_within_the_fallback_pages():
+    document = PagedDocument("cover", "letter", "DBS Bank")
+    assert INDEX.detect(document) is None
+    assert document.read == [0, 1]
@@ -0,0 +1,86 @@
+"""Hot transaction and analytics queries are served by the intended indexes.
+
+A fresh SQLite database is migrated to head, the SQL that the service methods
+actually emit is captured, and EXPLAIN QUERY PLAN is run on each statement.
+"""
+from datetime import datetime
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.core.migrations import upgrade_database
+from app.core.pagination import encode_cursor
+from app.models.transaction import Transaction, TransactionStatus, TransactionCategory
+from app.services.transaction_service import TransactionService, TransactionFilters, month_range
+
+service = TransactionService()
+start, end = month_range(2024, 1)
+cursor = encode_cursor((datetime(2024, 1, 15), 1000))
+
+CHECKS = [
+    ("get_transactions_by_statement", "transactions", "ix_transactions_statement_date",
+     lambda db: service.get_transactions_by_statement(db, 1, cursor=cursor)),
+    ("transactions in a month", "transactions", "ix_transactions_date",
+     lambda db: db.query(Transaction).filter(
+         Transaction.transaction_date >= start,
+         Transaction.transaction_date < end
+     ).all()),
+    ("status review queue", "transactions", "ix_transactions_status_date",
+     lambda db: db.query(Transaction).filter(
+         Transaction.status == TransactionStatus.PENDING,
+         Transaction.transaction_date >= start,
+         Transaction.transaction_date < end
+     ).all()),
+    ("category report", "transactions", "ix_transactions_category_date",
+     lambda db: db.query(Transaction).filter(
+         Transaction.category == TransactionCategory.GROCERIES,
+         Transaction.transaction_date >= start,
+         Transaction.transaction_date < end
+     ).all()),
+    ("list_transactions page", "transactions", "ix_transactions_date",
+     lambda db: service.list_transactions(db, TransactionFilters(), cursor=cursor)),
+    ("list_transactions(statement_id) page", "transactions", "ix_transactions_statement_date",
+     lambda db: service.list_transactions(db, TransactionFilters(statement_id=1), cursor=cursor)),
+    ("get_analytics(statement_id)", "daily_rollups", "ix_daily_rollups_statement_day",
+     lambda db: service.get_analytics(db, statement_id=1)),
+    # The composite primary key, which starts with day
+    ("get_monthly_summary", "daily_rollups", "sqlite_autoindex_daily_rollups_1",
+     lambda db: service.get_monthly_summary(db, 2024, 1)),
+]
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('explain') / 'explain.db'}")
+    upgrade_database(engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+def capture_queries(engine, table, run):
+    """SELECTs on `table` (with parameters) issued while `run` executes"""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and f"FROM {table}" in statement:
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        run()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return captured
+
+@pytest.mark.parametrize("label, table, index, run", CHECKS, ids=[check[0] for check in CHECKS])
+def test_query_uses_index(engine, db, label, table, index, run):
+    queries = capture_queries(engine, table, lambda: run(db))
+    assert queries, f"no query on {table} captured"
+    for statement, parameters in queries:
+        plan = " | ".join(
+            row[-1] for row in db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        )
+        assert f"INDEX {index} " in plan + " ", plan
@@ -0,0 +1,114 @@
+"""JobQueue claiming, restart recovery and upload cleanup, without the parse pool."""
+from datetime import datetime, timedelta
+import os
+import pytest
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.models.job import IngestionJob, JobStatus
+from app.services import job_service
+from app.services.job_service import JobQueue
+
+class FakeStatementService:
+    """Records the jobs it is asked to process and returns a fixed result"""
+
+    def __init__(self):
+        self.calls = []
+        self.result = {"error": "not set"}
+
+    def process_statement(self, db, source, filename, file_hash, executor=None):
+        self.calls.append(filename)
+        return self.result
+
+class RecordingExecutor:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, *args):
+        self.submitted.append(args)
+
+@pytest.fixture
+def queue(engine, monkeypatch):
+    monkeypatch.setattr(job_service, "SessionLocal", sessionmaker(bind=engine))
+    queue = JobQueue(FakeStatementService(), max_workers=1, processes=0)
+    queue._executor = RecordingExecutor()
+    return queue
+
+@pytest.fixture
+def upload(tmp_path):
+    path = tmp_path / "upload.pdf"
+    path.write_bytes(b"%PDF")
+    return str(path)
+
+@pytest.fixture
+def add_job(db, upload):
+    def add(status=JobStatus.QUEUED, file_path=upload, file_hash="a" * 64, **values):
+        job = IngestionJob(filename="statement.pdf", file_path=file_path, file_hash=file_hash, status=status, **values)
+        db.add(job)
+        db.commit()
+        return job.id
+
+    return add
+
+def job(db, job_id):
+    db.expire_all()
+    return db.get(IngestionJob, job_id)
+
+def test_job_runs_once(db, queue, add_job, make_statement):
+    statement_id = make_statement([])
+    queue.statement_service.result = {"statement_id": statement_id}
+    job_id = add_job()
+
+    queue._run(job_id)
+    # A second claim, e.g. from a sibling worker's `recover`, finds it no longer queued
+    queue._run(job_id)
+
+    assert queue.statement_service.calls == ["statement.pdf"]
+    completed = job(db, job_id)
+    assert (completed.status, completed.statement_id, completed.attempts) == (JobStatus.COMPLETED, statement_id, 1)
+    assert completed.started_at is not None and completed.finished_at is not None
+
+def test_failed_job_removes_its_upload(db, queue, add_job, upload):
+    job_id = add_job()
+    queue.statement_service.result = {"error": "Could not detect bank"}
+    queue._run(job_id)
+
+    failed = job(db, job_id)
+    assert (failed.status, failed.error) == (JobStatus.FAILED, "Could not detect bank")
+    assert not os.path.exists(upload)
+
+def test_failed_job_keeps_upload_used_by_a_statement(db, queue, add_job, upload, make_statement):
+    make_statement([], file_hash="a" * 64)
+    queue._discard_upload(db, job(db, add_job(status=JobStatus.FAILED)))
+    assert os.path.exists(upload)
+
+def test_failed_job_keeps_upload_used_by_another_job(db, queue, add_job, upload):
+    add_job(status=JobStatus.QUEUED)
+    failed_id = add_job(status=JobStatus.FAILED)
+    queue._discard_upload(db, job(db, failed_id))
+    assert os.path.exists(upload)
+
+    # Only queued and running jobs hold on to the file
+    db.query(IngestionJob).filter(IngestionJob.id != failed_id).update({"status": JobStatus.COMPLETED})
+    db.commit()
+    queue._discard_upload(db, job(db, failed_id))
+    assert not os.path.exists(upload)
+
+def test_recover(db, queue, add_job, tmp_path):
+    stale = datetime.utcnow() - timedelta(seconds=settings.INGESTION_STALE_AFTER_SECONDS + 60)
+    queued = add_job(status=JobStatus.QUEUED)
+    stale_running = add_job(status=JobStatus.RUNNING, started_at=stale, attempts=1)
+    young_running = add_job(status=JobStatus.RUNNING, started_at=datetime.utcnow(), attempts=1)
+    exhausted = add_job(status=JobStatus.RUNNING, started_at=stale, attempts=settings.INGESTION_MAX_ATTEMPTS)
+    missing = add_job(status=JobStatus.QUEUED, file_path=str(tmp_path / "never-stored.pdf"))
+    completed = add_job(status=JobStatus.COMPLETED)
+
+    assert queue.recover() == 2
+    assert queue.executor.submitted == [(queued,), (stale_running,)]
+
+    assert job(db, queued).status == JobStatus.QUEUED
+    assert job(db, stale_running).status == JobStatus.QUEUED
+    assert job(db, young_running).status == JobStatus.RUNNING
+    assert job(db, exhausted).status == JobStatus.FAILED
+    assert job(db, exhausted).error == f"Interrupted after {settings.INGESTION_MAX_ATTEMPTS} attempts"
+    assert job(db, missing).status == JobStatus.FAILED
+    assert job(db, completed).status == JobStatus.COMPLETED
@@ -0,0 +1,63 @@
+"""Unversioned databases from any application version upgrade cleanly to head.
+
+Each case builds the schema that create_all produced at some point before
+migrations existed (0001 plus whichever of the 0002 changes had shipped),
+drops the version table and runs upgrade_database on it.
+"""
+import pytest
+from alembic import command
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect, text
+from app.core.migrations import alembic_config, upgrade_database
+
+JOBS_TABLE = (
+    "CREATE TABLE ingestion_jobs (id INTEGER PRIMARY KEY, filename VARCHAR NOT NULL, "
+    "file_path VARCHAR NOT NULL, {file_hash}status VARCHAR, attempts INTEGER, error TEXT, "
+    "statement_id INTEGER REFERENCES statements (id) ON DELETE SET NULL, created_at DATETIME, "
+    "started_at DATETIME, finished_at DATETIME)"
+)
+
+SCHEMAS = {
+    "baseline": [],
+    "ingestion jobs": [
+        JOBS_TABLE.format(file_hash=""),
+        "CREATE INDEX ix_ingestion_jobs_id ON ingestion_jobs (id)",
+        "CREATE INDEX ix_ingestion_jobs_status ON ingestion_jobs (status)",
+    ],
+    "content hashes": [
+        "ALTER TABLE statements ADD COLUMN file_hash VARCHAR(64)",
+        "CREATE INDEX ix_statements_file_hash ON statements (file_hash)",
+        JOBS_TABLE.format(file_hash="file_hash VARCHAR(64), "),
+        "CREATE INDEX ix_ingestion_jobs_id ON ingestion_jobs (id)",
+        "CREATE INDEX ix_ingestion_jobs_file_hash ON ingestion_jobs (file_hash)",
+        "CREATE INDEX ix_ingestion_jobs_status ON ingestion_jobs (status)",
+    ],
+}
+
+@pytest.mark.parametrize("name", SCHEMAS)
+def test_unversioned_schema_upgrades_to_head(tmp_path, name):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    config = alembic_config()
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "0001")
+        connection.execute(text("DROP TABLE alembic_version"))
+        for statement in SCHEMAS[name]:
+            connection.execute(text(statement))
+        connection.execute(text("INSERT INTO statements (id, filename, bank_name) VALUES (1, 'a.pdf', 'DBS')"))
+        connection.execute(text(
+            "INSERT INTO transactions (statement_id, transaction_date, description, amount, balance) "
+            "VALUES (1, '2024-01-02 00:00:00.000000', 'NTUC', -12.5, 100.1)"
+        ))
+
+    upgrade_database(engine)
+
+    inspector = inspect(engine)
+    assert "file_hash" in {c["name"] for c in inspector.get_columns("statements")}
+    assert "file_hash" in {c["name"] for c in inspector.get_columns("ingestion_jobs")}
+    assert "ix_ingestion_jobs_file_hash" in {i["name"] for i in inspector.get_indexes("ingestion_jobs")}
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT amount_cents, balance_cents FROM transactions")).one() == (-1250, 10010)
+        heads = connection.execute(text("SELECT version_num FROM alembic_version")).scalars().all()
+    assert heads == [ScriptDirectory.from_config(config).get_current_head()]
+    engine.dispose()
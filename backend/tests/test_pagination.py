@@ -0,0 +1,25 @@
+from datetime import datetime
+import pytest
+from app.core.pagination import InvalidCursor
+from app.services.transaction_service import TransactionService
+
+@pytest.fixture
+def statement_id(make_statement):
+    # Ties on the date are broken by id
+    return make_statement([(datetime(2024, 1, day), f"ROW {day}", -100 * day) for day in (3, 1, 2, 2, 2)])
+
+def test_statement_transactions_page_in_date_order(db, statement_id):
+    service = TransactionService()
+    seen, cursor = [], None
+    while True:
+        page, cursor = service.get_transactions_by_statement(db, statement_id, limit=2, cursor=cursor)
+        assert len(page) <= 2
+        seen.extend((t.transaction_date.day, t.id) for t in page)
+        if cursor is None:
+            break
+    assert seen == sorted(seen)
+    assert [day for day, _ in seen] == [1, 2, 2, 2, 3]
+
+def test_statement_transactions_reject_bad_cursor(db, statement_id):
+    with pytest.raises(InvalidCursor):
+        TransactionService().get_transactions_by_statement(db, statement_id, cursor="not-a-cursor")
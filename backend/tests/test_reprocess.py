@@ -0,0 +1,88 @@
+from datetime import datetime
+import pytest
+from app.models.transaction import Statement, Transaction, TransactionStatus
+from app.parsers.batch import TransactionBatch
+from app.services import statement_service as statement_module
+from app.services.rollup_service import RollupService
+from app.services.statement_service import StatementService
+from app.services.transaction_service import TransactionService
+
+ROWS = [
+    (datetime(2024, 1, 2), "NTUC FP-XYZ 0923", -4500),
+    (datetime(2024, 1, 3), "SALARY ACME PTE LTD", 500000),
+    (datetime(2024, 1, 4), "NETFLIX.COM", -1598),
+]
+
+class FakeDocument:
+    """Stands in for ParsedDocument; the fake parser ignores the file"""
+
+    from_cache = True
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+class FakeParser:
+    rows = ROWS
+
+    def parse(self, document):
+        batch = TransactionBatch()
+        for when, description, amount_cents in self.rows:
+            batch.append(when, description, amount_cents)
+        return {"account_number": "123", "period_start": None, "period_end": None, "transactions": batch}
+
+@pytest.fixture
+def parser(monkeypatch):
+    parser = FakeParser()
+    monkeypatch.setattr(statement_module, "ParsedDocument", FakeDocument)
+    monkeypatch.setattr(statement_module, "get_parser", lambda bank_name: parser)
+    return parser
+
+@pytest.fixture
+def statement_id(db, parser):
+    service = StatementService()
+    statement = Statement(filename="a.pdf", file_hash="f" * 64, bank_name="DBS", status="completed")
+    db.add(statement)
+    db.flush()
+    service._add_transactions(db, statement, parser.parse(None)["transactions"])
+    db.commit()
+    return statement.id
+
+def transactions(db, statement_id):
+    db.expire_all()
+    return db.query(Transaction).filter(Transaction.statement_id == statement_id).order_by(Transaction.id).all()
+
+def test_reviews_survive_reprocessing(db, statement_id):
+    grocery, salary, _ = transactions(db, statement_id)
+    TransactionService().update_transaction(db, grocery.id, {"description": "Groceries", "category": "Shopping"})
+    TransactionService().approve_transaction(db, salary.id)
+
+    result = StatementService().reprocess_statement(db, statement_id)
+    assert result["success"] and result["reviews_kept"] == 2 and result["reviews_discarded"] == 0
+
+    grocery, salary, netflix = transactions(db, statement_id)
+    assert (grocery.description, grocery.category) == ("Groceries", "Shopping")
+    assert grocery.status == TransactionStatus.EDITED
+    assert grocery.original_description == "NTUC FP-XYZ 0923"
+    assert salary.status == TransactionStatus.APPROVED and salary.reviewed_at is not None
+    assert netflix.status == TransactionStatus.PENDING
+    assert RollupService().check(db) == []
+
+def test_unmatched_review_blocks_reprocessing(db, statement_id, parser):
+    _, _, netflix = transactions(db, statement_id)
+    TransactionService().reject_transaction(db, netflix.id)
+    parser.rows = ROWS[:2]
+
+    result = StatementService().reprocess_statement(db, statement_id)
+    assert "1 reviewed transactions" in result["error"]
+    assert len(transactions(db, statement_id)) == 3
+
+    result = StatementService().reprocess_statement(db, statement_id, discard_edits=True)
+    assert result["reviews_discarded"] == 1
+    assert [t.status for t in transactions(db, statement_id)] == [TransactionStatus.PENDING] * 2
+    assert RollupService().check(db) == []
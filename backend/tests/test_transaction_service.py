@@ -0,0 +1,120 @@
+"""Review writes: bulk_update against the single-transaction methods, and rollups kept in step."""
+from datetime import datetime
+import pytest
+from app.models.transaction import Transaction, TransactionStatus
+from app.services.rollup_service import RollupService
+from app.services.statement_service import StatementService
+from app.services.transaction_service import TransactionService
+
+ROWS = [
+    (datetime(2024, 1, 2), "NTUC FP-XYZ 0923", -4500),
+    (datetime(2024, 1, 2), "GRAB*TRIP 1234", -1230),
+    (datetime(2024, 1, 3), "SALARY ACME PTE LTD", 500000),
+    (datetime(2024, 1, 4), "NETFLIX.COM", -1598),
+    (datetime(2024, 1, 5), "STARBUCKS ORCHARD", -750),
+]
+
+# Several operations on one transaction fold into a single change
+OPERATIONS = [
+    (0, "update", {"description": "Groceries"}),
+    (0, "categorize", {"category": "Shopping"}),
+    (0, "approve", {}),
+    (1, "reject", {}),
+    (2, "update", {"amount": 4000.0}),
+    (2, "update", {"amount": 4100.0, "description": "Salary"}),
+    (3, "approve", {}),
+    (3, "update", {"category": "Bills & Utilities"}),
+]
+
+REVIEW_COLUMNS = (
+    "description", "amount_cents", "category", "status", "auto_categorized",
+    "original_description", "original_amount_cents"
+)
+
+def apply_one_by_one(service: TransactionService, db, transaction_id: int, action: str, fields: dict):
+    if action in ("update", "categorize"):
+        service.update_transaction(db, transaction_id, fields)
+    elif action == "approve":
+        service.approve_transaction(db, transaction_id)
+    else:
+        service.reject_transaction(db, transaction_id)
+
+def review_state(db, statement_id):
+    db.expire_all()
+    transactions = db.query(Transaction).filter(Transaction.statement_id == statement_id).order_by(Transaction.id)
+    return [
+        (tuple(getattr(t, column) for column in REVIEW_COLUMNS), t.edited_at is not None, t.reviewed_at is not None)
+        for t in transactions
+    ]
+
+@pytest.fixture
+def ids(db, make_statement):
+    statement_id = make_statement(ROWS)
+    return statement_id, [
+        t.id for t in db.query(Transaction).filter(Transaction.statement_id == statement_id).order_by(Transaction.id)
+    ]
+
+def test_bulk_update_matches_single_operations(db, ids, make_statement):
+    statement_id, transaction_ids = ids
+    service = TransactionService()
+    results = service.bulk_update(db, [
+        {"id": transaction_ids[index], "action": action, **fields} for index, action, fields in OPERATIONS
+    ] + [{"id": 10**6, "action": "approve"}])
+
+    assert [result["success"] for result in results] == [True, True, True, True, False]
+    assert results[-1]["error"] == "Transaction not found"
+
+    # The same operations one at a time on a second copy of the statement
+    other_id = make_statement(ROWS)
+    other_ids = [
+        t.id for t in db.query(Transaction).filter(Transaction.statement_id == other_id).order_by(Transaction.id)
+    ]
+    for index, action, fields in OPERATIONS:
+        apply_one_by_one(service, db, other_ids[index], action, fields)
+
+    assert review_state(db, statement_id) == review_state(db, other_id)
+    assert RollupService().check(db) == []
+
+def test_bulk_update_captures_original_values_once(db, ids):
+    _, transaction_ids = ids
+    service = TransactionService()
+    service.bulk_update(db, [{"id": transaction_ids[2], "action": "update", "amount": 4000.0}])
+    service.bulk_update(db, [{"id": transaction_ids[2], "action": "update", "description": "Salary"}])
+
+    db.expire_all()
+    transaction = db.get(Transaction, transaction_ids[2])
+    assert (transaction.description, transaction.amount_cents) == ("Salary", 400000)
+    assert (transaction.original_description, transaction.original_amount_cents) == ("SALARY ACME PTE LTD", 500000)
+    assert transaction.status == TransactionStatus.EDITED
+
+def test_rollups_follow_every_write(db, ids, make_statement):
+    statement_id, transaction_ids = ids
+    service = TransactionService()
+    rollups = RollupService()
+    assert rollups.check(db) == []
+
+    service.update_transaction(db, transaction_ids[0], {"category": "Shopping", "amount": -50.0})
+    assert rollups.check(db) == []
+    service.approve_transaction(db, transaction_ids[1])
+    service.reject_transaction(db, transaction_ids[2])
+    assert rollups.check(db) == []
+    service.bulk_approve(db, transaction_ids)
+    assert rollups.check(db) == []
+    service.bulk_update(db, [{"id": transaction_ids[3], "action": "categorize", "category": "Transport"}])
+    assert rollups.check(db) == []
+
+    other_id = make_statement(ROWS)
+    assert StatementService().delete_statement(db, statement_id)
+    assert rollups.check(db) == []
+    analytics = service.get_analytics(db)
+    assert analytics["total_transactions"] == len(ROWS)
+    assert db.query(Transaction).filter(Transaction.statement_id == other_id).count() == len(ROWS)
+
+def test_rebuild_restores_drifted_rollups(engine, db, ids):
+    rollups = RollupService()
+    with engine.begin() as connection:
+        connection.exec_driver_sql("UPDATE daily_rollups SET count = count + 1")
+    assert rollups.check(db)
+    rollups.rebuild(db)
+    db.commit()
+    assert rollups.check(db) == []
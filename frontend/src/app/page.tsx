@@ -22,6 +22,8 @@ type TabType = 'dashboard' | 'transactions' | 'calendar' | 'upload';
 export default function Home() {
   const [activeTab, setActiveTab] = useState<TabType>('upload');
   const [statements, setStatements] = useState<Statement[]>([]);
+  const [statementsCursor, setStatementsCursor] = useState<string | null>(null);
+  const [loadingMoreStatements, setLoadingMoreStatements] = useState(false);
   const [selectedStatement, setSelectedStatement] = useState<number | null>(null);
   const [sidebarOpen, setSidebarOpen] = useState(true);
   const [loading, setLoading] = useState(true);
@@ -32,10 +34,11 @@ export default function Home() {
 
   const loadStatements = async () => {
     try {
-      const data = await statementsAPI.getAll();
-      setStatements(data);
-      if (data.length > 0 && !selectedStatement) {
-        setSelectedStatement(data[0].id);
+      const page = await statementsAPI.getPage();
+      setStatements(page.items);
+      setStatementsCursor(page.nextCursor);
+      if (page.items.length > 0 && !selectedStatement) {
+        setSelectedStatement(page.items[0].id);
       }
     } catch (error) {
       console.error('Failed to load statements:', error);
@@ -44,6 +47,20 @@ export default function Home() {
     }
   };
 
+  const loadMoreStatements = async () => {
+    if (!statementsCursor) return;
+    setLoadingMoreStatements(true);
+    try {
+      const page = await statementsAPI.getPage(statementsCursor);
+      setStatements((current) => [...current, ...page.items]);
+      setStatementsCursor(page.nextCursor);
+    } catch (error) {
+      console.error('Failed to load statements:', error);
+    } finally {
+      setLoadingMoreStatements(false);
+    }
+  };
+
   const handleUploadSuccess = () => {
     loadStatements();
     setActiveTab('dashboard');
@@ -123,6 +140,15 @@ export default function Home() {
                   <div className="text-xs text-gray-500 truncate">{statement.filename}</div>
                 </button>
               ))}
+              {statementsCursor && (
+                <button
+                  onClick={loadMoreStatements}
+                  disabled={loadingMoreStatements}
+                  className="w-full px-3 py-2 rounded-lg text-sm text-gray-400 hover:bg-dark-hover hover:text-white transition-colors disabled:opacity-50"
+                >
+                  {loadingMoreStatements ? 'Loading...' : 'Load more'}
+                </button>
+              )}
             </div>
           </div>
         </div>
@@ -11,6 +11,8 @@ import { ChevronLeft, ChevronRight } from 'lucide-react';
 export default function CalendarView({ statementId }: { statementId?: number }) {
   const [date, setDate] = useState(new Date());
   const [transactions, setTransactions] = useState<Transaction[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [selectedDateTransactions, setSelectedDateTransactions] = useState<Transaction[]>([]);
   const [loading, setLoading] = useState(true);
 
@@ -27,8 +29,9 @@ export default function CalendarView({ statementId }: { statementId?: number })
   const loadTransactions = async () => {
     if (!statementId) return;
     try {
-      const data = await transactionsAPI.getByStatement(statementId);
-      setTransactions(data);
+      const page = await transactionsAPI.getByStatement(statementId);
+      setTransactions(page.items);
+      setNextCursor(page.nextCursor);
     } catch (error) {
       console.error('Failed to load transactions:', error);
     } finally {
@@ -36,6 +39,20 @@ export default function CalendarView({ statementId }: { statementId?: number })
     }
   };
 
+  const loadMore = async () => {
+    if (!statementId || !nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const page = await transactionsAPI.getByStatement(statementId, nextCursor);
+      setTransactions((current) => [...current, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      console.error('Failed to load transactions:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const updateSelectedDateTransactions = () => {
     const dateStr = date.toISOString().split('T')[0];
     const filtered = transactions.filter(t => {
@@ -88,6 +105,17 @@ export default function CalendarView({ statementId }: { statementId?: number })
             className="w-full bg-dark-bg border-dark-border rounded-lg text-white"
           />
         </div>
+        {nextCursor && (
+          <div className="mt-4 text-center">
+            <button
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="px-4 py-2 bg-dark-bg border border-dark-border hover:bg-dark-hover text-white rounded-lg transition-colors disabled:opacity-50"
+            >
+              {loadingMore ? 'Loading...' : 'Load later transactions'}
+            </button>
+          </div>
+        )}
       </div>
 
       {/* Selected Date Transactions */}
@@ -31,18 +31,64 @@ export default function FileUpload({ onUploadSuccess }: FileUploadProps) {
     setIsDragging(false);
 
     const files = Array.from(e.dataTransfer.files);
-    if (files.length > 0) {
-      await handleFileUpload(files[0]);
-    }
+    await handleFiles(files);
   }, []);
 
   const handleFileSelect = async (e: React.ChangeEvent<HTMLInputElement>) => {
     const files = e.target.files;
-    if (files && files.length > 0) {
+    if (files) {
+      await handleFiles(Array.from(files));
+    }
+  };
+
+  const handleFiles = async (files: File[]) => {
+    if (files.length === 0) {
+      return;
+    }
+    // Several files, or a ZIP of statements, go through the batch endpoint
+    if (files.length > 1 || files[0].name.toLowerCase().endsWith('.zip')) {
+      await handleBatchUpload(files);
+    } else {
       await handleFileUpload(files[0]);
     }
   };
 
+  const handleBatchUpload = async (files: File[]) => {
+    setUploading(true);
+    setUploadStatus({ type: null, message: '' });
+
+    try {
+      const result = await statementsAPI.uploadBatch(files);
+      // Files that share a job (identical uploads) only need to be waited on once
+      const jobIds = Array.from(
+        new Set(result.files.flatMap((item) => (item.job_id !== null ? [item.job_id] : [])))
+      );
+      const jobs = await Promise.all(jobIds.map((jobId) => statementsAPI.waitForJob(jobId)));
+      const failedJobs = new Set(jobs.filter((job) => job.status === 'failed').map((job) => job.id));
+      const failures = result.files.filter(
+        (item) => !item.success || (item.job_id !== null && failedJobs.has(item.job_id))
+      );
+      const processed = result.files.length - failures.length;
+
+      setUploadStatus({
+        type: failures.length === result.files.length ? 'error' : 'success',
+        message:
+          `Processed ${processed} of ${result.files.length} files` +
+          (failures.length > 0 ? `. Failed: ${failures.map((item) => item.filename).join(', ')}` : ''),
+      });
+      if (processed > 0 && onUploadSuccess) {
+        onUploadSuccess();
+      }
+    } catch (error: any) {
+      setUploadStatus({
+        type: 'error',
+        message: error.response?.data?.detail || 'Failed to upload statements',
+      });
+    } finally {
+      setUploading(false);
+    }
+  };
+
   const handleFileUpload = async (file: File) => {
     if (!file.name.endsWith('.pdf') && !file.name.endsWith('.PDF')) {
       setUploadStatus({
@@ -57,10 +103,25 @@ export default function FileUpload({ onUploadSuccess }: FileUploadProps) {
 
     try {
       const result = await statementsAPI.upload(file);
-      setUploadStatus({
-        type: 'success',
-        message: `Successfully processed ${result.transaction_count} transactions from ${result.bank_name}`,
-      });
+      if (result.duplicate) {
+        setUploadStatus({
+          type: 'success',
+          message: `Already processed: ${result.transaction_count} transactions from ${result.bank_name}`,
+        });
+      } else {
+        const job = await statementsAPI.waitForJob(result.job_id);
+        if (job.status === 'failed') {
+          setUploadStatus({
+            type: 'error',
+            message: job.error || 'Failed to process statement',
+          });
+          return;
+        }
+        setUploadStatus({
+          type: 'success',
+          message: `Successfully processed ${job.filename}`,
+        });
+      }
       if (onUploadSuccess) {
         onUploadSuccess();
       }
@@ -92,7 +153,8 @@ export default function FileUpload({ onUploadSuccess }: FileUploadProps) {
       >
         <input
           type="file"
-          accept=".pdf,.PDF"
+          accept=".pdf,.PDF,.zip"
+          multiple
           onChange={handleFileSelect}
           className="absolute inset-0 w-full h-full opacity-0 cursor-pointer"
           disabled={uploading}
@@ -114,7 +176,7 @@ export default function FileUpload({ onUploadSuccess }: FileUploadProps) {
                   Upload Bank Statement
                 </h3>
                 <p className="text-gray-400">
-                  Drag and drop your PDF statement here, or click to browse
+                  Drag and drop PDF statements or a ZIP of them here, or click to browse
                 </p>
                 <p className="text-sm text-gray-500 mt-2">
                   Supports: HSBC, DBS, OCBC, Citibank, SCB, Trust, GXS
@@ -1,8 +1,8 @@
 'use client';
 
 import { useState, useEffect } from 'react';
-import { Transaction, TRANSACTION_CATEGORIES } from '@/types';
-import { transactionsAPI, statementsAPI } from '@/lib/api';
+import { Transaction, TransactionListItem, TransactionQuery, TRANSACTION_CATEGORIES } from '@/types';
+import { transactionsAPI } from '@/lib/api';
 import { formatCurrency, formatDate, getCategoryColor, getStatusColor } from '@/lib/utils';
 import {
   Check,
@@ -14,10 +14,13 @@ import {
   Search
 } from 'lucide-react';
 
+const PAGE_SIZE = 100;
+
 export default function TransactionList({ statementId }: { statementId?: number }) {
-  const [transactions, setTransactions] = useState<Transaction[]>([]);
-  const [filteredTransactions, setFilteredTransactions] = useState<Transaction[]>([]);
+  const [transactions, setTransactions] = useState<TransactionListItem[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [editingId, setEditingId] = useState<number | null>(null);
   const [searchTerm, setSearchTerm] = useState('');
   const [filterCategory, setFilterCategory] = useState<string>('all');
@@ -25,21 +28,29 @@ export default function TransactionList({ statementId }: { statementId?: number
   const [sortBy, setSortBy] = useState<'date' | 'amount'>('date');
   const [sortOrder, setSortOrder] = useState<'asc' | 'desc'>('desc');
 
-  useEffect(() => {
-    if (statementId) {
-      loadTransactions();
-    }
-  }, [statementId]);
+  // Filtering and date ordering happen on the server, a page at a time
+  const buildQuery = (): TransactionQuery => ({
+    statement_id: statementId,
+    search: searchTerm || undefined,
+    category: filterCategory !== 'all' ? filterCategory : undefined,
+    status: filterStatus !== 'all' ? filterStatus : undefined,
+    order: sortBy === 'date' ? sortOrder : 'desc',
+    limit: PAGE_SIZE,
+  });
 
   useEffect(() => {
-    applyFilters();
-  }, [transactions, searchTerm, filterCategory, filterStatus, sortBy, sortOrder]);
+    if (!statementId) return;
+    // Debounce typing in the search box
+    const timer = setTimeout(loadTransactions, searchTerm ? 300 : 0);
+    return () => clearTimeout(timer);
+  }, [statementId, searchTerm, filterCategory, filterStatus, sortBy, sortOrder]);
 
   const loadTransactions = async () => {
     if (!statementId) return;
     try {
-      const data = await transactionsAPI.getByStatement(statementId);
-      setTransactions(data);
+      const page = await transactionsAPI.list(buildQuery());
+      setTransactions(page.items);
+      setNextCursor(page.next_cursor);
     } catch (error) {
       console.error('Failed to load transactions:', error);
     } finally {
@@ -47,44 +58,32 @@ export default function TransactionList({ statementId }: { statementId?: number
     }
   };
 
-  const applyFilters = () => {
-    let filtered = [...transactions];
-
-    // Search filter
-    if (searchTerm) {
-      filtered = filtered.filter(t =>
-        t.description.toLowerCase().includes(searchTerm.toLowerCase())
-      );
-    }
-
-    // Category filter
-    if (filterCategory !== 'all') {
-      filtered = filtered.filter(t => t.category === filterCategory);
-    }
-
-    // Status filter
-    if (filterStatus !== 'all') {
-      filtered = filtered.filter(t => t.status === filterStatus);
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const page = await transactionsAPI.list({ ...buildQuery(), cursor: nextCursor });
+      setTransactions([...transactions, ...page.items]);
+      setNextCursor(page.next_cursor);
+    } catch (error) {
+      console.error('Failed to load more transactions:', error);
+    } finally {
+      setLoadingMore(false);
     }
+  };
 
-    // Sort
-    filtered.sort((a, b) => {
-      if (sortBy === 'date') {
-        const comparison = new Date(a.transaction_date).getTime() - new Date(b.transaction_date).getTime();
-        return sortOrder === 'asc' ? comparison : -comparison;
-      } else {
-        const comparison = a.amount - b.amount;
-        return sortOrder === 'asc' ? comparison : -comparison;
-      }
-    });
+  // Amounts are only sorted within the pages loaded so far
+  const displayedTransactions = sortBy === 'amount'
+    ? [...transactions].sort((a, b) => (sortOrder === 'asc' ? a.amount - b.amount : b.amount - a.amount))
+    : transactions;
 
-    setFilteredTransactions(filtered);
+  const replaceTransaction = (updated: Transaction) => {
+    setTransactions(transactions.map(t => (t.id === updated.id ? updated : t)));
   };
 
   const handleApprove = async (id: number) => {
     try {
-      await transactionsAPI.approve(id);
-      await loadTransactions();
+      replaceTransaction(await transactionsAPI.approve(id));
     } catch (error) {
       console.error('Failed to approve transaction:', error);
     }
@@ -92,24 +91,29 @@ export default function TransactionList({ statementId }: { statementId?: number
 
   const handleReject = async (id: number) => {
     try {
-      await transactionsAPI.reject(id);
-      await loadTransactions();
+      replaceTransaction(await transactionsAPI.reject(id));
     } catch (error) {
       console.error('Failed to reject transaction:', error);
     }
   };
 
   const handleBulkApprove = async () => {
-    const pendingIds = transactions
-      .filter(t => t.status === 'pending')
-      .map(t => t.id);
-    if (pendingIds.length > 0) {
-      try {
+    if (!statementId) return;
+    try {
+      // Every pending transaction of the statement, not just the loaded pages
+      const pendingIds: number[] = [];
+      let cursor: string | undefined;
+      do {
+        const page = await transactionsAPI.list({ statement_id: statementId, status: 'pending', limit: 1000, cursor });
+        pendingIds.push(...page.items.map(t => t.id));
+        cursor = page.next_cursor ?? undefined;
+      } while (cursor);
+      if (pendingIds.length > 0) {
         await transactionsAPI.bulkApprove(pendingIds);
         await loadTransactions();
-      } catch (error) {
-        console.error('Failed to bulk approve:', error);
       }
+    } catch (error) {
+      console.error('Failed to bulk approve:', error);
     }
   };
 
@@ -183,7 +187,7 @@ export default function TransactionList({ statementId }: { statementId?: number
         {/* Bulk Actions */}
         <div className="mt-4 flex justify-between items-center">
           <p className="text-sm text-gray-400">
-            Showing {filteredTransactions.length} of {transactions.length} transactions
+            Showing {transactions.length}{nextCursor ? '+' : ''} transactions
           </p>
           <button
             onClick={handleBulkApprove}
@@ -209,16 +213,16 @@ export default function TransactionList({ statementId }: { statementId?: number
               </tr>
             </thead>
             <tbody className="divide-y divide-dark-border">
-              {filteredTransactions.map((transaction) => (
+              {displayedTransactions.map((transaction) => (
                 <TransactionRow
                   key={transaction.id}
                   transaction={transaction}
                   isEditing={editingId === transaction.id}
                   onEdit={() => setEditingId(transaction.id)}
                   onCancelEdit={() => setEditingId(null)}
-                  onSave={() => {
+                  onSave={(updated) => {
                     setEditingId(null);
-                    loadTransactions();
+                    replaceTransaction(updated);
                   }}
                   onApprove={handleApprove}
                   onReject={handleReject}
@@ -227,6 +231,17 @@ export default function TransactionList({ statementId }: { statementId?: number
             </tbody>
           </table>
         </div>
+        {nextCursor && (
+          <div className="p-4 border-t border-dark-border text-center">
+            <button
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="px-4 py-2 bg-dark-bg border border-dark-border hover:bg-dark-hover text-white rounded-lg transition-colors disabled:opacity-50"
+            >
+              {loadingMore ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
@@ -241,11 +256,11 @@ function TransactionRow({
   onApprove,
   onReject
 }: {
-  transaction: Transaction;
+  transaction: TransactionListItem;
   isEditing: boolean;
   onEdit: () => void;
   onCancelEdit: () => void;
-  onSave: () => void;
+  onSave: (updated: Transaction) => void;
   onApprove: (id: number) => void;
   onReject: (id: number) => void;
 }) {
@@ -257,8 +272,7 @@ function TransactionRow({
 
   const handleSave = async () => {
     try {
-      await transactionsAPI.update(transaction.id, editData);
-      onSave();
+      onSave(await transactionsAPI.update(transaction.id, editData));
     } catch (error) {
       console.error('Failed to update transaction:', error);
     }
@@ -1,5 +1,17 @@
 import axios from 'axios';
-import type { Transaction, Statement, Analytics, MonthlyAnalytics } from '@/types';
+import type {
+  BatchUploadResponse,
+  BulkOperation,
+  BulkResponse,
+  Transaction,
+  TransactionPage,
+  TransactionQuery,
+  Statement,
+  Analytics,
+  MonthlyAnalytics,
+  IngestionJob,
+  Page,
+} from '@/types';
 
 const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000/api/v1';
 
@@ -23,11 +35,38 @@ export const statementsAPI = {
     return response.data;
   },
 
-  getAll: async (): Promise<Statement[]> => {
-    const response = await api.get('/statements/');
+  uploadBatch: async (files: File[]): Promise<BatchUploadResponse> => {
+    const formData = new FormData();
+    files.forEach((file) => formData.append('files', file));
+    const response = await api.post('/statements/upload/batch', formData, {
+      headers: {
+        'Content-Type': 'multipart/form-data',
+      },
+    });
     return response.data;
   },
 
+  getJob: async (jobId: number): Promise<IngestionJob> => {
+    const response = await api.get(`/statements/jobs/${jobId}`);
+    return response.data;
+  },
+
+  waitForJob: async (jobId: number, intervalMs = 1000): Promise<IngestionJob> => {
+    for (;;) {
+      const job = await statementsAPI.getJob(jobId);
+      if (job.status === 'completed' || job.status === 'failed') {
+        return job;
+      }
+      await new Promise((resolve) => setTimeout(resolve, intervalMs));
+    }
+  },
+
+  // One page of statements; nextCursor (from X-Next-Cursor) fetches the next
+  getPage: async (cursor?: string): Promise<Page<Statement>> => {
+    const response = await api.get('/statements/', { params: cursor ? { cursor } : {} });
+    return { items: response.data, nextCursor: response.headers['x-next-cursor'] ?? null };
+  },
+
   getById: async (id: number): Promise<Statement> => {
     const response = await api.get(`/statements/${id}`);
     return response.data;
@@ -46,11 +85,19 @@ export const statementsAPI = {
 
 // Transactions API
 export const transactionsAPI = {
-  getByStatement: async (statementId: number): Promise<Transaction[]> => {
-    const response = await api.get(`/transactions/statement/${statementId}`);
+  list: async (query: TransactionQuery = {}): Promise<TransactionPage> => {
+    const response = await api.get('/transactions/', { params: query });
     return response.data;
   },
 
+  // One page of a statement's transactions in date order
+  getByStatement: async (statementId: number, cursor?: string): Promise<Page<Transaction>> => {
+    const response = await api.get(`/transactions/statement/${statementId}`, {
+      params: cursor ? { cursor } : {},
+    });
+    return { items: response.data, nextCursor: response.headers['x-next-cursor'] ?? null };
+  },
+
   getById: async (id: number): Promise<Transaction> => {
     const response = await api.get(`/transactions/${id}`);
     return response.data;
@@ -71,6 +118,12 @@ export const transactionsAPI = {
     return response.data;
   },
 
+  // Edits, recategorizations, approvals and rejections in one request
+  bulk: async (operations: BulkOperation[]): Promise<BulkResponse> => {
+    const response = await api.post('/transactions/bulk', { operations });
+    return response.data;
+  },
+
   bulkApprove: async (transactionIds: number[]) => {
     const response = await api.post('/transactions/bulk-approve', {
       transaction_ids: transactionIds,
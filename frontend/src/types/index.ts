@@ -15,6 +15,67 @@ export interface Transaction {
   original_amount: number | null;
 }
 
+// The columns GET /transactions returns for listings
+export type TransactionListItem = Pick<
+  Transaction,
+  | 'id'
+  | 'statement_id'
+  | 'transaction_date'
+  | 'description'
+  | 'amount'
+  | 'category'
+  | 'confidence_score'
+  | 'status'
+  | 'auto_categorized'
+  | 'original_description'
+>;
+
+export interface TransactionPage {
+  items: TransactionListItem[];
+  next_cursor: string | null;
+}
+
+// A page of a plain-list endpoint whose next-page cursor is in X-Next-Cursor
+export interface Page<T> {
+  items: T[];
+  nextCursor: string | null;
+}
+
+export interface TransactionQuery {
+  statement_id?: number;
+  start_date?: string;
+  end_date?: string;
+  category?: string;
+  status?: string;
+  min_amount?: number;
+  max_amount?: number;
+  bank?: string;
+  search?: string;
+  order?: 'asc' | 'desc';
+  limit?: number;
+  cursor?: string;
+}
+
+export interface BulkOperation {
+  id: number;
+  action: 'update' | 'categorize' | 'approve' | 'reject';
+  description?: string;
+  amount?: number;
+  category?: string;
+}
+
+export interface BulkResult {
+  id: number;
+  success: boolean;
+  error: string | null;
+  transaction: TransactionListItem | null;
+}
+
+export interface BulkResponse {
+  applied: number;
+  results: BulkResult[];
+}
+
 export interface Statement {
   id: number;
   filename: string;
@@ -26,6 +87,42 @@ export interface Statement {
   status: string;
 }
 
+export interface IngestionJob {
+  id: number;
+  filename: string;
+  status: 'queued' | 'running' | 'completed' | 'failed';
+  attempts: number;
+  error: string | null;
+  statement_id: number | null;
+  created_at: string;
+  started_at: string | null;
+  finished_at: string | null;
+  queued_seconds: number | null;
+  processing_seconds: number | null;
+}
+
+export interface UploadResult {
+  success: boolean;
+  message: string;
+  job_id: number | null;
+  job_status: string | null;
+  duplicate: boolean;
+  statement_id: number | null;
+  bank_name: string | null;
+  transaction_count: number | null;
+}
+
+export interface BatchUploadItem extends UploadResult {
+  filename: string;
+}
+
+export interface BatchUploadResponse {
+  queued: number;
+  duplicates: number;
+  failed: number;
+  files: BatchUploadItem[];
+}
+
 export interface Analytics {
   total_transactions: number;
   total_income: number;